@@ -0,0 +1,341 @@
+"""
+Load test for the wishes API.
+
+Starts server.py on an ephemeral port against a temporary wishes.json that is
+pre-seeded with the requested number of wishes, drives a weighted mix of
+requests over many keep-alive connections, and prints a JSON report with
+throughput, latency percentiles and the server's memory use.
+
+    python loadtest.py                                  # 10k wishes, default mix
+    python loadtest.py --sizes 10000,100000,1000000 --duration 10
+    python loadtest.py --mix get=50,page=30,post=20 --connections 128
+    python loadtest.py --compare loadtest-baseline.json # fail on regressions
+    python loadtest.py --sizes 10000,100000,1000000 -d 15 -p 1 -o loadtest-baseline.json
+                                                        # refresh the baseline (its config records the flags)
+    python loadtest.py --env WISHES_WORKERS=64          # server settings via its environment
+
+Request kinds:
+    get       GET /api/wishes (the full list; with --etag, If-None-Match too)
+    page      GET /api/wishes?limit=50
+    since     GET /api/wishes?since=<version 50 back>
+    post      POST /api/wishes
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'server.py')
+STARTUP_TIMEOUT = 120
+PORT_RE = re.compile(r'Server running on port (\d+) with (?:(\d+) processes of )?(\d+) workers')
+DEFAULT_MIX = 'get=60,page=25,since=5,post=10'
+# Every request comes from one address, so the per-client write limit is off
+# unless --env WISHES_RATE_LIMIT=... turns it back on.
+DEFAULT_SERVER_ENV = {'WISHES_RATE_LIMIT': '0'}
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        kind, _, weight = part.partition('=')
+        if kind not in ('get', 'page', 'since', 'post'):
+            raise argparse.ArgumentTypeError(f"unknown request kind: {kind}")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def seed_store(path, count):
+    """Write a wishes.json snapshot with count wishes, newest first."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([f"种子心愿 #{i} — seeded wish for load testing" for i in range(count, 0, -1)],
+                  f, ensure_ascii=False)
+
+
+def process_tree(pid):
+    """pid and its descendants (prefork workers), from /proc; just pid elsewhere."""
+    children = {}
+    for entry in os.listdir('/proc') if os.path.isdir('/proc') else ():
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces; ppid is the second field after it.
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    tree = [pid]
+    for p in tree:
+        tree.extend(children.get(p, ()))
+    return tree
+
+
+def rss_kb(pid, field='VmRSS'):
+    """
+    Resident set size (or another /proc status field) in KiB, summed over the
+    server and its worker processes; None where unavailable.
+    """
+    total = None
+    for p in process_tree(pid):
+        try:
+            with open(f'/proc/{p}/status') as f:
+                for line in f:
+                    if line.startswith(field + ':'):
+                        total = (total or 0) + int(line.split()[1])
+        except OSError:
+            pass
+    return total
+
+
+class ServerProcess:
+    """server.py running in a child process with its data in a temp directory."""
+
+    def __init__(self, workdir, wishes, env=None):
+        self.db_path = os.path.join(workdir, 'wishes.json')
+        self.log_path = os.path.join(workdir, 'server.log')
+        started = time.perf_counter()
+        seed_store(self.db_path, wishes)
+        self.seed_seconds = time.perf_counter() - started
+        child_env = dict(os.environ, PORT='0', WISHES_DB=self.db_path, WISHES_STATIC_ROOT=workdir)
+        child_env.update(env or {})
+        self.log = open(self.log_path, 'w+')
+        started = time.perf_counter()
+        self.proc = subprocess.Popen([sys.executable, SERVER], cwd=workdir, env=child_env,
+                                     stdout=self.log, stderr=subprocess.STDOUT)
+        self.port, self.processes, self.workers = self._wait_for_startup()
+        self.startup_seconds = time.perf_counter() - started
+
+    def _wait_for_startup(self):
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"server exited with {self.proc.returncode}; see {self.log_path}")
+            with open(self.log_path) as f:
+                m = PORT_RE.search(f.read())
+            if m:
+                return int(m.group(1)), int(m.group(2) or 0), int(m.group(3))
+            time.sleep(0.05)
+        raise RuntimeError("server did not start in time")
+
+    def stop(self):
+        self.proc.terminate()
+        try:
+            self.proc.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+        self.log.close()
+
+
+class RssSampler(threading.Thread):
+    """Samples the server's RSS while the load runs, keeping the peak."""
+
+    def __init__(self, pid, interval=0.2):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.peak = max(self.peak, rss_kb(self.pid) or 0)
+
+
+def _connection_loop(port, deadline, mix, seed, etag, results):
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[k] for k in kinds]
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    last_etag = None
+    version = 0
+    while time.monotonic() < deadline:
+        kind = rng.choices(kinds, weights)[0]
+        headers = {}
+        body = None
+        if kind == 'get':
+            method, path = 'GET', '/api/wishes'
+            if etag and last_etag:
+                headers['If-None-Match'] = last_etag
+        elif kind == 'page':
+            method, path = 'GET', '/api/wishes?limit=50'
+        elif kind == 'since':
+            method, path = 'GET', f'/api/wishes?since={max(0, version - 50)}&limit=50'
+        else:
+            method, path = 'POST', '/api/wishes'
+            body = json.dumps({"content": f"load test wish {rng.random()}"}).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            payload = response.read()
+        except (OSError, http.client.HTTPException):
+            results['errors'][kind] = results['errors'].get(kind, 0) + 1
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+            continue
+        elapsed = time.perf_counter() - start
+        if response.status >= 400:
+            results['errors'][kind] = results['errors'].get(kind, 0) + 1
+            continue
+        results['latencies'].setdefault(kind, []).append(elapsed)
+        results['bytes'] += len(payload)
+        if kind == 'get':
+            last_etag = response.getheader('ETag') or last_etag
+        elif kind == 'page' and payload:
+            version = json.loads(payload)['version']
+    conn.close()
+
+
+def _client_process(port, connections, duration, mix, seed, etag):
+    """One load-generating process: connections threads, one keep-alive connection each."""
+    deadline = time.monotonic() + duration
+    results = [{'latencies': {}, 'errors': {}, 'bytes': 0} for _ in range(connections)]
+    threads = [threading.Thread(target=_connection_loop, args=(port, deadline, mix, seed * 1000 + i, etag, r))
+               for i, r in enumerate(results)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    merged = {'latencies': {}, 'errors': {}, 'bytes': 0}
+    for r in results:
+        for kind, samples in r['latencies'].items():
+            merged['latencies'].setdefault(kind, []).extend(samples)
+        for kind, n in r['errors'].items():
+            merged['errors'][kind] = merged['errors'].get(kind, 0) + n
+        merged['bytes'] += r['bytes']
+    return merged
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+
+    def pct(p):
+        return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000, 3)
+
+    return {"p50_ms": pct(50), "p95_ms": pct(95), "p99_ms": pct(99), "max_ms": round(ordered[-1] * 1000, 3)}
+
+
+def run_scenario(wishes, args):
+    with tempfile.TemporaryDirectory(prefix='wishes-loadtest-') as workdir:
+        server = ServerProcess(workdir, wishes, args.env)
+        try:
+            rss_idle = rss_kb(server.proc.pid)
+            sampler = RssSampler(server.proc.pid)
+            sampler.start()
+            per_process = max(1, args.connections // args.processes)
+            started = time.perf_counter()
+            with ProcessPoolExecutor(max_workers=args.processes) as pool:
+                futures = [pool.submit(_client_process, server.port, per_process, args.duration,
+                                       args.mix, args.seed + p, args.etag)
+                           for p in range(args.processes)]
+                parts = [f.result() for f in futures]
+            elapsed = time.perf_counter() - started
+            sampler.stopped.set()
+            sampler.join()
+            peak_rss = max(sampler.peak, rss_kb(server.proc.pid, 'VmHWM') or 0) or None
+        finally:
+            server.stop()
+
+    latencies, errors = {}, {}
+    for part in parts:
+        for kind, samples in part['latencies'].items():
+            latencies.setdefault(kind, []).extend(samples)
+        for kind, n in part['errors'].items():
+            errors[kind] = errors.get(kind, 0) + n
+    total = sum(len(s) for s in latencies.values())
+    requests = {}
+    for kind in args.mix:
+        samples = latencies.get(kind, [])
+        entry = {"count": len(samples), "errors": errors.get(kind, 0),
+                 "rps": round(len(samples) / elapsed, 1)}
+        if samples:
+            entry.update(percentiles(samples))
+        requests[kind] = entry
+    everything = [x for s in latencies.values() for x in s]
+    return {
+        "wishes": wishes,
+        "seed_seconds": round(server.seed_seconds, 3),
+        "startup_seconds": round(server.startup_seconds, 3),
+        "duration_seconds": round(elapsed, 3),
+        "requests_total": total,
+        "errors_total": sum(errors.values()),
+        "rps": round(total / elapsed, 1),
+        "mib_received": round(sum(p['bytes'] for p in parts) / 2 ** 20, 2),
+        "latency": percentiles(everything) if everything else None,
+        "requests": requests,
+        "server_rss_kb": {"idle": rss_idle, "peak": peak_rss},
+        # As the server reported them; p99 is only comparable between equal settings.
+        "server": {"processes": server.processes, "workers": server.workers},
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Per-size throughput and p99 ratios against a baseline; returns (comparison, regressed)."""
+    previous = {s["wishes"]: s for s in baseline.get("scenarios", [])}
+    comparison = []
+    regressed = False
+    for scenario in report["scenarios"]:
+        old = previous.get(scenario["wishes"])
+        if old is None or not old.get("latency") or not scenario.get("latency"):
+            continue
+        rps_ratio = scenario["rps"] / old["rps"] if old["rps"] else None
+        p99_ratio = scenario["latency"]["p99_ms"] / old["latency"]["p99_ms"] if old["latency"]["p99_ms"] else None
+        worse = ((rps_ratio is not None and rps_ratio < 1 - tolerance)
+                 or (p99_ratio is not None and p99_ratio > 1 + tolerance))
+        regressed = regressed or worse
+        comparison.append({"wishes": scenario["wishes"],
+                           "rps_ratio": round(rps_ratio, 3) if rps_ratio else None,
+                           "p99_ratio": round(p99_ratio, 3) if p99_ratio else None,
+                           "regressed": worse})
+    return comparison, regressed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the wishes API against a temporary, pre-seeded store.")
+    parser.add_argument("--sizes", default="10000",
+                        help="comma-separated numbers of pre-seeded wishes, one scenario each")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"weighted request mix (default: {DEFAULT_MIX})")
+    parser.add_argument("-c", "--connections", type=int, default=64, help="concurrent keep-alive connections")
+    parser.add_argument("-p", "--processes", type=int, default=min(4, os.cpu_count() or 1),
+                        help="client processes the connections are spread over")
+    parser.add_argument("-d", "--duration", type=float, default=10, help="seconds of load per scenario")
+    parser.add_argument("--etag", action="store_true", help="send If-None-Match on repeated full-list GETs")
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=VALUE",
+                        help="extra environment for the server (repeatable)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compare", metavar="BASELINE", help="compare with a previous report")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed throughput drop / p99 increase before --compare fails")
+    parser.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    args.env = dict(DEFAULT_SERVER_ENV, **dict(item.split('=', 1) for item in args.env))
+
+    config = {k: getattr(args, k) for k in ("connections", "processes", "duration", "mix", "etag", "env", "seed")}
+    config.update(argv=sys.argv[1:], python=sys.version.split()[0], cpus=os.cpu_count())
+    report = {"config": config, "scenarios": []}
+    for size in (int(s) for s in args.sizes.split(',') if s):
+        print(f"Running {args.duration:g}s against {size} wishes...", file=sys.stderr)
+        report["scenarios"].append(run_scenario(size, args))
+
+    regressed = False
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            report["comparison"], regressed = compare(report, json.load(f), args.tolerance)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    sys.exit(1 if regressed else 0)
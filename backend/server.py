@@ -1,92 +1,2147 @@
+import argparse
+import bisect
+import email.utils
+import gzip
 import http.server
-import socketserver
+import ipaddress
 import json
+import logging
+import logging.handlers
+import math
+import mmap
 import os
+import queue
+import re
+import selectors
+import shutil
+import signal
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from urllib.parse import urlparse, parse_qs
 
-PORT = 3001
-DB_FILE = 'wishes.json'
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip variants are built
+    brotli = None
+
+PORT = int(os.environ.get('PORT', 3001))
+DB_FILE = os.environ.get('WISHES_DB', 'wishes.json')
 # Resolve DB path robustly: if wishes.json is accidentally mounted as a directory,
 # store the actual file inside that directory.
 DB_PATH = DB_FILE
 if os.path.isdir(DB_PATH):
     DB_PATH = os.path.join(DB_PATH, 'wishes.json')
-if not os.path.exists(DB_PATH):
+LOG_PATH = DB_PATH + '.log'
+
+# Group commit: the writer waits up to COMMIT_DELAY seconds for more wishes to
+# share one fsync, or flushes as soon as COMMIT_MAX wishes are queued.
+COMMIT_DELAY = float(os.environ.get('WISHES_COMMIT_DELAY', 0.002))
+COMMIT_MAX = int(os.environ.get('WISHES_COMMIT_MAX', 256))
+# Largest array accepted by POST /api/wishes/batch.
+MAX_BATCH_SIZE = 1000
+# Request bodies larger than these are refused unread, and so are wishes
+# longer than MAX_WISH_LENGTH characters.
+MAX_BODY_SIZE = 16 * 1024
+MAX_BATCH_BODY_SIZE = 1024 * 1024
+MAX_WISH_LENGTH = int(os.environ.get('WISHES_MAX_WISH_LENGTH', 500))
+# Writes are rate limited per client: a bucket of
+# RATE_LIMIT_BURST requests refilled at RATE_LIMIT_PER_SECOND, 0 turns it off.
+# A batch is one request however many wishes it carries (up to MAX_BATCH_SIZE).
+# Beyond RATE_LIMIT_CLIENTS buckets the least recently used one is dropped.
+RATE_LIMIT_PER_SECOND = float(os.environ.get('WISHES_RATE_LIMIT', 0.5))
+RATE_LIMIT_BURST = float(os.environ.get('WISHES_RATE_BURST', 10))
+RATE_LIMIT_CLIENTS = int(os.environ.get('WISHES_RATE_LIMIT_CLIENTS', 50000))
+# The client is the socket's peer, or its X-Real-IP header when the peer is
+# one of these addresses or networks (nginx). Anyone else could otherwise pick
+# a fresh bucket for every request by setting the header themselves.
+TRUSTED_PROXIES = [ipaddress.ip_network(net.strip(), strict=False)
+                   for net in os.environ.get('WISHES_TRUSTED_PROXIES', '127.0.0.1,::1').split(',')
+                   if net.strip()]
+# Writes are shed with 503 once this many wishes are waiting for the writer.
+WRITE_QUEUE_MAX = int(os.environ.get('WISHES_WRITE_QUEUE_MAX', 4096))
+# The log is folded into the wishes.json snapshot once it reaches
+# COMPACT_RATIO times the snapshot's size (and at least COMPACT_MIN_BYTES),
+# so rewriting the snapshot stays proportional to what was logged since the
+# last rewrite however large the store grows.
+COMPACT_RATIO = float(os.environ.get('WISHES_COMPACT_RATIO', 0.5))
+COMPACT_MIN_BYTES = int(os.environ.get('WISHES_COMPACT_MIN_BYTES', 1024 * 1024))
+# Requests served at once. Connections wait in a selector rather than on a
+# worker thread until the client sends something, and are closed after
+# KEEPALIVE_TIMEOUT idle seconds; once it starts, the request line and headers
+# must arrive within REQUEST_TIMEOUT seconds in total.
+WORKERS = int(os.environ.get('WISHES_WORKERS', 16))
+KEEPALIVE_TIMEOUT = float(os.environ.get('WISHES_KEEPALIVE_TIMEOUT', 15))
+REQUEST_TIMEOUT = float(os.environ.get('WISHES_REQUEST_TIMEOUT', 5))
+# Prefork mode: PROCESSES worker processes accept on PORT with SO_REUSEPORT
+# and send writes to the main process, which alone owns the wish files; 0
+# serves everything from one process. Workers poll the shared version every
+# SYNC_INTERVAL seconds, have GRACEFUL_TIMEOUT seconds to finish in-flight
+# requests when stopped or reloaded (SIGHUP), and are restarted when they die,
+# at most once per RESTART_BACKOFF_MAX seconds while they keep crashing.
+# Workers report their metrics to the owner every METRICS_INTERVAL seconds
+# and whenever they are scraped; /api/metrics on any worker shows them all.
+PROCESSES = int(os.environ.get('WISHES_PROCESSES', 0))
+SYNC_INTERVAL = float(os.environ.get('WISHES_SYNC_INTERVAL', 0.05))
+METRICS_INTERVAL = float(os.environ.get('WISHES_METRICS_INTERVAL', 1))
+GRACEFUL_TIMEOUT = float(os.environ.get('WISHES_GRACEFUL_TIMEOUT', 8))
+WORKER_START_TIMEOUT = 120
+RESTART_BACKOFF_MAX = 30
+# The memory-mapped file through which the owner shares its version.
+VERSION_HEADER = struct.Struct('<Q')
+# Live /api/wishes/stream subscribers: at most SSE_MAX_SUBSCRIBERS at once, a
+# comment line every SSE_HEARTBEAT seconds to keep proxies from timing out, and
+# subscribers that cannot take a write within SSE_SEND_TIMEOUT are dropped.
+SSE_MAX_SUBSCRIBERS = int(os.environ.get('WISHES_SSE_MAX_SUBSCRIBERS', 2000))
+SSE_HEARTBEAT = float(os.environ.get('WISHES_SSE_HEARTBEAT', 15))
+SSE_SEND_TIMEOUT = 2.0
+# Page sizes for ?limit= / ?cursor= / ?since= queries.
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# GET /api/wishes/search: at most SEARCH_MAX_MATCHES of the newest matching
+# wishes are ranked per query, and the last SEARCH_CACHE_SIZE rankings are
+# kept so paging through them does not search again.
+SEARCH_MAX_QUERY = 200
+SEARCH_MAX_MATCHES = 5000
+SEARCH_CACHE_SIZE = 128
+# Han, kana and hangul are indexed as overlapping character bigrams; runs of
+# other letters and digits as whole words.
+CJK_CHARS = '\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff'
+TOKEN_RE = re.compile(f'([{CJK_CHARS}]+)|[^\\W_{CJK_CHARS}]+')
+CJK_RE = re.compile(f'[{CJK_CHARS}]')
+# Non-API GETs serve files from here (the built site, e.g. dist/).
+STATIC_ROOT = os.environ.get('WISHES_STATIC_ROOT', os.getcwd())
+# Text assets at least this large get .gz/.br siblings from --precompress.
+PRECOMPRESS_EXTENSIONS = ('.html', '.js', '.mjs', '.css', '.json', '.svg', '.txt', '.xml', '.map')
+PRECOMPRESS_MIN_SIZE = 1024
+# Content-hashed names never change content, so they are cached for a year:
+# Vite's assets/name-<hash>.ext and the hex names organize_images.py assigns.
+HASHED_ASSET_RE = re.compile(r'(^/assets/.+-[A-Za-z0-9_-]{8}\.\w+$)|(/[0-9a-f]{16,}\.\w+$)')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Log records wait here for the logging thread; when it falls this far behind
+# records are dropped (and counted) instead of blocking requests.
+LOG_QUEUE_SIZE = 10000
+# Upper bounds (seconds) of the latency histogram buckets on /api/metrics.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+API_ROUTES = ('/api/wishes', '/api/wishes/batch', '/api/wishes/search', '/api/wishes/stream', '/api/metrics')
+PAGE_PARAMS = {'limit', 'cursor', 'since'}
+
+logger = logging.getLogger('wishes')
+access_logger = logging.getLogger('wishes.access')
+
+# name -> (type, help) for everything exposed on /api/metrics.
+METRICS = {
+    'wishes_http_requests_total': ('counter', 'Requests served, by route and status code.'),
+    'wishes_http_request_duration_seconds': ('histogram', 'Time from parsing the request line to the response being written.'),
+    'wishes_http_requests_in_flight': ('gauge', 'Requests currently being handled.'),
+    'wishes_http_errors_total': ('counter', 'Requests that failed with an exception.'),
+    'wishes_store_read_seconds': ('histogram', 'Time spent reading from the wish store.'),
+    'wishes_store_write_seconds': ('histogram', 'Time spent writing the wish log (one fsync per commit) and compacting.'),
+    'wishes_store_committed_total': ('counter', 'Wishes made durable.'),
+    'wishes_store_write_errors_total': ('counter', 'Failed wish log writes and compactions.'),
+    'wishes_list_cache_total': ('counter', 'Encoded GET /api/wishes body cache lookups, by result.'),
+    'wishes_not_modified_total': ('counter', 'GET /api/wishes answered with 304 Not Modified.'),
+    'wishes_store_version': ('gauge', 'Number of wishes in the store.'),
+    'wishes_write_queue_depth': ('gauge', 'Wishes waiting for the writer thread.'),
+    'wishes_rejected_total': ('counter', 'Writes refused by validation, rate limits or load shedding, by status code.'),
+    'wishes_rate_limit_clients': ('gauge', 'Clients with a rate limit bucket.'),
+    'wishes_search_terms': ('gauge', 'Distinct tokens in the search index.'),
+    'wishes_search_cache_total': ('counter', 'Search ranking cache lookups, by result.'),
+    'wishes_sse_subscribers': ('gauge', 'Open /api/wishes/stream connections.'),
+    'wishes_log_queue_depth': ('gauge', 'Log records waiting for the logging thread.'),
+    'wishes_log_records_dropped_total': ('counter', 'Log records dropped because the log queue was full.'),
+}
+
+
+def _label_text(labels):
+    return '{' + ','.join(f'{k}="{v}"' for k, v in labels) + '}' if labels else ''
+
+
+def _sample_text(value):
+    # Counts stay exact past 1e6, where '{:g}' would print 1.23457e+06.
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class Metrics:
+    """
+    Thread-safe counters, gauges and histograms, rendered in the Prometheus
+    text format. Labels are passed as keyword arguments.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.values = defaultdict(float)  # (name, labels) -> counter or gauge value
+        self.histograms = {}  # (name, labels) -> [count per bucket..., sum, count]
+        self.callbacks = {}  # gauge name -> function returning its current value
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.values[key] += amount
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    hist[i] += 1
+                    break
+            hist[-2] += seconds
+            hist[-1] += 1
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def gauge(self, name, callback):
+        """Report callback() as the value of gauge name at scrape time."""
+        self.callbacks[name] = callback
+
+    def snapshot(self):
+        """Current (values, histograms), gauges included, keyed by (name, labels)."""
+        with self.lock:
+            values = dict(self.values)
+            histograms = {key: list(hist) for key, hist in self.histograms.items()}
+        for name, callback in self.callbacks.items():
+            values[(name, ())] = callback()
+        return values, histograms
+
+    def render(self, samples=None):
+        """The Prometheus text for samples, a snapshot() result; our own by default."""
+        values, histograms = self.snapshot() if samples is None else samples
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            samples = sorted(key for key in (histograms if kind == 'histogram' else values) if key[0] == name)
+            if not samples:
+                continue
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for key in samples:
+                labels = key[1]
+                if kind != 'histogram':
+                    lines.append(f'{name}{_label_text(labels)} {_sample_text(values[key])}')
+                    continue
+                hist = histograms[key]
+                cumulative = 0
+                for bound, count in zip(self.buckets, hist):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{_label_text(labels + (("le", f"{bound:g}"),))} {cumulative}')
+                # Observations above the last bound only show up in the +Inf bucket.
+                lines.append(f'{name}_bucket{_label_text(labels + (("le", "+Inf"),))} {hist[-1]}')
+                lines.append(f'{name}_sum{_label_text(labels)} {hist[-2]:.6f}')
+                lines.append(f'{name}_count{_label_text(labels)} {hist[-1]}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
+# What /api/metrics serves; prefork workers swap in the owner's combined view.
+render_metrics = metrics.render
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; fixed fields and extra={"fields": {...}} are merged in."""
+
+    def __init__(self, fields=None):
+        super().__init__()
+        self.fields = fields or {}
+
+    def format(self, record):
+        entry = {
+            "ts": time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f'.{int(record.msecs):03d}Z',
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        entry.update(self.fields)
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class BufferedLogHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the logging thread untouched, so formatting and the
+    write to stderr happen off the request thread. Never blocks: when the
+    queue is full the record is dropped and counted.
+    """
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.inc('wishes_log_records_dropped_total')
+
+
+def setup_logging(stream=sys.stderr, fields=None):
+    """Route the wishes loggers through a bounded queue; returns the started listener."""
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    output = logging.StreamHandler(stream)
+    output.setFormatter(JsonFormatter(fields))
+    listener = logging.handlers.QueueListener(log_queue, output)
+    root = logging.getLogger('wishes')
+    root.addHandler(BufferedLogHandler(log_queue))
+    root.setLevel(logging.INFO)
+    root.propagate = False
+    metrics.gauge('wishes_log_queue_depth', log_queue.qsize)
+    listener.start()
+    return listener
+
+
+class StoreBusy(Exception):
+    """The write queue is full; the caller should retry later."""
+
+
+class WishReader:
+    """
+    The read side of the wishes: an in-memory list, oldest first, where a
+    wish's version is its 1-based position. Shared by WishStore, which owns
+    the files, and WishReplica, a prefork worker's copy of the owner's list.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        # Oldest first, so appending is O(1); readers reverse on the way out.
+        # Only one thread (the writer, or the replica's sync) mutates it.
+        self.wishes = []
+        # Encoded GET /api/wishes body, rebuilt lazily once the version moves.
+        self._encoded = b'[]'
+        self._encoded_version = 0
+        # Called as listener(version, content) under the store lock for each
+        # new wish, so listeners see durable wishes in version order.
+        self.listeners = []
+
+    @property
+    def version(self):
+        return len(self.wishes)
+
+    def refresh(self):
+        """Catch up with newer wishes written elsewhere; the owner of the files is always current."""
+
+    def snapshot(self):
+        """All wishes, newest first."""
+        with self.lock:
+            return self.wishes[::-1]
+
+    def encoded(self):
+        """Return (version, JSON bytes of snapshot()), cached between writes."""
+        with self.lock:
+            if self._encoded_version != self.version:
+                metrics.inc('wishes_list_cache_total', result='miss')
+                with metrics.timer('wishes_store_read_seconds', op='encode'):
+                    self._encoded = json.dumps(self.wishes[::-1]).encode('utf-8')
+                self._encoded_version = self.version
+            else:
+                metrics.inc('wishes_list_cache_total', result='hit')
+            return self._encoded_version, self._encoded
+
+    def page(self, limit, cursor=None):
+        """
+        Newest-first page of wishes with id < cursor (or the newest ones).
+
+        Returns (items, next_cursor, version); next_cursor is None on the last page.
+        """
+        with self.lock, metrics.timer('wishes_store_read_seconds', op='page'):
+            end = self.version if cursor is None else max(0, min(cursor - 1, self.version))
+            start = max(0, end - limit)
+            items = [{"id": i + 1, "content": self.wishes[i]} for i in range(end - 1, start - 1, -1)]
+            return items, (start + 1 if start > 0 else None), self.version
+
+    def since(self, version, limit):
+        """
+        Wishes with id > version, newest first, at most limit of them.
+
+        When more than limit wishes are missing, the oldest ones are returned
+        first so the caller can keep polling from the returned version.
+        Returns (items, version_reached, has_more).
+        """
+        with self.lock, metrics.timer('wishes_store_read_seconds', op='since'):
+            start = min(version, self.version)
+            end = min(self.version, start + limit)
+            items = [{"id": i + 1, "content": self.wishes[i]} for i in range(end - 1, start - 1, -1)]
+            return items, end, end < self.version
+
+
+class WishStore(WishReader):
+    """
+    Wish storage: a JSON snapshot plus an append-only log of newer wishes.
+
+    The snapshot keeps the historical wishes.json format (a JSON array, newest
+    first) so existing data and backups stay readable. Every wish gets a
+    version equal to its 1-based position in insertion order, so the snapshot
+    covers versions 1..len(snapshot) and the log only needs replaying past that.
+
+    Writes are group-committed: append() queues its wishes and blocks while a
+    single writer thread drains the queue, writes everything queued with one
+    fsync and only then publishes the batch to readers and listeners.
+    """
+
+    def __init__(self, snapshot_path, log_path, commit_delay=COMMIT_DELAY,
+                 commit_max=COMMIT_MAX, compact_ratio=COMPACT_RATIO, compact_min_bytes=COMPACT_MIN_BYTES,
+                 max_queued=WRITE_QUEUE_MAX):
+        super().__init__()
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.commit_delay = commit_delay
+        self.commit_max = commit_max
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+        self.max_queued = max_queued
+        self.snapshot_bytes = 0
+        self.log_bytes = 0
+        self._closed = False
+        # Pending commits waiting for the writer, and how many wishes they hold.
+        self.pending = []
+        self.queued = 0
+        self.pending_cond = threading.Condition()
+
+        self._recover()
+        # Unbuffered: a failed commit must leave nothing behind to be flushed
+        # into the log after it has been truncated back.
+        self._log = open(self.log_path, 'ab', buffering=0)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def _recover(self):
+        """Load the snapshot, then replay log records it does not cover yet."""
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if not isinstance(data, list):
+                    raise ValueError("snapshot is not a JSON array")
+                self.wishes = list(reversed(data))
+                self.snapshot_bytes = os.path.getsize(self.snapshot_path)
+            except Exception as e:
+                # Keep the unreadable file around instead of compacting over it.
+                backup = f"{self.snapshot_path}.corrupt-{int(time.time())}"
+                logger.error("Could not read %s (%s), copied to %s", self.snapshot_path, e, backup)
+                shutil.copyfile(self.snapshot_path, backup)
+                self.wishes = []
+
+        if not os.path.exists(self.log_path):
+            return
+
+        good_offset = 0
+        replayed = 0
+        with open(self.log_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # torn write from a crash mid-append
+                try:
+                    record = json.loads(line)
+                    v, content = record['v'], record['content']
+                except Exception:
+                    break
+                if v > self.version + 1:
+                    raise RuntimeError(
+                        f"{self.log_path} continues at version {v} but only "
+                        f"{self.version} wishes were loaded; refusing to start")
+                if v == self.version + 1:
+                    self.wishes.append(content)
+                    replayed += 1
+                good_offset += len(line)
+        if good_offset < os.path.getsize(self.log_path):
+            logger.warning("Truncating damaged tail of %s at byte %d", self.log_path, good_offset)
+            with open(self.log_path, 'r+b') as f:
+                f.truncate(good_offset)
+        self.log_bytes = good_offset
+        if replayed:
+            logger.info("Recovered %d wishes from %s", replayed, self.log_path)
+
+    def append(self, content):
+        """Append one wish and return its version once it is durable."""
+        return self.append_many([content])[0]
+
+    def append_many(self, contents):
+        """
+        Append wishes atomically, in order; returns their versions once durable.
+
+        Raises StoreBusy instead of queueing when more than max_queued wishes
+        would be waiting for the writer.
+        """
+        commit = {"contents": contents, "done": threading.Event(), "versions": None, "error": None}
+        with self.pending_cond:
+            if self._closed:
+                raise RuntimeError("wish store is closed")
+            if self.queued and self.queued + len(contents) > self.max_queued:
+                raise StoreBusy()
+            self.pending.append(commit)
+            self.queued += len(contents)
+            self.pending_cond.notify()
+        commit["done"].wait()
+        if commit["error"] is not None:
+            raise commit["error"]
+        return commit["versions"]
+
+    def _write_loop(self):
+        while True:
+            with self.pending_cond:
+                while not self.pending and not self._closed:
+                    self.pending_cond.wait()
+                if not self.pending:
+                    return
+                # Give concurrent requests a moment to join this batch.
+                deadline = time.monotonic() + self.commit_delay
+                while self.queued < self.commit_max and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.pending_cond.wait(remaining)
+                batch, self.pending = self.pending, []
+                self.queued = 0
+            self._commit(batch)
+            if self.log_bytes >= max(self.compact_min_bytes, self.snapshot_bytes * self.compact_ratio):
+                try:
+                    with metrics.timer('wishes_store_write_seconds', op='compact'):
+                        self.compact()
+                except Exception:
+                    metrics.inc('wishes_store_write_errors_total')
+                    logger.exception("Wish store compaction failed")
+
+    def _commit(self, batch):
+        """Write a batch of pending commits with a single fsync (writer thread only)."""
+        version = self.version
+        lines = []
+        for commit in batch:
+            commit["versions"] = []
+            for content in commit["contents"]:
+                version += 1
+                commit["versions"].append(version)
+                lines.append(json.dumps({"v": version, "content": content}, ensure_ascii=False))
+        data = ('\n'.join(lines) + '\n').encode('utf-8')
+        offset = self._log.seek(0, os.SEEK_END)
+        try:
+            with metrics.timer('wishes_store_write_seconds', op='commit'):
+                view = memoryview(data)
+                while view:
+                    view = view[self._log.write(view):]
+                os.fsync(self._log.fileno())
+        except Exception as e:
+            metrics.inc('wishes_store_write_errors_total')
+            logger.exception("Wish log write failed")
+            try:
+                self._log.truncate(offset)
+            except OSError:
+                pass
+            for commit in batch:
+                commit["error"] = e
+                commit["done"].set()
+            return
+        with self.lock:
+            for commit in batch:
+                for v, content in zip(commit["versions"], commit["contents"]):
+                    self.wishes.append(content)
+                    for listener in self.listeners:
+                        listener(v, content)
+            self.log_bytes += len(data)
+        metrics.inc('wishes_store_committed_total', len(lines))
+        for commit in batch:
+            commit["done"].set()
+
+    def compact(self):
+        """Write all wishes into the snapshot and start an empty log (writer thread only)."""
+        # Only the writer extends self.wishes, so this copy is consistent.
+        self._write_snapshot(self.wishes[::-1])
+        self.snapshot_bytes = os.path.getsize(self.snapshot_path)
+        self._log.close()
+        self._log = open(self.log_path, 'wb', buffering=0)
+        os.fsync(self._log.fileno())
+        self.log_bytes = 0
+
+    def _write_snapshot(self, wishes):
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(wishes, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError:
+            # wishes.json bind-mounted as a single file cannot be replaced;
+            # rewrite it in place. Versions make a crash here safe: the log
+            # is only truncated after this returns.
+            with open(self.snapshot_path, 'w', encoding='utf-8') as f:
+                json.dump(wishes, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.remove(tmp_path)
+
+    def close(self):
+        """Drain pending writes, compact and stop the writer."""
+        with self.pending_cond:
+            if self._closed:
+                return
+            self._closed = True
+            self.pending_cond.notify()
+        self._writer.join()
+        self.compact()
+        self._log.close()
+
+
+def sse_event(version, content):
+    data = json.dumps({"id": version, "content": content})
+    return f"id: {version}\nevent: wish\ndata: {data}\n\n".encode('utf-8')
+
+
+class Broadcaster:
+    """
+    Fan-out of accepted wishes to /api/wishes/stream subscribers.
+
+    A subscribed socket is detached from the worker pool: the handler writes
+    the response headers and hands it over, so an open stream costs a socket
+    rather than a worker thread. A single thread encodes each event once and
+    writes it to every subscriber. Attach requests travel through the same
+    queue as events, so a subscriber's catch-up is always written before any
+    newer wish.
+    """
+
+    def __init__(self, max_subscribers=SSE_MAX_SUBSCRIBERS, heartbeat=SSE_HEARTBEAT):
+        self.max_subscribers = max_subscribers
+        self.heartbeat = heartbeat
+        self.subscribers = set()
+        self.reserved = 0
+        self.lock = threading.Lock()
+        self.events = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def reserve(self):
+        """Claim a subscriber slot; False when the cap is reached."""
+        with self.lock:
+            if self.reserved >= self.max_subscribers:
+                return False
+            self.reserved += 1
+            return True
+
+    def release(self):
+        with self.lock:
+            self.reserved -= 1
+
+    def attach(self, sock, preamble):
+        """Start streaming to sock once preamble (catch-up events) is written."""
+        self.events.put((sock, preamble))
+
+    def publish(self, version, content):
+        self.events.put((None, sse_event(version, content)))
+
+    def _run(self):
+        while True:
+            try:
+                sock, data = self.events.get(timeout=self.heartbeat)
+            except queue.Empty:
+                sock, data = None, b': ping\n\n'
+            if sock is not None:
+                sock.settimeout(SSE_SEND_TIMEOUT)
+                if self._send(sock, data):
+                    self.subscribers.add(sock)
+                continue
+            for sub in list(self.subscribers):
+                if not self._send(sub, data):
+                    self.subscribers.discard(sub)
+
+    def _send(self, sock, data):
+        try:
+            if data:
+                sock.sendall(data)
+            return True
+        except OSError:
+            # Gone or too slow; a partial write would corrupt the stream anyway.
+            try:
+                sock.close()
+            except OSError:
+                pass
+            self.release()
+            return False
+
+
+def tokenize(text):
+    """Search tokens of text: CJK bigrams (a lone CJK character stays a unigram) and lowercased words."""
+    tokens = []
+    for m in TOKEN_RE.finditer(text.casefold()):
+        run = m.group()
+        if m.group(1) and len(run) > 1:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+class SearchIndex:
+    """
+    Inverted index over the store's wishes for GET /api/wishes/search.
+
+    Each token maps to the ascending versions of the wishes containing it, in
+    a compact array('I'); new wishes arrive as store listener calls in version
+    order, so keeping a posting list sorted is an append. The existing wishes
+    are indexed by a background thread at startup; wishes committed meanwhile
+    are queued and applied once it finishes, and searches get a 503 until then.
+
+    A query matches wishes containing all of its tokens. A single CJK character
+    matches the bigrams it occurs in. Matches are ranked BM25-style (every
+    token counted once per wish) with a bonus when the query appears verbatim.
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self, store, max_matches=SEARCH_MAX_MATCHES, cache_size=SEARCH_CACHE_SIZE):
+        self.store = store
+        self.max_matches = max_matches
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+        self.postings = {}
+        # CJK character -> bigrams containing it, for single-character queries.
+        self.bigrams_of = defaultdict(set)
+        self.lengths = array('H')  # distinct tokens per wish, by version - 1
+        self.total_length = 0
+        self.ready = threading.Event()
+        self._backlog = []
+        self._cache = OrderedDict()  # query -> (version, [(score, id)...], truncated)
+        with store.lock:
+            wishes = store.wishes[:]
+            store.listeners.append(self.add)
+        self._thread = threading.Thread(target=self._build, args=(wishes,), daemon=True)
+        self._thread.start()
+
+    @property
+    def version(self):
+        return len(self.lengths)
+
+    def _build(self, wishes):
+        started = time.perf_counter()
+        for version, content in enumerate(wishes, 1):
+            self._add(version, content)
+        with self.lock:
+            for version, content in self._backlog:
+                self._add(version, content)
+            self._backlog = None
+            self.ready.set()
+        logger.info("Indexed %d wishes for search in %.2fs", self.version, time.perf_counter() - started)
+
+    def add(self, version, content):
+        """Store listener: index a newly committed wish."""
+        with self.lock:
+            if self._backlog is not None:
+                self._backlog.append((version, content))
+            else:
+                self._add(version, content)
+
+    def _add(self, version, content):
+        tokens = set(tokenize(content))
+        for token in tokens:
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = array('I')
+                if len(token) == 2 and CJK_RE.match(token):
+                    self.bigrams_of[token[0]].add(token)
+                    self.bigrams_of[token[1]].add(token)
+            posting.append(version)
+        self.lengths.append(min(len(tokens), 0xFFFF))
+        self.total_length += len(tokens)
+
+    def _posting(self, token):
+        """(sorted versions matching one query token, whether older ones were left out)."""
+        if len(token) == 1 and token in self.bigrams_of:
+            # Only the newest max_matches of each list can make it into the result.
+            lists = [self.postings.get(token, ())] + [self.postings[b] for b in self.bigrams_of[token]]
+            merged = set()
+            for posting in lists:
+                merged.update(posting[-self.max_matches:])
+            return sorted(merged), any(len(p) > self.max_matches for p in lists)
+        return self.postings.get(token, ()), False
+
+    def _rank(self, query, tokens):
+        postings, partial = zip(*(self._posting(t) for t in set(tokens)))
+        postings = sorted(postings, key=len)
+        rest = postings[1:]
+        if not rest:
+            matches = postings[0][:-self.max_matches - 1:-1]
+            truncated = len(postings[0]) > self.max_matches
+        else:
+            matches = []
+            truncated = False
+            for version in reversed(postings[0]):
+                if all(_contains(p, version) for p in rest):
+                    if len(matches) == self.max_matches:
+                        truncated = True
+                        break
+                    matches.append(version)
+        truncated = truncated or any(partial)
+        count = self.version
+        idf = sum(math.log(1 + (count - len(p) + 0.5) / (len(p) + 0.5)) for p in postings)
+        average = self.total_length / count if count else 1
+        phrase = ' '.join(query.casefold().split())
+        ranked = []
+        for version in matches:
+            norm = 1 - self.b + self.b * self.lengths[version - 1] / average
+            score = idf * (self.k1 + 1) / (1 + self.k1 * norm)
+            if phrase in ' '.join(self.store.wishes[version - 1].casefold().split()):
+                score *= 2
+            ranked.append((round(score, 4), version))
+        # Best first; newer wishes win ties.
+        ranked.sort(reverse=True)
+        return ranked, truncated
+
+    def search(self, query, limit, offset=0):
+        """
+        Ranked matches for query, skipping the first offset.
+
+        Returns (items, total, truncated, version): total counts the ranked
+        matches, truncated says whether older matches were left out.
+        """
+        tokens = tokenize(query)
+        key = ' '.join(query.casefold().split())
+        with self.lock, metrics.timer('wishes_store_read_seconds', op='search'):
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == self.version:
+                metrics.inc('wishes_search_cache_total', result='hit')
+                self._cache.move_to_end(key)
+                version, ranked, truncated = cached
+            else:
+                metrics.inc('wishes_search_cache_total', result='miss')
+                version = self.version
+                ranked, truncated = self._rank(query, tokens) if tokens else ([], False)
+                self._cache[key] = (version, ranked, truncated)
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        items = [{"id": v, "content": self.store.wishes[v - 1], "score": score}
+                 for score, v in ranked[offset:offset + limit]]
+        return items, len(ranked), truncated, version
+
+
+def _contains(posting, version):
+    i = bisect.bisect_left(posting, version)
+    return i < len(posting) and posting[i] == version
+
+
+def is_trusted_proxy(address):
     try:
-        with open(DB_PATH, 'w', encoding='utf-8') as f:
-            json.dump([], f, ensure_ascii=False)
-    except Exception as _:
-        pass
+        address = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(address in net for net in TRUSTED_PROXIES)
+
+
+class RateLimiter:
+    """
+    Token buckets per client key, refilled continuously at rate per second up
+    to burst. Buckets live in an LRU-ordered dict capped at max_clients: a
+    client that has been quiet long enough to be evicted would have a full
+    bucket anyway, so eviction only ever errs on the lenient side.
+    """
+
+    def __init__(self, rate=RATE_LIMIT_PER_SECOND, burst=RATE_LIMIT_BURST, max_clients=RATE_LIMIT_CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self.buckets = OrderedDict()  # key -> (tokens, monotonic time of last update)
+        self.lock = threading.Lock()
+
+    def acquire(self, key, cost=1):
+        """Take cost tokens; returns 0 when allowed, otherwise the seconds until they would be."""
+        if self.rate <= 0:
+            return 0
+        now = time.monotonic()
+        with self.lock:
+            bucket = self.buckets.pop(key, None)
+            tokens = self.burst if bucket is None else min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            wait = 0
+            if tokens >= cost:
+                tokens -= cost
+            else:
+                wait = (cost - tokens) / self.rate
+            self.buckets[key] = (tokens, now)
+            if len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        return wait
+
+
+def precompress(root, min_size=PRECOMPRESS_MIN_SIZE):
+    """
+    Build step: write .gz (and .br if the brotli module is installed) next to
+    every text asset under root, for the server to send as-is.
+
+    Variants newer than their source are left alone, and ones that would not
+    be smaller are removed, so re-running after a build is cheap.
+    """
+    encoders = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append(('.br', lambda data: brotli.compress(data, quality=11)))
+    written = 0
+    for directory, _, files in os.walk(root):
+        for name in files:
+            path = os.path.join(directory, name)
+            if not name.endswith(PRECOMPRESS_EXTENSIONS) or os.path.getsize(path) < min_size:
+                continue
+            mtime = os.path.getmtime(path)
+            data = None
+            for suffix, encode in encoders:
+                target = path + suffix
+                if os.path.exists(target) and os.path.getmtime(target) >= mtime:
+                    continue
+                if data is None:
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                encoded = encode(data)
+                if len(encoded) >= len(data):
+                    if os.path.exists(target):
+                        os.remove(target)
+                    continue
+                with open(target + '.tmp', 'wb') as f:
+                    f.write(encoded)
+                os.replace(target + '.tmp', target)
+                written += 1
+    print(f"Precompressed {written} variants under {root}")
+    return written
+
+
+def accepted_encodings(header):
+    """Content codings the client accepts (q > 0), from an Accept-Encoding header."""
+    accepted = set()
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0
+        if coding and q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive for a single "bytes=" range, None to ignore the
+    header, or raise ValueError when it cannot be satisfied.
+    """
+    if not header or not header.startswith('bytes=') or ',' in header:
+        return None  # multiple ranges: just send the whole file
+    first, _, last = header[6:].strip().partition('-')
+    try:
+        if not first:
+            length = int(last)
+            if length <= 0:
+                raise ValueError("empty suffix range")
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        raise ValueError("range not satisfiable")
+    return start, min(end, size - 1)
+
+
+def route_label(method, url):
+    """Low-cardinality route name for metrics, e.g. "GET /api/wishes?page"."""
+    parsed = urlparse(url)
+    path = parsed.path
+    if path == '/api/wishes' and method == 'GET' and parse_qs(parsed.query).keys() & PAGE_PARAMS:
+        path = '/api/wishes?page'
+    elif path.startswith('/api/'):
+        path = path if path in API_ROUTES else '/api/other'
+    else:
+        path = 'static'
+    return f'{method} {path}'
+
+
+def instrumented(handler):
+    """Time a do_* method, track it as in flight and write its access log record."""
+    def wrapper(self):
+        route = route_label(self.command, self.path)
+        self.status = None
+        metrics.inc('wishes_http_requests_in_flight', route=route)
+        start = time.perf_counter()
+        try:
+            return handler(self)
+        except Exception:
+            metrics.inc('wishes_http_errors_total', route=route)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.inc('wishes_http_requests_in_flight', -1, route=route)
+            metrics.observe('wishes_http_request_duration_seconds', elapsed, route=route)
+            metrics.inc('wishes_http_requests_total', route=route, status=self.status or 0)
+            access_logger.info("request", extra={"fields": {
+                "method": self.command,
+                "path": self.path,
+                "status": self.status,
+                "ms": round(elapsed * 1000, 3),
+                "client": self.client_ip(),
+            }})
+    wrapper.__name__ = handler.__name__
+    return wrapper
+
+
+store = None
+broadcaster = None
+search_index = None
+rate_limiter = RateLimiter()
+
+
+def etag_matches(header, etag):
+    """Check an If-None-Match header, ignoring the weak prefix nginx adds when gzipping."""
+    if not header:
+        return False
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+def query_int(query, name, default=None, minimum=0):
+    """Read a single non-negative integer query parameter, raising ValueError if malformed."""
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[0])
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+    if value < minimum:
+        raise ValueError(f"{name} must be >= {minimum}")
+    return value
+
+
+class RequestRejected(Exception):
+    """Raised while handling a request to answer it with an error status."""
+
+    def __init__(self, status, error, retry_after=None):
+        super().__init__(error)
+        self.status = status
+        self.error = error
+        self.retry_after = retry_after
+
+
+class PooledHTTPServer(http.server.HTTPServer):
+    """
+    HTTPServer that serves connections on a fixed-size thread pool.
+
+    A pool thread only holds a connection while a request is being read and
+    answered. New connections, and keep-alive ones between requests (with
+    their handler parked), wait in a selector thread that hands them to the
+    pool once the client sends something, so idle or silent clients cannot
+    starve active ones.
+    """
+
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, workers=WORKERS, reuse_port=False):
+        # Prefork workers share the port; the kernel spreads connections over them.
+        self.reuse_port = reuse_port
+        super().__init__(server_address, handler_class)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='wish-worker')
+        # Sockets whose ownership moved elsewhere (SSE streams); not closed here.
+        self.detached = set()
+        self.detached_lock = threading.Lock()
+        # Open connections, and whether to close them after their next response.
+        self.active = 0
+        self.active_cond = threading.Condition()
+        self.draining = False
+        # (request, client address, parked handler or None for a new connection),
+        # handed to watch_idle() through a wakeup socket.
+        self.idle = selectors.DefaultSelector()
+        self.idle_lock = threading.Lock()
+        self.parking = []
+        self.idle_closed = False
+        self.idle_wakeup, self.idle_notify = socket.socketpair()
+        self.idle_notify.setblocking(False)
+        self.idle.register(self.idle_wakeup, selectors.EVENT_READ)
+        threading.Thread(target=self.watch_idle, name='wish-idle', daemon=True).start()
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def stop_accepting(self):
+        """Close the listening socket, serving the connections already queued on it first."""
+        self.socket.setblocking(False)
+        while True:
+            try:
+                request, client_address = self.socket.accept()
+            except OSError:
+                break
+            self.process_request(request, client_address)
+        self.socket.close()
+
+    def drain(self, timeout):
+        """
+        Close connections after their next response and idle ones right away;
+        wait up to timeout for the requests still running.
+        """
+        with self.active_cond:
+            self.draining = True
+        self.wake_idle()
+        with self.active_cond:
+            return self.active_cond.wait_for(lambda: self.active == 0, timeout)
+
+    def detach(self, request):
+        with self.detached_lock:
+            self.detached.add(request)
+
+    def shutdown_request(self, request):
+        with self.detached_lock:
+            if request in self.detached:
+                self.detached.discard(request)
+                return
+        super().shutdown_request(request)
+
+    def process_request(self, request, client_address):
+        with self.active_cond:
+            self.active += 1
+        self.wait_readable(request, client_address)
+
+    def process_request_thread(self, request, client_address, handler=None):
+        try:
+            if handler is None:
+                handler = self.RequestHandlerClass(request, client_address, self)
+            else:
+                handler.resume()
+            if handler.parked:
+                if not self.draining:
+                    self.wait_readable(request, client_address, handler)
+                    return
+                handler.close_idle()
+        except Exception:
+            self.handle_error(request, client_address)
+        self.release(request)
+
+    def release(self, request):
+        self.shutdown_request(request)
+        with self.active_cond:
+            self.active -= 1
+            self.active_cond.notify_all()
+
+    def wait_readable(self, request, client_address, handler=None):
+        """Wait for the connection's next request without holding a pool thread."""
+        with self.idle_lock:
+            self.parking.append((request, client_address, handler))
+        self.wake_idle()
+
+    def wake_idle(self):
+        try:
+            self.idle_notify.send(b'\0')
+        except BlockingIOError:
+            pass  # a wakeup is already pending
+
+    def watch_idle(self):
+        # request -> (client address, handler, deadline) in parking order, which is also deadline order.
+        waiting = OrderedDict()
+        while not self.idle_closed:
+            timeout = None
+            if waiting:
+                timeout = max(0, next(iter(waiting.values()))[2] - time.monotonic())
+            for key, _ in self.idle.select(timeout):
+                if key.fileobj is self.idle_wakeup:
+                    self.idle_wakeup.recv(4096)
+                    with self.idle_lock:
+                        parked, self.parking = self.parking, []
+                    for request, client_address, handler in parked:
+                        try:
+                            self.idle.register(request, selectors.EVENT_READ)
+                        except (ValueError, OSError):
+                            self.close_waiting(request, handler)
+                            continue
+                        waiting[request] = (client_address, handler, time.monotonic() + KEEPALIVE_TIMEOUT)
+                else:
+                    self.idle.unregister(key.fileobj)
+                    client_address, handler, _ = waiting.pop(key.fileobj)
+                    self.pool.submit(self.process_request_thread, key.fileobj, client_address, handler)
+            now = time.monotonic()
+            while waiting and next(iter(waiting.values()))[2] <= now:
+                request, (_, handler, _) = waiting.popitem(last=False)
+                self.idle.unregister(request)
+                self.close_waiting(request, handler)
+            if self.draining:
+                # Keep-alive connections between requests would only hold drain()
+                # up; new ones accepted before the listener closed are still served.
+                for request in [r for r, (_, handler, _) in waiting.items() if handler is not None]:
+                    _, handler, _ = waiting.pop(request)
+                    self.idle.unregister(request)
+                    self.close_waiting(request, handler)
+
+    def close_waiting(self, request, handler):
+        if handler is not None:
+            handler.close_idle()
+        self.release(request)
+
+    def handle_error(self, request, client_address):
+        logger.exception("Unhandled error serving %s", client_address[0])
+
+    def server_close(self):
+        super().server_close()
+        self.idle_closed = True
+        self.wake_idle()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class HeaderDeadlineReader:
+    """
+    A handler's rfile whose readline() gives up once deadline passes. The
+    socket timeout only bounds each recv, so without it a client trickling
+    a byte at a time could hold a pool thread for as long as it likes.
+    """
+
+    def __init__(self, raw, sock):
+        self.raw = raw
+        self.sock = sock
+        self.deadline = None
+
+    def readline(self, limit=-1):
+        if self.deadline is None:
+            return self.raw.readline(limit)
+        # One recv at a time, each bounded by what is left of the deadline;
+        # BufferedReader.readline() would keep receiving a line trickling in.
+        line = bytearray()
+        while limit < 0 or len(line) < limit:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("request headers took too long")
+            self.sock.settimeout(remaining)
+            chunk = self.raw.peek(1)
+            if not chunk:
+                break
+            end = chunk.find(b'\n') + 1 or len(chunk)
+            if limit >= 0:
+                end = min(end, limit - len(line))
+            line += self.raw.read(end)
+            if line.endswith(b'\n'):
+                break
+        return bytes(line)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
 
 class WishHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep-alive: every response below must carry a Content-Length.
+    protocol_version = 'HTTP/1.1'
+    # Per recv while reading a body or writing a response; see REQUEST_TIMEOUT for headers.
+    timeout = KEEPALIVE_TIMEOUT
+
+    def __init__(self, *args, **kwargs):
+        self.parked = False
+        super().__init__(*args, directory=STATIC_ROOT, **kwargs)
+
+    def setup(self):
+        super().setup()
+        self.rfile = HeaderDeadlineReader(self.rfile, self.connection)
+
+    def handle(self):
+        """Serve requests the client has already sent, then park until it sends another."""
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            if not self.pending_input():
+                self.parked = True
+                return
+            self.handle_one_request()
+
+    def handle_one_request(self):
+        # Through nginx one connection carries many clients' requests; a request
+        # that fails before its headers are parsed must not reuse the last ones.
+        self.headers = None
+        self.rfile.deadline = time.monotonic() + REQUEST_TIMEOUT
+        try:
+            super().handle_one_request()
+        finally:
+            self.rfile.deadline = None
+
+    def parse_request(self):
+        try:
+            return super().parse_request()
+        finally:
+            # Headers are in; the body and the response get the usual per-recv timeout.
+            self.rfile.deadline = None
+            self.connection.settimeout(self.timeout)
+
+    def pending_input(self):
+        # Peek without blocking; a pipelined request may already sit in rfile's buffer.
+        self.connection.setblocking(False)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return True  # let handle_one_request() run into the error
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def finish(self):
+        if not self.parked:
+            super().finish()
+
+    def resume(self):
+        """Serve the next request on a parked connection (the server saw it become readable)."""
+        self.parked = False
+        try:
+            self.handle()
+        finally:
+            self.finish()
+
+    def close_idle(self):
+        """Drop a parked connection that stayed idle for too long."""
+        self.parked = False
+        self.finish()
+
+    def client_ip(self):
+        # nginx passes the real client address along; only a trusted proxy may.
+        # headers is unset when the request line was malformed, too long or never came.
+        peer = self.client_address[0]
+        headers = getattr(self, 'headers', None)
+        forwarded = headers.get('X-Real-IP') if headers is not None else None
+        if forwarded and is_trusted_proxy(peer):
+            return forwarded
+        return peer
+
+    def send_response(self, code, message=None):
+        self.status = code
+        super().send_response(code, message)
+
+    def end_headers(self):
+        if self.server.draining:
+            # Make keep-alive clients reconnect, reaching a worker that stays.
+            self.send_header('Connection', 'close')
+        super().end_headers()
+
+    def log_request(self, code='-', size='-'):
+        pass  # instrumented() writes one structured record per request instead
+
+    def log_message(self, format, *args):
+        logger.info(format % args, extra={"fields": {"client": self.client_ip()}})
+
+    def send_empty(self, status):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+    def send_json(self, status, payload, retry_after=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        if retry_after is not None:
+            self.send_header('Retry-After', str(max(1, math.ceil(retry_after))))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_unavailable(self, retry_after):
+        self.send_response(503)
+        self.send_header('Retry-After', str(retry_after))
+        self.send_header('Content-Length', '0')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+    def get_wish_page(self, query):
+        """GET /api/wishes?limit=&cursor= or ?since=; the bare route keeps returning the full array."""
+        try:
+            limit = min(query_int(query, 'limit', DEFAULT_PAGE_SIZE, minimum=1), MAX_PAGE_SIZE)
+            since = query_int(query, 'since')
+            cursor = query_int(query, 'cursor', minimum=1)
+        except ValueError as e:
+            self.send_json(400, {"error": str(e)})
+            return
+        if since is not None:
+            items, version, has_more = store.since(since, limit)
+            self.send_json(200, {"items": items, "version": version, "has_more": has_more})
+        else:
+            items, next_cursor, version = store.page(limit, cursor)
+            self.send_json(200, {"items": items, "next_cursor": next_cursor, "version": version})
+
+    def search_wishes(self, query):
+        """GET /api/wishes/search?q=&limit=&cursor=: ranked matches; cursor is the offset of the next page."""
+        text = (query.get('q') or [''])[0]
+        try:
+            limit = min(query_int(query, 'limit', DEFAULT_PAGE_SIZE, minimum=1), MAX_PAGE_SIZE)
+            offset = query_int(query, 'cursor', 0)
+        except ValueError as e:
+            self.send_json(400, {"error": str(e)})
+            return
+        if len(text) > SEARCH_MAX_QUERY or not tokenize(text):
+            self.send_json(400, {"error": f"q must contain a word or CJK character and be at most {SEARCH_MAX_QUERY} characters"})
+            return
+        if not search_index.ready.is_set():
+            self.send_unavailable(5)
+            return
+        items, total, truncated, version = search_index.search(text, limit, offset)
+        next_cursor = offset + limit if offset + limit < total else None
+        self.send_json(200, {"items": items, "total": total, "truncated": truncated,
+                             "next_cursor": next_cursor, "version": version})
+
+    def stream_wishes(self):
+        """GET /api/wishes/stream: Server-Sent Events, resumable via Last-Event-ID."""
+        if not broadcaster.reserve():
+            self.send_unavailable(30)
+            return
+        try:
+            self.send_response(200)
+            self.send_header('Content-type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            # Tell nginx not to buffer the stream.
+            self.send_header('X-Accel-Buffering', 'no')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(f"retry: {int(SSE_HEARTBEAT * 1000)}\n\n".encode('utf-8'))
+        except OSError:
+            broadcaster.release()
+            raise
+        self.close_connection = True
+
+        try:
+            last_id = int(self.headers.get('Last-Event-ID', ''))
+        except ValueError:
+            last_id = None
+        # Holding the store lock keeps new wishes from being published between
+        # building the catch-up and queueing the attach.
+        with store.lock:
+            preamble = b''
+            if last_id is not None and last_id < store.version:
+                items, _, has_more = store.since(last_id, MAX_PAGE_SIZE)
+                if has_more:
+                    # Too far behind to replay; the client should reload the list.
+                    preamble = f"event: reset\ndata: {store.version}\n\n".encode('utf-8')
+                else:
+                    preamble = b''.join(sse_event(w["id"], w["content"]) for w in reversed(items))
+            self.server.detach(self.request)
+            broadcaster.attach(self.request, preamble)
+
+    def send_metrics(self):
+        body = render_metrics().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    @instrumented
     def do_GET(self):
         parsed_path = urlparse(self.path)
-        if parsed_path.path == '/api/wishes':
+        query = parse_qs(parsed_path.query)
+        if parsed_path.path.startswith('/api/wishes'):
+            store.refresh()
+        if parsed_path.path == '/api/metrics':
+            self.send_metrics()
+        elif parsed_path.path == '/api/wishes/stream':
+            self.stream_wishes()
+        elif parsed_path.path == '/api/wishes/search':
+            self.search_wishes(query)
+        elif parsed_path.path == '/api/wishes' and query.keys() & {'limit', 'cursor', 'since'}:
+            self.get_wish_page(query)
+        elif parsed_path.path == '/api/wishes':
+            version, body = store.encoded()
+            etag = f'"{version}"'
+            if etag_matches(self.headers.get('If-None-Match'), etag):
+                metrics.inc('wishes_not_modified_total')
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                return
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            # Let browsers and nginx keep the body but revalidate every time.
+            self.send_header('Cache-Control', 'no-cache')
             self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
-            
-            wishes = []
-            if os.path.exists(DB_PATH) and not os.path.isdir(DB_PATH):
-                with open(DB_PATH, 'r', encoding='utf-8') as f:
-                    try:
-                        wishes = json.load(f)
-                    except:
-                        wishes = []
-            
-            self.wfile.write(json.dumps(wishes).encode('utf-8'))
+            self.wfile.write(body)
         else:
-            super().do_GET()
+            self.send_static()
 
-    def do_POST(self):
-        parsed_path = urlparse(self.path)
-        if parsed_path.path == '/api/wishes':
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            
+    @instrumented
+    def do_HEAD(self):
+        self.send_static(head_only=True)
+
+    def send_static(self, head_only=False):
+        """
+        Serve a file under STATIC_ROOT: a precompressed .br/.gz variant when
+        the client accepts it, single byte ranges (for seeking in bgm.mp3),
+        ETag revalidation, a year of caching for content-hashed names, and
+        the body copied with sendfile.
+        """
+        url_path = urlparse(self.path).path
+        path = self.translate_path(url_path)
+        if os.path.isdir(path):
+            path = os.path.join(path, 'index.html')
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return
+        with f:
+            st = os.fstat(f.fileno())
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            headers = {
+                'Content-type': self.guess_type(path),
+                'Last-Modified': email.utils.formatdate(st.st_mtime, usegmt=True),
+                'Cache-Control': IMMUTABLE_CACHE_CONTROL if HASHED_ASSET_RE.search(url_path) else 'no-cache',
+                'Accept-Ranges': 'bytes',
+            }
+            if path.endswith(PRECOMPRESS_EXTENSIONS):
+                headers['Vary'] = 'Accept-Encoding'
+            byte_range = None
+            if 'Range' in self.headers and self.headers.get('If-Range', etag) == etag:
+                try:
+                    byte_range = parse_range(self.headers['Range'], st.st_size)
+                except ValueError:
+                    self.send_response(416)
+                    self.send_header('Content-Range', f'bytes */{st.st_size}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+            body, size = f, st.st_size
+            if byte_range is None and 'Vary' in headers:
+                accepted = accepted_encodings(self.headers.get('Accept-Encoding'))
+                for coding, suffix in (('br', '.br'), ('gzip', '.gz')):
+                    if coding in accepted and os.path.exists(path + suffix):
+                        variant = open(path + suffix, 'rb')
+                        if os.fstat(variant.fileno()).st_mtime_ns >= st.st_mtime_ns:
+                            body, size = variant, os.fstat(variant.fileno()).st_size
+                            headers['Content-Encoding'] = coding
+                            etag = etag[:-1] + f'-{coding}"'
+                            break
+                        variant.close()
+            headers['ETag'] = etag
             try:
-                data = json.loads(post_data.decode('utf-8'))
-                new_wish = data.get('content')
-                
-                if new_wish:
-                    wishes = []
-                    if os.path.exists(DB_PATH) and not os.path.isdir(DB_PATH):
-                        with open(DB_PATH, 'r', encoding='utf-8') as f:
-                            try:
-                                wishes = json.load(f)
-                            except:
-                                wishes = []
-                    
-                    # Add new wish to top
-                    wishes.insert(0, new_wish)
-                    
-                    with open(DB_PATH, 'w', encoding='utf-8') as f:
-                        json.dump(wishes, f, ensure_ascii=False)
-                    
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
+                if etag_matches(self.headers.get('If-None-Match'), etag):
+                    self.send_response(304)
+                    for name in ('ETag', 'Cache-Control', 'Vary'):
+                        if name in headers:
+                            self.send_header(name, headers[name])
                     self.end_headers()
-                    self.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
+                    return
+                offset = 0
+                if byte_range is not None:
+                    offset, end = byte_range
+                    size = end - offset + 1
+                    self.send_response(206)
+                    self.send_header('Content-Range', f'bytes {offset}-{end}/{st.st_size}')
                 else:
-                    self.send_response(400)
-                    self.end_headers()
-            except Exception as e:
-                print(e)
-                self.send_response(500)
+                    self.send_response(200)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(size))
                 self.end_headers()
+                if not head_only and size:
+                    # socket.sendfile uses os.sendfile where available and copies otherwise.
+                    self.connection.sendfile(body, offset, size)
+            finally:
+                if body is not f:
+                    body.close()
+
+    def admit(self):
+        """
+        Charge one write request to the client's rate limit bucket, raising
+        RequestRejected when it is empty. Called before the body is read, so
+        a flood costs as little as possible.
+        """
+        wait = rate_limiter.acquire(self.client_ip())
+        if wait:
+            raise RequestRejected(429, "too many requests, slow down", retry_after=wait)
+
+    def read_json(self, limit):
+        """Read and parse a JSON request body of at most limit bytes."""
+        try:
+            length = int(self.headers['Content-Length'])
+        except (TypeError, ValueError):
+            length = -1
+        if length < 0:
+            # rfile.read(-1) would read until the client closes, past any limit.
+            raise RequestRejected(400, "a valid Content-Length is required")
+        if length > limit:
+            raise RequestRejected(413, f"request body is limited to {limit} bytes")
+        body = self.rfile.read(length)
+        if len(body) < length:
+            raise RequestRejected(400, "request body ended early")
+        try:
+            return json.loads(body.decode('utf-8'))
+        except ValueError:
+            raise RequestRejected(400, "request body is not valid JSON")
+
+    def check_wishes(self, contents):
+        if not all(isinstance(c, str) and c for c in contents):
+            raise RequestRejected(400, "every wish must be a non-empty string")
+        if any(len(c) > MAX_WISH_LENGTH for c in contents):
+            raise RequestRejected(413, f"wishes are limited to {MAX_WISH_LENGTH} characters")
+
+    def post_wish_batch(self):
+        """POST /api/wishes/batch: a JSON array of strings or {"content": ...} objects, committed together."""
+        self.admit()
+        data = self.read_json(MAX_BATCH_BODY_SIZE)
+        if not isinstance(data, list) or not 0 < len(data) <= MAX_BATCH_SIZE:
+            raise RequestRejected(400, f"expected a JSON array of 1-{MAX_BATCH_SIZE} wishes")
+        contents = [item.get('content') if isinstance(item, dict) else item for item in data]
+        self.check_wishes(contents)
+        versions = store.append_many(contents)
+        self.send_json(200, {"status": "success", "ids": versions})
+
+    def post_wish(self):
+        self.admit()
+        data = self.read_json(MAX_BODY_SIZE)
+        new_wish = data.get('content') if isinstance(data, dict) else None
+        if not new_wish:
+            self.send_empty(400)
+            return
+        self.check_wishes([new_wish])
+        version = store.append(new_wish)
+        self.send_json(200, {"status": "success", "id": version})
+
+    @instrumented
+    def do_POST(self):
+        parsed_path = urlparse(self.path)
+        if parsed_path.path in ('/api/wishes', '/api/wishes/batch'):
+            try:
+                if parsed_path.path == '/api/wishes/batch':
+                    self.post_wish_batch()
+                else:
+                    self.post_wish()
+            except RequestRejected as e:
+                metrics.inc('wishes_rejected_total', status=e.status)
+                # The body may be unread; it must not be parsed as the next request.
+                self.close_connection = True
+                self.send_json(e.status, {"error": e.error}, retry_after=e.retry_after)
+            except StoreBusy:
+                metrics.inc('wishes_rejected_total', status=503)
+                self.send_json(503, {"error": "too many pending writes"}, retry_after=1)
+            except Exception:
+                metrics.inc('wishes_http_errors_total', route=route_label(self.command, self.path))
+                logger.exception("POST %s failed", parsed_path.path, extra={"fields": {"client": self.client_ip()}})
+                self.close_connection = True
+                self.send_empty(500)
         else:
-            self.send_response(404)
-            self.end_headers()
+            # The unread request body would otherwise be parsed as the next request.
+            self.close_connection = True
+            self.send_empty(404)
 
+    @instrumented
     def do_OPTIONS(self):
         self.send_response(200)
+        self.send_header('Content-Length', '0')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
 
-print(f"Server running on port {PORT}")
-with socketserver.TCPServer(("", PORT), WishHandler) as httpd:
-    httpd.serve_forever()
+
+class OwnerClient:
+    """
+    Calls from a prefork worker to the owner process over its Unix socket:
+    one JSON request and one JSON response per line, a connection per thread.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+
+    def call(self, op, **params):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(self.path)
+            conn = self.local.conn = (sock, sock.makefile('rb'))
+        sock, reader = conn
+        try:
+            sock.sendall(json.dumps(dict(params, op=op), ensure_ascii=False).encode('utf-8') + b'\n')
+            line = reader.readline()
+            if not line:
+                raise ConnectionError("owner process closed the connection")
+        except OSError:
+            self.local.conn = None
+            reader.close()
+            sock.close()
+            raise
+        response = json.loads(line)
+        if response.get('error') == 'busy':
+            raise StoreBusy()
+        if 'error' in response:
+            raise RuntimeError(f"owner process: {response['error']}")
+        return response
+
+
+class WishReplica(WishReader):
+    """
+    A prefork worker's copy of the owner's wishes. The owner publishes its
+    version in a memory-mapped counter; when that is ahead, refresh() fetches
+    just the missing wishes and feeds them to the listeners like a commit.
+    Appends are forwarded to the owner, which answers once they are durable.
+    """
+
+    def __init__(self, owner, version_path):
+        super().__init__()
+        self.owner = owner
+        with open(version_path, 'rb') as f:
+            self.shared = mmap.mmap(f.fileno(), VERSION_HEADER.size, access=mmap.ACCESS_READ)
+        self.sync_lock = threading.Lock()
+        self.sync()
+
+    def shared_version(self):
+        return VERSION_HEADER.unpack_from(self.shared)[0]
+
+    def sync(self, blocking=True):
+        """Fetch wishes newer than ours from the owner; without blocking, skip if a sync is running."""
+        if not self.sync_lock.acquire(blocking):
+            return
+        try:
+            # Only this method extends self.wishes, so the version is stable here.
+            contents = self.owner.call('since', version=self.version)['contents']
+            with self.lock:
+                for content in contents:
+                    self.wishes.append(content)
+                    for listener in self.listeners:
+                        listener(self.version, content)
+        finally:
+            self.sync_lock.release()
+
+    def refresh(self):
+        if self.shared_version() > self.version:
+            try:
+                self.sync(blocking=False)
+            except (OSError, RuntimeError):
+                logger.warning("Could not catch up with the owner process", exc_info=True)
+
+    def append(self, content):
+        return self.append_many([content])[0]
+
+    def append_many(self, contents):
+        versions = self.owner.call('append', contents=contents)['versions']
+        # Read your writes: this worker's next response already includes them.
+        self.sync()
+        return versions
+
+    def close(self):
+        self.shared.close()
+
+
+class OwnerRateLimiter:
+    """RateLimiter stand-in for prefork workers: buckets live in the owner, shared by every worker."""
+
+    def __init__(self, owner, rate=RATE_LIMIT_PER_SECOND, burst=RATE_LIMIT_BURST):
+        self.owner = owner
+        self.rate = rate
+        self.burst = burst
+
+    def acquire(self, key, cost=1):
+        if self.rate <= 0:
+            return 0
+        return self.owner.call('admit', key=key, cost=cost)['wait']
+
+
+class OwnerRequestHandler(socketserver.StreamRequestHandler):
+    """One worker connection to the owner process (see OwnerClient)."""
+
+    def handle(self):
+        for line in self.rfile:
+            request = json.loads(line)
+            try:
+                response = self.dispatch(request)
+            except StoreBusy:
+                response = {"error": "busy"}
+            except Exception as e:
+                logger.exception("Owner request %r failed", request.get('op'))
+                response = {"error": str(e)}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+
+    def dispatch(self, request):
+        op = request['op']
+        if op == 'append':
+            return {"versions": store.append_many(request['contents'])}
+        if op == 'since':
+            with store.lock:
+                return {"contents": store.wishes[request['version']:]}
+        if op == 'admit':
+            return {"wait": rate_limiter.acquire(request['key'], request['cost'])}
+        if op == 'ready':
+            self.server.supervisor.worker_ready(request['pid'])
+            return {}
+        if op == 'metrics':
+            supervisor = self.server.supervisor
+            supervisor.worker_metrics.report(supervisor.slots.get(request['pid'], request['pid']),
+                                             request['pid'], request['values'], request['histograms'])
+            if not request.get('render'):
+                return {}
+            values, histograms = metrics.snapshot()
+            worker_values, worker_histograms = supervisor.worker_metrics.samples()
+            values.update(worker_values)
+            histograms.update(worker_histograms)
+            return {"text": metrics.render((values, histograms))}
+        raise ValueError(f"unknown op {op!r}")
+
+
+class OwnerServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class WorkerMetrics:
+    """
+    The owner's copy of its workers' metrics, from the snapshots they report,
+    labelled worker="<slot>". A slot is a worker's place in the generation and
+    carries over to its restarts and reload replacements; counters and
+    histograms of the slot's exited processes are kept, so its series never
+    go backwards. Gauges come from the slot's newest live process.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.live = {}  # pid -> (slot, values, histograms), oldest report first
+        self.retired_values = defaultdict(float)
+        self.retired_histograms = {}
+
+    def report(self, slot, pid, values, histograms):
+        values = {(name, tuple(map(tuple, labels))): value for name, labels, value in values}
+        histograms = {(name, tuple(map(tuple, labels))): hist for name, labels, hist in histograms}
+        with self.lock:
+            self.live[pid] = (slot, values, histograms)
+
+    def exited(self, pid):
+        with self.lock:
+            report = self.live.pop(pid, None)
+            if report is None:
+                return
+            slot, values, histograms = report
+            for key, value in self._labelled(slot, values).items():
+                if METRICS.get(key[0], ('gauge',))[0] == 'counter':
+                    self.retired_values[key] += value
+            for key, hist in self._labelled(slot, histograms).items():
+                retired = self.retired_histograms.setdefault(key, [0] * len(hist))
+                retired[:] = [a + b for a, b in zip(retired, hist)]
+
+    @staticmethod
+    def _labelled(slot, samples):
+        return {(name, tuple(sorted(labels + (('worker', str(slot)),)))): value
+                for (name, labels), value in samples.items()}
+
+    def samples(self):
+        """Every worker's series, in the (values, histograms) form of Metrics.snapshot()."""
+        with self.lock:
+            values = dict(self.retired_values)
+            histograms = {key: list(hist) for key, hist in self.retired_histograms.items()}
+            for slot, live_values, live_histograms in self.live.values():
+                for key, value in self._labelled(slot, live_values).items():
+                    if METRICS.get(key[0], ('gauge',))[0] == 'counter':
+                        values[key] = values.get(key, 0) + value
+                    else:
+                        values[key] = value
+                for key, hist in self._labelled(slot, live_histograms).items():
+                    total = histograms.setdefault(key, [0] * len(hist))
+                    total[:] = [a + b for a, b in zip(total, hist)]
+        return values, histograms
+
+
+class Supervisor:
+    """
+    The prefork owner's worker processes: starts them (this script with
+    --worker), restarts the ones that die with a growing delay while they
+    keep crashing, replaces all of them on reload once the new ones are
+    ready, and stops them on shutdown. A stopped worker stops accepting,
+    finishes its requests within GRACEFUL_TIMEOUT and is killed after that.
+    """
+
+    def __init__(self, processes, port, run_dir):
+        self.processes = processes
+        self.port = port
+        self.run_dir = run_dir
+        self.workers = {}  # pid -> Popen, the current generation
+        self.started = {}  # pid -> monotonic start time
+        self.slots = {}  # pid -> slot, the worker label on its metrics
+        self.worker_metrics = WorkerMetrics()
+        self.retiring = {}  # pid -> (Popen, kill deadline)
+        self.ready = set()
+        self.ready_cond = threading.Condition()
+        self.restarts = []  # (monotonic time, slot) at which to start a replacement
+        self.backoff = 0.5
+        self.reload_requested = False
+        self.stopping = False
+
+    def spawn(self, slot):
+        proc = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                                 '--worker', self.run_dir, '--port', str(self.port)])
+        self.workers[proc.pid] = proc
+        self.started[proc.pid] = time.monotonic()
+        self.slots[proc.pid] = slot
+        return proc.pid
+
+    def reaped(self, pid):
+        """Forget an exited worker, keeping its final metrics under its slot."""
+        self.worker_metrics.exited(pid)
+        self.slots.pop(pid, None)
+
+    def worker_ready(self, pid):
+        with self.ready_cond:
+            self.ready.add(pid)
+            self.ready_cond.notify_all()
+
+    def wait_ready(self, pids, timeout=WORKER_START_TIMEOUT):
+        """Wait until every worker in pids is serving; False if one exits or time runs out."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and not self.stopping:
+            with self.ready_cond:
+                if pids <= self.ready:
+                    return True
+                self.ready_cond.wait(0.2)
+            if any(self.workers[pid].poll() is not None for pid in pids):
+                return False
+        return False
+
+    def retire(self, workers):
+        deadline = time.monotonic() + GRACEFUL_TIMEOUT + 1
+        for pid, proc in workers.items():
+            if proc.poll() is None:
+                proc.terminate()
+            self.retiring[pid] = (proc, deadline)
+            self.started.pop(pid, None)
+
+    def reload(self):
+        """Start a new generation of workers and retire the old one once it is ready."""
+        logger.info("Reloading %d workers", self.processes)
+        old, self.workers = self.workers, {}
+        new = {self.spawn(slot) for slot in range(self.processes)}
+        if not self.wait_ready(new):
+            logger.error("New workers did not start; keeping the old ones")
+            for pid in new:
+                self.workers[pid].kill()
+                self.workers[pid].wait()
+                self.started.pop(pid, None)
+                self.reaped(pid)
+            self.workers = old
+            return
+        # Every slot has a fresh worker now; restarts still pending are for the old ones.
+        self.restarts = []
+        self.retire(old)
+
+    def check(self):
+        """Restart workers that died, and kill retiring ones that overstay."""
+        now = time.monotonic()
+        for pid, proc in list(self.workers.items()):
+            if proc.poll() is None:
+                continue
+            del self.workers[pid]
+            slot = self.slots[pid]
+            self.reaped(pid)
+            lived = now - self.started.pop(pid)
+            self.backoff = min(self.backoff * 2, RESTART_BACKOFF_MAX) if lived < RESTART_BACKOFF_MAX else 0.5
+            logger.warning("Worker %d exited with status %d after %.1fs; restarting in %.1fs",
+                           pid, proc.returncode, lived, self.backoff)
+            self.restarts.append((now + self.backoff, slot))
+        due = [slot for t, slot in self.restarts if t <= now]
+        self.restarts = [(t, slot) for t, slot in self.restarts if t > now]
+        for slot in due:
+            self.spawn(slot)
+        for pid, (proc, deadline) in list(self.retiring.items()):
+            if proc.poll() is not None:
+                del self.retiring[pid]
+                self.reaped(pid)
+            elif now > deadline:
+                logger.warning("Worker %d did not stop in time; killing it", pid)
+                proc.kill()
+
+    def run(self):
+        for slot in range(self.processes):
+            self.spawn(slot)
+        if not self.wait_ready(set(self.workers)):
+            if self.stopping:
+                return
+            raise RuntimeError("workers did not start")
+        logger.info("Server running on port %d with %d processes of %d workers", self.port, self.processes, WORKERS)
+        while not self.stopping:
+            time.sleep(0.2)
+            if self.reload_requested:
+                self.reload_requested = False
+                self.reload()
+            self.check()
+        self.retire(self.workers)
+        self.workers = {}
+        for proc, _ in self.retiring.values():
+            try:
+                proc.wait(GRACEFUL_TIMEOUT + 1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+
+def register_gauges():
+    metrics.gauge('wishes_store_version', lambda: store.version)
+    metrics.gauge('wishes_sse_subscribers', lambda: broadcaster.reserved)
+    metrics.gauge('wishes_search_terms', lambda: len(search_index.postings))
+
+
+def serve_owner(processes):
+    """Prefork mode: own the wish store and keep `processes` workers serving HTTP."""
+    global store
+    log_listener = setup_logging(fields={"pid": os.getpid()})
+    store = WishStore(DB_PATH, LOG_PATH)
+    run_dir = tempfile.mkdtemp(prefix='wishes-')
+    version_path = os.path.join(run_dir, 'version')
+    with open(version_path, 'wb') as f:
+        f.write(VERSION_HEADER.pack(store.version))
+    with open(version_path, 'r+b') as f:
+        shared = mmap.mmap(f.fileno(), VERSION_HEADER.size)
+    # Listeners run in version order after each commit, before append returns.
+    store.listeners.append(lambda version, content: VERSION_HEADER.pack_into(shared, 0, version))
+    # Bound but never listening, so it gets no connections; it keeps the port
+    # ours between worker generations and resolves PORT=0 once for all of them.
+    reservation = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    reservation.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    reservation.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    reservation.bind(("", PORT))
+    owner_server = OwnerServer(os.path.join(run_dir, 'owner.sock'), OwnerRequestHandler)
+    supervisor = owner_server.supervisor = Supervisor(processes, reservation.getsockname()[1], run_dir)
+    metrics.gauge('wishes_store_version', lambda: store.version)
+    metrics.gauge('wishes_write_queue_depth', lambda: store.queued)
+    metrics.gauge('wishes_rate_limit_clients', lambda: len(rate_limiter.buckets))
+    threading.Thread(target=owner_server.serve_forever, daemon=True).start()
+
+    def stop(*_):
+        supervisor.stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGHUP, lambda *_: setattr(supervisor, 'reload_requested', True))
+    try:
+        supervisor.run()
+    finally:
+        owner_server.shutdown()
+        owner_server.server_close()
+        store.close()
+        shared.close()
+        reservation.close()
+        shutil.rmtree(run_dir, ignore_errors=True)
+        log_listener.stop()
+
+
+def serve_worker(run_dir, port):
+    """Prefork worker: serve HTTP on the shared port from a replica of the owner's wishes."""
+    global store, broadcaster, search_index, rate_limiter, render_metrics
+    log_listener = setup_logging(fields={"pid": os.getpid()})
+    owner_pid = os.getppid()
+    owner = OwnerClient(os.path.join(run_dir, 'owner.sock'))
+    store = WishReplica(owner, os.path.join(run_dir, 'version'))
+    rate_limiter = OwnerRateLimiter(owner)
+    broadcaster = Broadcaster()
+    store.listeners.append(broadcaster.publish)
+    search_index = SearchIndex(store)
+    register_gauges()
+    httpd = PooledHTTPServer(("", port), WishHandler, reuse_port=True)
+    stopping = threading.Event()
+
+    def stop(*_):
+        stopping.set()
+
+    def report_metrics(render=False):
+        values, histograms = metrics.snapshot()
+        return owner.call('metrics', pid=os.getpid(), render=render,
+                          values=[[name, labels, value] for (name, labels), value in values.items()],
+                          histograms=[[name, labels, hist] for (name, labels), hist in histograms.items()])
+
+    render_metrics = lambda: report_metrics(render=True)['text']
+
+    def watch():
+        # Keeps SSE subscribers current with wishes posted through other workers.
+        reported = time.monotonic()
+        while not stopping.wait(SYNC_INTERVAL):
+            if os.getppid() != owner_pid:
+                logger.error("Owner process exited; stopping")
+                break
+            store.refresh()
+            if time.monotonic() - reported >= METRICS_INTERVAL:
+                reported = time.monotonic()
+                try:
+                    report_metrics()
+                except (OSError, RuntimeError):
+                    logger.warning("Could not report metrics to the owner process", exc_info=True)
+        httpd.shutdown()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    threading.Thread(target=watch, daemon=True).start()
+    owner.call('ready', pid=os.getpid())
+    try:
+        httpd.serve_forever()
+        httpd.draining = True
+        # New connections now go to the other workers' sockets.
+        httpd.stop_accepting()
+        if not httpd.drain(GRACEFUL_TIMEOUT):
+            logger.warning("Stopping with requests still in flight")
+    finally:
+        try:
+            # The owner keeps these totals once we are gone.
+            report_metrics()
+        except (OSError, RuntimeError):
+            pass
+        store.close()
+        log_listener.stop()
+        # Interpreter exit would join the pool's threads, SSE streams included.
+        os._exit(0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Wishes API and static file server.")
+    parser.add_argument("--precompress", metavar="DIR",
+                        help="write .gz/.br variants of text assets under DIR and exit")
+    parser.add_argument("--processes", type=int, default=PROCESSES,
+                        help="prefork worker processes sharing the port (0: serve from this process)")
+    parser.add_argument("--worker", metavar="RUN_DIR", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=PORT, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.precompress:
+        precompress(args.precompress)
+        sys.exit(0)
+    if (args.worker or args.processes) and not hasattr(socket, 'SO_REUSEPORT'):
+        parser.error("prefork mode needs SO_REUSEPORT, which this platform lacks")
+    if args.worker:
+        serve_worker(args.worker, args.port)
+    if args.processes:
+        serve_owner(args.processes)
+        sys.exit(0)
+
+    log_listener = setup_logging()
+    store = WishStore(DB_PATH, LOG_PATH)
+    broadcaster = Broadcaster()
+    store.listeners.append(broadcaster.publish)
+    search_index = SearchIndex(store)
+    register_gauges()
+    metrics.gauge('wishes_write_queue_depth', lambda: store.queued)
+    metrics.gauge('wishes_rate_limit_clients', lambda: len(rate_limiter.buckets))
+    # docker stop sends SIGTERM; exit through the finally so the log is compacted.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        with PooledHTTPServer(("", PORT), WishHandler) as httpd:
+            # PORT=0 binds an ephemeral port; log the one actually in use.
+            logger.info("Server running on port %d with %d workers", httpd.server_port, WORKERS)
+            httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+        log_listener.stop()
@@ -157,6 +157,7 @@ export const BlessingWallModule: React.FC<{ title?: string }> = ({ title = "写
 
               <textarea 
                 value={comment}
+                maxLength={500}
                 onFocus={() => setIsFocused(true)}
                 onBlur={() => setIsFocused(false)}
                 onChange={(e) => setComment(e.target.value)}
@@ -1,59 +1,292 @@
+import argparse
+import hashlib
+import json
 import os
-from PIL import Image
+import shutil
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageOps, features
 
-def compress_images(directory='public/image', quality=70):
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+MANIFEST_NAME = '.compress-manifest.json'
+
+# Responsive variants: each source is also resized to these widths (never
+# upscaled) in each of these formats, for use in srcset.
+VARIANT_WIDTHS = (480, 960, 1600)
+VARIANT_FORMATS = ('avif', 'webp', 'jpeg')
+FORMAT_EXTENSIONS = {'avif': '.avif', 'webp': '.webp', 'jpeg': '.jpg', 'png': '.png'}
+FORMAT_SAVE_OPTIONS = {
+    'avif': {'format': 'AVIF'},
+    'webp': {'format': 'WEBP', 'method': 4},
+    'jpeg': {'format': 'JPEG', 'optimize': True, 'progressive': True},
+}
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(path):
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            print(f"Ignoring unreadable manifest: {path}")
+    return {}
+
+
+def save_manifest(path, manifest):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def public_url(path, public_dir):
+    """URL of a file under public_dir, as referenced from images.ts (e.g. image/a.jpg)."""
+    return os.path.relpath(path, public_dir).replace(os.sep, '/')
+
+
+def supported_formats(formats):
+    """Drop formats this Pillow build cannot encode."""
+    available = []
+    for fmt in formats:
+        if fmt in ('avif', 'webp') and not features.check(fmt):
+            print(f"Skipping {fmt} variants: not supported by this Pillow build")
+            continue
+        available.append(fmt)
+    return available
+
+
+def _make_variants(source_path, output_path, quality, widths, formats, public_dir):
+    """Writes resized variants next to output_path and describes each one."""
+    stem = os.path.splitext(output_path)[0]
+    variants = []
+    with Image.open(source_path) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        targets = sorted({w for w in widths if w < img.width}) or [img.width]
+        for width in targets:
+            height = max(1, round(img.height * width / img.width))
+            resized = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                path = f"{stem}-{width}w{FORMAT_EXTENSIONS[fmt]}"
+                resized.save(path, quality=quality, **FORMAT_SAVE_OPTIONS[fmt])
+                variants.append({
+                    "width": width,
+                    "height": height,
+                    "bytes": os.path.getsize(path),
+                    "format": fmt,
+                    "url": public_url(path, public_dir),
+                })
+    return variants
+
+
+def _compress_one(source_path, output_path, quality, widths=(), formats=(), public_dir='public'):
+    """
+    Compresses a single image into output_path, plus its responsive variants.
+    Runs in a worker process.
+
+    If re-encoding does not make the file smaller the original bytes are copied
+    instead, so the output is never worse than the source.
+    """
+    start = time.perf_counter()
+    original_size = os.path.getsize(source_path)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    tmp_path = output_path + '.tmp'
+
+    with Image.open(source_path) as img:
+        if source_path.lower().endswith('.png'):
+            # PNG is lossless; quality does not apply.
+            img.save(tmp_path, format='PNG', optimize=True)
+        else:
+            # Keep EXIF so the orientation tag survives re-encoding.
+            exif = img.info.get('exif', b'')
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            img.save(tmp_path, format='JPEG', optimize=True, progressive=True, quality=quality, exif=exif)
+
+    new_size = os.path.getsize(tmp_path)
+    if new_size >= original_size:
+        shutil.copyfile(source_path, tmp_path)
+        new_size = original_size
+    os.replace(tmp_path, output_path)
+
+    with Image.open(output_path) as img:
+        width, height = ImageOps.exif_transpose(img).size
+        fmt = 'png' if img.format == 'PNG' else 'jpeg'
+    # The compressed full-size file is the largest candidate in the srcset.
+    variants = [{"width": width, "height": height, "bytes": new_size, "format": fmt,
+                 "url": public_url(output_path, public_dir)}]
+    if widths and formats:
+        variants += _make_variants(source_path, output_path, quality, widths, formats, public_dir)
+
+    return {
+        "original_bytes": original_size,
+        "output_bytes": new_size,
+        "saved_bytes": original_size - new_size,
+        "seconds": round(time.perf_counter() - start, 4),
+        "width": width,
+        "height": height,
+        "variants": variants,
+    }
+
+
+def write_variant_manifest(path, manifest, directory, public_dir):
+    """
+    Writes {source url: {width, height, variants}} for the build to turn into srcset.
+
+    Keys are the URLs used in images.ts (e.g. "image/film_01.jpg").
     """
-    Compresses all PNG and JPG images in the specified directory.
-    
+    variants = {}
+    for rel_path, entry in sorted(manifest.items()):
+        result = entry["result"]
+        url = public_url(os.path.join(directory, rel_path), public_dir)
+        variants[url] = {
+            "width": result["width"],
+            "height": result["height"],
+            "variants": sorted(result["variants"], key=lambda v: (v["format"], v["width"])),
+        }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(variants, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+    print(f"Wrote variant manifest for {len(variants)} images to {path}")
+
+
+def compress_images(directory='public/image', output_dir='public/image-optimized', quality=70,
+                    workers=None, force=False, widths=VARIANT_WIDTHS, formats=VARIANT_FORMATS,
+                    public_dir='public', variant_manifest='image-variants.json'):
+    """
+    Compresses all PNG and JPG images in a directory into output_dir, along
+    with resized AVIF/WebP/JPEG variants for srcset.
+
+    Originals are never modified. A manifest of source content hashes kept in
+    output_dir lets unchanged files be skipped on later runs.
+
     Args:
         directory (str): Path to the directory containing images.
-        quality (int): Compression quality (1-100). Lower is smaller file size.
+        output_dir (str): Where compressed copies are written, mirroring directory.
+        quality (int): JPEG compression quality (1-100). Lower is smaller file size.
+        workers (int): Worker processes; defaults to the CPU count.
+        force (bool): Re-encode every file even if its hash is unchanged.
+        widths (tuple): Variant widths in pixels; empty to skip variants.
+        formats (tuple): Variant formats out of avif, webp and jpeg.
+        public_dir (str): Web root that variant URLs are relative to.
+        variant_manifest (str): Where to write the srcset manifest; None to skip.
+
+    Returns:
+        dict: JSON-serializable report with per-file timings and bytes saved.
     """
     if not os.path.exists(directory):
         print(f"Directory not found: {directory}")
-        return
+        return None
 
     print(f"Scanning directory: {directory}...")
-    
-    total_saved = 0
-    
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    manifest = {} if force else load_manifest(manifest_path)
+    output_root = os.path.abspath(output_dir)
+
+    sources = []
     for root, _, files in os.walk(directory):
+        if os.path.abspath(root).startswith(output_root):
+            continue
         for file in files:
-            if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                file_path = os.path.join(root, file)
-                try:
-                    # Get original size
-                    original_size = os.path.getsize(file_path)
-                    
-                    with Image.open(file_path) as img:
-                        # Convert RGBA to RGB if necessary (for JPEG saving)
-                        if img.mode in ('RGBA', 'P') and file.lower().endswith(('jpg', 'jpeg')):
-                            img = img.convert('RGB')
-                        
-                        # Save with optimization
-                        # For PNG, we use optimize=True
-                        # For JPG, we use quality=quality
-                        if file.lower().endswith('.png'):
-                            img.save(file_path, optimize=True, quality=quality)
-                        else:
-                            img.save(file_path, optimize=True, quality=quality)
-                            
-                    new_size = os.path.getsize(file_path)
-                    saved = original_size - new_size
-                    total_saved += saved
-                    
-                    if saved > 0:
-                        print(f"Compressed {file}: {original_size/1024:.2f}KB -> {new_size/1024:.2f}KB (Saved {saved/1024:.2f}KB)")
-                    else:
-                        print(f"Skipped {file} (No size reduction)")
-                        
-                except Exception as e:
-                    print(f"Error compressing {file}: {e}")
-
-    print(f"\nTotal space saved: {total_saved/1024/1024:.2f} MB")
+            if file.lower().endswith(IMAGE_EXTENSIONS):
+                sources.append(os.path.join(root, file))
+    sources.sort()
+
+    formats = supported_formats(formats)
+    settings = {"quality": quality, "widths": sorted(widths), "formats": sorted(formats)}
+
+    started = time.perf_counter()
+    report = {"directory": directory, "output_dir": output_dir, "settings": settings, "files": []}
+    jobs = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for source_path in sources:
+            rel_path = os.path.relpath(source_path, directory)
+            output_path = os.path.join(output_dir, rel_path)
+            digest = file_hash(source_path)
+            entry = manifest.get(rel_path)
+            if (entry and entry.get("sha256") == digest and entry.get("settings") == settings
+                    and os.path.exists(output_path)):
+                report["files"].append(dict(entry["result"], file=rel_path, status="unchanged", seconds=0))
+                continue
+            future = pool.submit(_compress_one, source_path, output_path, quality,
+                                 widths, formats, public_dir)
+            jobs[future] = (rel_path, digest)
+
+        for future, (rel_path, digest) in jobs.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Error compressing {rel_path}: {e}")
+                report["files"].append({"file": rel_path, "status": "error", "error": str(e)})
+                continue
+            manifest[rel_path] = {"sha256": digest, "settings": settings, "result": result}
+            report["files"].append(dict(result, file=rel_path, status="compressed"))
+            print(f"Compressed {rel_path}: {result['original_bytes']/1024:.2f}KB -> "
+                  f"{result['output_bytes']/1024:.2f}KB in {result['seconds']:.2f}s")
+
+    # Forget sources that no longer exist.
+    current = {os.path.relpath(p, directory) for p in sources}
+    manifest = {k: v for k, v in manifest.items() if k in current}
+    os.makedirs(output_dir, exist_ok=True)
+    save_manifest(manifest_path, manifest)
+    if variant_manifest:
+        write_variant_manifest(variant_manifest, manifest, directory, public_dir)
+
+    report["files"].sort(key=lambda f: f["file"])
+    done = [f for f in report["files"] if f["status"] != "error"]
+    report["totals"] = {
+        "files": len(sources),
+        "compressed": sum(1 for f in report["files"] if f["status"] == "compressed"),
+        "unchanged": sum(1 for f in report["files"] if f["status"] == "unchanged"),
+        "errors": sum(1 for f in report["files"] if f["status"] == "error"),
+        "original_bytes": sum(f["original_bytes"] for f in done),
+        "output_bytes": sum(f["output_bytes"] for f in done),
+        "saved_bytes": sum(f["saved_bytes"] for f in done),
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+    print(f"\nTotal space saved: {report['totals']['saved_bytes']/1024/1024:.2f} MB")
     print("Compression complete!")
+    return report
+
 
 if __name__ == "__main__":
-    target_dir = sys.argv[1] if len(sys.argv) > 1 else "public/image"
-    compress_images(target_dir)
+    parser = argparse.ArgumentParser(description="Compress report images into an output directory.")
+    parser.add_argument("directory", nargs="?", default="public/image")
+    parser.add_argument("-o", "--output-dir", default="public/image-optimized")
+    parser.add_argument("-q", "--quality", type=int, default=70)
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="ignore the manifest and re-encode everything")
+    parser.add_argument("--widths", default=",".join(map(str, VARIANT_WIDTHS)),
+                        help="comma-separated variant widths; empty to skip variants")
+    parser.add_argument("--formats", default=",".join(VARIANT_FORMATS),
+                        help="comma-separated variant formats (avif, webp, jpeg)")
+    parser.add_argument("--public-dir", default="public", help="web root that variant URLs are relative to")
+    parser.add_argument("--variant-manifest", default="image-variants.json",
+                        help="srcset manifest consumed by the build")
+    parser.add_argument("--report", help="write the JSON report here ('-' for stdout)")
+    args = parser.parse_args()
+
+    widths = tuple(int(w) for w in args.widths.split(",") if w)
+    formats = tuple(f for f in args.formats.split(",") if f)
+    report = compress_images(args.directory, args.output_dir, args.quality, args.workers, args.force,
+                             widths, formats, args.public_dir, args.variant_manifest)
+    if report is None:
+        sys.exit(1)
+    if args.report == '-':
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
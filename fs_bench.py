@@ -0,0 +1,259 @@
+"""
+SimFileSystem 无界面基准测试。
+
+每个负载在单独的子进程里、一个全新的文件系统上运行（内存中，或用
+--image 指定的临时磁盘镜像），逐个操作计时，输出 JSON：吞吐（ops/s）、
+延迟分位数（微秒）、设备读写与缓存命中、文件与空闲空间的碎片程度，
+以及该负载的内存峰值。
+
+也可以用 --trace 回放图形界面记录的命令行（见 os_homework.TRACE_ENV）。
+
+用法：
+    python fs_bench.py                         # 全部负载
+    python fs_bench.py -w create_storm -w delete_churn --scale 2
+    python fs_bench.py --trace simfs-trace.txt --image /tmp/bench.img
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from os_homework import BLOCK_SIZE, SimFileSystem, execute_command, to_extents
+
+CHUNK = 64 * 1024
+
+
+class Recorder:
+    """按操作类型收集每次调用的耗时"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def time(self, op, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        except Exception:
+            self.errors[op] += 1
+        finally:
+            self.latencies[op].append(time.perf_counter() - start)
+
+    def summary(self):
+        ops = {}
+        for op, samples in sorted(self.latencies.items()):
+            ops[op] = dict(latency_summary(samples), errors=self.errors.get(op, 0))
+        return ops
+
+
+def latency_summary(samples):
+    ordered = sorted(samples)
+    total = sum(ordered)
+
+    def pct(p):
+        return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1e6, 2)
+
+    return {
+        "count": len(ordered),
+        "seconds": round(total, 6),
+        "ops_per_sec": round(len(ordered) / total, 1) if total else None,
+        "p50_us": pct(50),
+        "p90_us": pct(90),
+        "p99_us": pct(99),
+        "max_us": round(ordered[-1] * 1e6, 2),
+    }
+
+
+def fragmentation(fs):
+    """文件的区段数分布和空闲空间的零碎程度"""
+    extents = [len(to_extents(i.blocks)) for i in fs.inodes if i.type == 'file' and i.blocks]
+    free_runs = []
+    run = 0
+    for block_id in range(fs.data_start, fs.total_blocks):
+        if fs.allocator.is_free(block_id):
+            run += 1
+        elif run:
+            free_runs.append(run)
+            run = 0
+    if run:
+        free_runs.append(run)
+    return {
+        "files": len(extents),
+        "avg_extents_per_file": round(sum(extents) / len(extents), 3) if extents else 0,
+        "max_extents_per_file": max(extents, default=0),
+        "fragmented_files": sum(1 for n in extents if n > 1),
+        "free_blocks": sum(free_runs),
+        "free_extents": len(free_runs),
+        "largest_free_extent": max(free_runs, default=0),
+    }
+
+
+# ---- 负载：每个函数在 fs 上执行操作，通过 rec 计时 ----
+def create_storm(fs, rec, rng, scale):
+    """在同一目录下连续创建大量空文件"""
+    fs.create("/storm", 'dir')
+    for i in range(5000 * scale):
+        rec.time("create", fs.create, f"/storm/f{i}", 'file')
+
+
+def small_files(fs, rec, rng, scale):
+    """大量小文件：创建、整体写入、再全部读回"""
+    fs.create("/small", 'dir')
+    count = 2000 * scale
+    for i in range(count):
+        inode_id = rec.time("create", fs.create, f"/small/s{i}", 'file')
+        rec.time("write_file", fs.write_file, inode_id, os.urandom(rng.randint(100, 3000)))
+    for i in range(count):
+        rec.time("read", lambda p: fs.read_bytes(fs.resolve(p)), f"/small/s{i}")
+
+
+def sequential_large(fs, rec, rng, scale):
+    """按 64 KiB 顺序写一个大文件，再顺序读回"""
+    size = 8 * 1024 * 1024 * scale
+    chunk = os.urandom(CHUNK)
+    fd = fs.open("/large", 'w')
+    for _ in range(size // CHUNK):
+        rec.time("write_64k", fs.write, fd, chunk)
+    fs.close_file(fd)
+    fd = fs.open("/large", 'r')
+    for _ in range(size // CHUNK):
+        rec.time("read_64k", fs.read, fd, CHUNK)
+    fs.close_file(fd)
+
+
+def random_pwrite(fs, rec, rng, scale):
+    """在 4 MiB 文件内的随机偏移处写 512 B ~ 8 KiB"""
+    size = 4 * 1024 * 1024
+    inode_id = fs.create("/random", 'file')
+    fs.truncate(inode_id, size)
+    payload = os.urandom(8192)
+    for _ in range(5000 * scale):
+        length = rng.randint(512, 8192)
+        rec.time("pwrite", fs.pwrite, inode_id, rng.randrange(size - length), payload[:length])
+    for _ in range(5000 * scale):
+        rec.time("pread", fs.pread, inode_id, rng.randrange(size - 4096), 4096)
+
+
+def deep_tree(fs, rec, rng, scale):
+    """建一条很深的目录链（每层带几个文件），然后反复解析最深处的路径"""
+    depth = 64 * scale
+    path = ""
+    for level in range(depth):
+        path += f"/d{level}"
+        rec.time("mkdir", fs.create, path, 'dir')
+        for i in range(4):
+            rec.time("create", fs.create, f"{path}/f{i}", 'file')
+    for _ in range(2000 * scale):
+        rec.time("resolve_deep", fs.resolve, f"{path}/f{rng.randrange(4)}")
+    leaf = fs.resolve(path)
+    for _ in range(200 * scale):
+        rec.time("path_of_deep", fs.path_of, leaf)
+
+
+def delete_churn(fs, rec, rng, scale):
+    """维持约 1000 个大小不一的文件，反复随机删除并新建，观察碎片"""
+    fs.create("/churn", 'dir')
+    live = []
+    serial = 0
+    for _ in range(6000 * scale):
+        if live and (len(live) >= 1000 or rng.random() < 0.4):
+            rec.time("delete", fs.delete, live.pop(rng.randrange(len(live))))
+            continue
+        path = f"/churn/c{serial}"
+        serial += 1
+        inode_id = rec.time("create", fs.create, path, 'file')
+        if inode_id is not None:
+            rec.time("write_file", fs.write_file, inode_id, bytes(rng.randint(1, 40 * 1024)))
+            live.append(path)
+
+
+WORKLOADS = {
+    "create_storm": create_storm,
+    "small_files": small_files,
+    "sequential_large": sequential_large,
+    "random_pwrite": random_pwrite,
+    "deep_tree": deep_tree,
+    "delete_churn": delete_churn,
+}
+
+
+def replay_trace(fs, rec, path):
+    """逐行回放图形界面记录的命令，按命令名统计"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                rec.time(line.split()[0], execute_command, fs, line)
+
+
+def run(name, args):
+    """在当前进程里跑一个负载（name 为 "trace" 时回放 args.trace），返回结果字典"""
+    if args.image and os.path.exists(args.image):
+        os.remove(args.image)
+    fs = SimFileSystem(args.blocks, args.inodes, image_path=args.image, cache_blocks=args.cache)
+    rec = Recorder()
+    if args.tracemalloc:
+        tracemalloc.start()
+    started = time.perf_counter()
+    if name == "trace":
+        replay_trace(fs, rec, args.trace)
+    else:
+        WORKLOADS[name](fs, rec, random.Random(args.seed), args.scale)
+    fs.sync()
+    elapsed = time.perf_counter() - started
+    result = {"workload": name, "seconds": round(elapsed, 4)}
+    total_ops = sum(len(v) for v in rec.latencies.values())
+    result["ops"] = total_ops
+    result["ops_per_sec"] = round(total_ops / elapsed, 1) if elapsed else None
+    result["operations"] = rec.summary()
+    result["fragmentation"] = fragmentation(fs)
+    result["device"] = fs.cache_stats()
+    if args.tracemalloc:
+        result["python_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    result["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    fs.close()
+    return result
+
+
+def run_isolated(name, args):
+    """ru_maxrss 只增不减，每个负载放进自己的子进程，峰值才只属于这个负载"""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(run, name, args).result()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless benchmark for the simulated file system.")
+    parser.add_argument("-w", "--workload", action="append", choices=sorted(WORKLOADS),
+                        help="workload to run (repeatable; default: all)")
+    parser.add_argument("--trace", help="replay commands recorded from the GUI command line")
+    parser.add_argument("--scale", type=int, default=1, help="multiply operation counts")
+    parser.add_argument("--blocks", type=int, default=16384, help=f"disk size in {BLOCK_SIZE}-byte blocks")
+    parser.add_argument("--inodes", type=int, default=16384)
+    parser.add_argument("--cache", type=int, default=256, help="buffer cache blocks (0 disables the cache)")
+    parser.add_argument("--image", help="back the file system with this image file instead of memory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="report peak Python heap per workload (slows everything down)")
+    parser.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    config = {k: getattr(args, k) for k in ("scale", "blocks", "inodes", "cache", "image", "seed")}
+    report = {"config": config, "results": []}
+    if args.trace:
+        report["results"].append(run_isolated("trace", args))
+    for name in args.workload or ([] if args.trace else sorted(WORKLOADS)):
+        report["results"].append(run_isolated(name, args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
@@ -0,0 +1,176 @@
+"""
+SimFileSystem 崩溃一致性检查。
+
+每轮在临时磁盘镜像上执行一串随机操作，并在随机的第 N 次设备写入时
+模拟掉电（那次写只写入一半）。之后重新挂载镜像，要求：
+  * fsck() 不报告任何问题；
+  * 恢复出的名字空间（路径 -> 类型, 大小）等于崩溃那一步操作之前
+    或之后的状态——元数据事务要么完整生效，要么完全没有发生。
+
+期望状态由一个不注入崩溃的内存文件系统同步执行同样的操作得到。
+文件内容按写回语义处理（不记日志），因此只比较类型和大小。
+操作里夹带会失败的请求（重名、写满磁盘、负的偏移或长度）；这个内存文件系统每步之后
+都跑 fsck，失败的操作还必须让名字空间保持原样（事务整体回滚）。
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from os_homework import BLOCK_SIZE, SimFileSystem, SimulatedCrash
+
+TOTAL_BLOCKS = 256
+INODE_COUNT = 64
+CACHE_SIZES = (0, 4, 16, 64)
+
+
+def namespace(fs):
+    """{绝对路径: (类型, 大小)}，目录大小为目录项数"""
+    result = {}
+    stack = [(0, "")]
+    while stack:
+        dir_id, prefix = stack.pop()
+        for name, inode_id in fs.ls(dir_id):
+            inode = fs.inodes[inode_id]
+            path = f"{prefix}/{name}"
+            result[path] = (inode.type, inode.size)
+            if inode.type == 'dir':
+                stack.append((inode_id, path))
+    return result
+
+
+def random_op(rng, ns):
+    """根据当前名字空间生成一个操作 (名称, 参数...)"""
+    dirs = [""] + [p for p, (t, _) in ns.items() if t == 'dir']
+    files = [p for p, (t, _) in ns.items() if t == 'file']
+    kind = rng.choices(("mkdir", "touch", "write", "pwrite", "truncate", "append", "delete", "fill"),
+                       (2, 4, 3, 3, 2, 2, 2, 1))[0]
+    if kind == "fill":
+        # 大文件：多数时候写不下，或者把磁盘占满，让之后的建目录/扩展失败
+        return ("fill", f"/big{rng.randrange(3)}", rng.randrange(TOTAL_BLOCKS // 2, TOTAL_BLOCKS) * BLOCK_SIZE)
+    if kind in ("mkdir", "touch") or not files:
+        return ("mkdir" if kind == "mkdir" else "touch", f"{rng.choice(dirs)}/n{rng.randrange(40)}")
+    path = rng.choice(files)
+    if kind == "write":
+        return ("write", path, rng.randrange(3 * BLOCK_SIZE))
+    # 偶尔给出负的偏移/长度，文件系统必须拒绝且不留下任何修改
+    if kind == "pwrite":
+        return ("pwrite", path, rng.randrange(-BLOCK_SIZE // 8, 4 * BLOCK_SIZE), rng.randrange(1, 2 * BLOCK_SIZE))
+    if kind == "truncate":
+        return ("truncate", path, rng.randrange(-BLOCK_SIZE // 8, 4 * BLOCK_SIZE))
+    if kind == "append":
+        return ("append", path, rng.randrange(1, BLOCK_SIZE))
+    return ("delete", rng.choice(files + dirs[1:]))
+
+
+def apply_op(fs, op):
+    """执行一个操作，返回是否成功；文件系统拒绝的操作（已存在、目录非空、空间不足等）返回 False"""
+    kind, path = op[0], op[1]
+    try:
+        if kind == "fill":
+            # 打开（可能新建）和写入同属一个事务，写不下时连新建一起撤销
+            with fs.transaction():
+                fd = fs.open(path, 'w')
+                try:
+                    fs.write(fd, bytes(op[2]))
+                finally:
+                    fs.close_file(fd)
+        elif kind == "mkdir":
+            fs.create(path, 'dir')
+        elif kind == "touch":
+            fs.create(path, 'file')
+        elif kind == "delete":
+            fs.delete(path)
+        else:
+            inode_id = fs.resolve(path)
+            if kind == "write":
+                fs.write_file(inode_id, bytes([op[2] & 0xFF]) * op[2])
+            elif kind == "pwrite":
+                fs.pwrite(inode_id, op[2], b"x" * op[3])
+            elif kind == "truncate":
+                fs.truncate(inode_id, op[2])
+            elif kind == "append":
+                fs.append(inode_id, b"a" * op[2])
+    except SimulatedCrash:
+        raise
+    except Exception:
+        return False
+    return True
+
+
+def run_trial(seed, ops, image_path):
+    """跑一轮，返回结果字典；ok 为 False 时附带原因"""
+    rng = random.Random(seed)
+    if os.path.exists(image_path):
+        os.remove(image_path)
+    cache_blocks = rng.choice(CACHE_SIZES)
+    fs = SimFileSystem(TOTAL_BLOCKS, INODE_COUNT, image_path=image_path, cache_blocks=cache_blocks)
+    model = SimFileSystem(TOTAL_BLOCKS, INODE_COUNT)
+    # 先选在第几步掉电，再在那一步的设备写入里取点：写满磁盘这类写很多块的
+    # 操作不会因此吃掉大部分崩溃点；超出 ops 的部分表示不掉电
+    crash_at = rng.randrange(ops + ops // 10)
+    before = after = namespace(model)
+    crashed_op = None
+    try:
+        for i in range(ops):
+            op = random_op(rng, after)
+            before = after
+            writes = model.device.writes
+            ok = apply_op(model, op)
+            after = namespace(model)
+            problems = model.fsck()
+            if problems or (not ok and after != before):
+                fs.device.close()
+                return {"seed": seed, "cache_blocks": cache_blocks, "ok": False, "reason": "model",
+                        "op": list(op), "problems": problems}
+            crashed_op = op
+            if i == crash_at:
+                fs.device.crash_after = rng.randint(1, model.device.writes - writes + 1)
+            apply_op(fs, op)
+        crashed_op = ("close",)
+        before = after
+        fs.close()
+        crashed_op = None
+    except SimulatedCrash:
+        fs.device.close()
+
+    started = time.perf_counter()
+    recovered = SimFileSystem(image_path=image_path)
+    mount_seconds = time.perf_counter() - started
+    result = {"seed": seed, "cache_blocks": cache_blocks, "crashed_op": crashed_op,
+              "replayed": recovered.replayed, "mount_ms": round(mount_seconds * 1000, 3)}
+    problems = recovered.fsck()
+    state = namespace(recovered)
+    recovered.close()
+    if problems:
+        result.update(ok=False, reason="fsck", problems=problems)
+    elif state != before and state != after:
+        diff = sorted(set(state.items()) ^ set(before.items()))
+        result.update(ok=False, reason="namespace", diff=[list(d) for d in diff[:20]])
+    else:
+        result.update(ok=True, matched="after" if state == after and state != before else "before")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crash-consistency check for the simulated file system.")
+    parser.add_argument("-n", "--trials", type=int, default=200)
+    parser.add_argument("--ops", type=int, default=60, help="operations per trial")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first trial")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every trial")
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        image_path = os.path.join(tmp, "crash.img")
+        for seed in range(args.seed, args.seed + args.trials):
+            result = run_trial(seed, args.ops, image_path)
+            if args.verbose or not result["ok"]:
+                print(json.dumps(result, ensure_ascii=False))
+            if not result["ok"]:
+                failures.append(seed)
+    print(f"{args.trials - len(failures)}/{args.trials} trials recovered consistently")
+    sys.exit(1 if failures else 0)
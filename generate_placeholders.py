@@ -0,0 +1,142 @@
+import argparse
+import base64
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageOps
+
+from compress_images import file_hash, load_manifest, save_manifest
+
+# Longest edge of the inline preview; small enough that the data URL stays
+# well under a kilobyte.
+LQIP_SIZE = 20
+IMAGE_URL_RE = re.compile(r'"(image/[^"]+\.(?:jpe?g|png))"', re.IGNORECASE)
+
+
+def referenced_images(images_ts_path):
+    """Image URLs referenced from images.ts, in first-seen order."""
+    with open(images_ts_path, 'r', encoding='utf-8') as f:
+        urls = IMAGE_URL_RE.findall(f.read())
+    return list(dict.fromkeys(urls))
+
+
+def _placeholder(path, size=LQIP_SIZE):
+    """
+    Computes the placeholder for one image. Runs in a worker process.
+
+    Returns the displayed dimensions, the dominant color as #rrggbb and a tiny
+    blurred JPEG data URL to stretch over the slot while the real image loads.
+    """
+    with Image.open(path) as img:
+        width, height = img.size
+        if img.getexif().get(0x0112) in (5, 6, 7, 8):  # rotated by 90 degrees
+            width, height = height, width
+        # Let the JPEG decoder downscale by up to 8x; we only need a thumbnail.
+        img.draft('RGB', (size * 4, size * 4))
+        thumb = ImageOps.exif_transpose(img).convert('RGB')
+        thumb.thumbnail((size, size), Image.LANCZOS)
+
+    # Dominant color: the most populated bucket of an 8-color palette.
+    palette_img = thumb.quantize(colors=8)
+    palette = palette_img.getpalette()
+    _, index = max(palette_img.getcolors())
+    r, g, b = palette[index * 3:index * 3 + 3]
+
+    buf = io.BytesIO()
+    thumb.save(buf, format='JPEG', quality=40, optimize=True)
+    return {
+        "width": width,
+        "height": height,
+        "color": f"#{r:02x}{g:02x}{b:02x}",
+        "lqip": "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode('ascii'),
+    }
+
+
+def write_placeholders_ts(path, placeholders):
+    lines = [
+        "// Generated by generate_placeholders.py; do not edit by hand.",
+        "// Placeholder shown while each image in images.ts loads.",
+        "export interface ImagePlaceholder {",
+        "  width: number;",
+        "  height: number;",
+        "  color: string;",
+        "  lqip: string;",
+        "}",
+        "",
+        "export const IMAGE_PLACEHOLDERS: Record<string, ImagePlaceholder> = {",
+    ]
+    for url, p in placeholders.items():
+        lines.append(f"  {json.dumps(url, ensure_ascii=False)}: {json.dumps(p)},")
+    lines.append("};")
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
+
+
+def generate_placeholders(images_ts='images.ts', public_dir='public', output='placeholders.ts',
+                          cache_path='.placeholder-cache.json', workers=None):
+    """
+    Generates placeholders for every image referenced in images.ts.
+
+    Args:
+        images_ts (str): TS module listing PAGE_IMAGES / FILM_IMAGES.
+        public_dir (str): Web root the image URLs are relative to.
+        output (str): Generated TS module.
+        cache_path (str): Content-hash cache; unchanged images are not decoded again.
+        workers (int): Worker processes; defaults to the CPU count.
+    """
+    started = time.perf_counter()
+    cache = load_manifest(cache_path)
+    urls = referenced_images(images_ts)
+    print(f"Found {len(urls)} images referenced in {images_ts}")
+
+    placeholders = {}
+    jobs = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for url in urls:
+            path = os.path.join(public_dir, url)
+            if not os.path.exists(path):
+                print(f"Missing image: {path}")
+                continue
+            digest = file_hash(path)
+            entry = cache.get(url)
+            if entry and entry.get("sha256") == digest and entry.get("size") == LQIP_SIZE:
+                placeholders[url] = entry["placeholder"]
+            else:
+                jobs[pool.submit(_placeholder, path)] = (url, digest)
+
+        for future, (url, digest) in jobs.items():
+            try:
+                placeholders[url] = future.result()
+            except Exception as e:
+                print(f"Error generating placeholder for {url}: {e}")
+                continue
+            cache[url] = {"sha256": digest, "size": LQIP_SIZE, "placeholder": placeholders[url]}
+
+    cache = {url: entry for url, entry in cache.items() if url in placeholders}
+    save_manifest(cache_path, cache)
+    # Keep images.ts order so the generated file diffs cleanly.
+    write_placeholders_ts(output, {url: placeholders[url] for url in urls if url in placeholders})
+    print(f"Wrote {len(placeholders)} placeholders to {output} "
+          f"({len(jobs)} regenerated) in {time.perf_counter() - started:.2f}s")
+    return placeholders
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate LQIP placeholders for images.ts.")
+    parser.add_argument("--images-ts", default="images.ts")
+    parser.add_argument("--public-dir", default="public")
+    parser.add_argument("-o", "--output", default="placeholders.ts")
+    parser.add_argument("--cache", default=".placeholder-cache.json")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.images_ts):
+        print(f"File not found: {args.images_ts}")
+        sys.exit(1)
+    generate_placeholders(args.images_ts, args.public_dir, args.output, args.cache, args.workers)
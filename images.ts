@@ -1,3 +1,4 @@
+// Generated from image-manifest.json by organize_images.py; edit the manifest instead.
 // 页面图片配置
 // 格式: { pageId: "图片地址" }
 export const PAGE_IMAGES: Record<number, string> = {
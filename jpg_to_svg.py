@@ -1,69 +1,198 @@
+import argparse
 import base64
 import os
 import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
-def get_image_info(data):
+# Read and encode the source in chunks of this size. It is a multiple of 3 so
+# every chunk base64-encodes without padding and the pieces concatenate.
+CHUNK_SIZE = 3 * 64 * 1024
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+# JPEG start-of-frame markers carry the dimensions; C4/C8/CC share the range
+# but are DHT, JPG and DAC.
+SOF_MARKERS = set(range(0xc0, 0xd0)) - {0xc4, 0xc8, 0xcc}
+# Markers without a length field.
+STANDALONE_MARKERS = set(range(0xd0, 0xd8)) | {0x01}
+EXIF_ORIENTATION_TAG = 0x0112
+
+
+def _exif_orientation(data):
+    """Orientation (1-8) from the body of an APP1 Exif segment, or 1."""
+    if not data.startswith(b'Exif\x00\x00') or len(data) < 14:
+        return 1
+    tiff = data[6:]
+    endian = {b'II': '<', b'MM': '>'}.get(tiff[:2])
+    if endian is None:
+        return 1
+    try:
+        ifd_offset = struct.unpack(endian + 'I', tiff[4:8])[0]
+        count = struct.unpack(endian + 'H', tiff[ifd_offset:ifd_offset + 2])[0]
+        for i in range(count):
+            entry = ifd_offset + 2 + i * 12
+            tag, _, _, value = struct.unpack(endian + 'HHIH', tiff[entry:entry + 10])
+            if tag == EXIF_ORIENTATION_TAG:
+                return value if 1 <= value <= 8 else 1
+    except struct.error:
+        pass
+    return 1
+
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("truncated JPEG")
+    return data
+
+
+def _jpeg_info(f):
+    """Walks JPEG marker segments up to the first SOF; returns (width, height, orientation)."""
+    orientation = 1
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise ValueError("truncated JPEG: no SOF marker found")
+        if byte != b'\xff':
+            continue  # tolerate garbage between segments
+        marker = f.read(1)
+        while marker == b'\xff':  # fill bytes
+            marker = f.read(1)
+        if not marker:
+            raise ValueError("truncated JPEG")
+        marker = marker[0]
+        if marker in STANDALONE_MARKERS:
+            continue
+        if marker in (0xd9, 0xda):
+            raise ValueError("reached image data before SOF marker")
+        length = struct.unpack('>H', _read_exact(f, 2))[0]
+        if length < 2:
+            # The length counts its own two bytes; seeking back would loop forever.
+            raise ValueError(f"invalid segment length {length}")
+        if marker in SOF_MARKERS:
+            _, height, width = struct.unpack('>BHH', _read_exact(f, 5))
+            return width, height, orientation
+        if marker == 0xe1 and orientation == 1:
+            orientation = _exif_orientation(_read_exact(f, length - 2))
+        else:
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+def _webp_info(f):
+    header = f.read(30)
+    chunk = header[12:16]
+    if chunk == b'VP8X':
+        width = int.from_bytes(header[24:27], 'little') + 1
+        height = int.from_bytes(header[27:30], 'little') + 1
+    elif chunk == b'VP8L':
+        bits = int.from_bytes(header[21:25], 'little')
+        width = (bits & 0x3fff) + 1
+        height = ((bits >> 14) & 0x3fff) + 1
+    elif chunk == b'VP8 ':
+        width = struct.unpack('<H', header[26:28])[0] & 0x3fff
+        height = struct.unpack('<H', header[28:30])[0] & 0x3fff
+    else:
+        raise ValueError(f"unknown WebP chunk {chunk!r}")
+    return width, height
+
+
+def get_image_info(f):
     """
-    Analyzes JPEG data to find width and height.
+    Reads the dimensions and MIME type from an image file's header without
+    loading the whole file.
+
+    Supports JPEG (all SOF variants, with EXIF orientation applied so the
+    returned size is the displayed one), PNG and WebP.
+
+    Returns:
+        tuple: (mime_type, width, height)
     """
-    size = len(data)
-    height = 0
-    width = 0
-    content_type = ''
-
-    # handle JPEGs
-    if (size >= 2) and data.startswith(b'\xff\xd8'):
-        content_type = 'image/jpeg'
+    f.seek(0)
+    signature = f.read(16)
+    if signature.startswith(b'\xff\xd8'):
+        width, height, orientation = _jpeg_info(f)
+        if orientation >= 5:  # 5-8 rotate by 90 degrees
+            width, height = height, width
+        return 'image/jpeg', width, height
+    if signature.startswith(b'\x89PNG\r\n\x1a\n'):
+        f.seek(16)
+        width, height = struct.unpack('>II', f.read(8))
+        return 'image/png', width, height
+    if signature[:4] == b'RIFF' and signature[8:12] == b'WEBP':
+        f.seek(0)
+        width, height = _webp_info(f)
+        return 'image/webp', width, height
+    raise ValueError("unsupported image format")
+
+
+def convert_to_svg(image_path, svg_path=None):
+    """
+    Wraps an image in an SVG as a base64 data URL.
+
+    The source is encoded chunk by chunk straight into the output file, so
+    memory use stays at one chunk whatever the image size.
+
+    Returns:
+        str: Path of the written SVG, or None on failure.
+    """
+    if not os.path.exists(image_path):
+        print(f"Error: File not found: {image_path}")
+        return None
+
+    print(f"Processing: {image_path}")
+    svg_path = svg_path or os.path.splitext(image_path)[0] + ".svg"
+
+    with open(image_path, "rb") as image_file:
         try:
-            index = 0
-            size = 2
-            ftype = 0
-            while not 0xc0 <= ftype <= 0xcf or ftype in (0xc4, 0xc8, 0xcc):
-                index += size
-                ftype = data[index + 1]
-                length = data[index + 2] * 256 + data[index + 3]
-                size = length + 2
-            height = data[index + 5] * 256 + data[index + 6]
-            width = data[index + 7] * 256 + data[index + 8]
-        except Exception:
-            pass
-    
-    return width, height
+            mime_type, width, height = get_image_info(image_file)
+            print(f"Detected dimensions: {width}x{height}")
+        except (ValueError, struct.error) as e:
+            print(f"Error: Could not read image header of {image_path}: {e}")
+            return None
 
-def convert_to_svg(jpg_path):
-    if not os.path.exists(jpg_path):
-        print(f"Error: File not found: {jpg_path}")
-        return
-
-    print(f"Processing: {jpg_path}")
-    
-    with open(jpg_path, "rb") as image_file:
-        data = image_file.read()
-        encoded_string = base64.b64encode(data).decode('utf-8')
-        
-    width, height = get_image_info(data)
-    
-    # Fallback if detection fails
-    if width == 0 or height == 0:
-        print("Warning: Could not detect dimensions, using default 500x500")
-        width, height = 500, 500
-    else:
-        print(f"Detected dimensions: {width}x{height}")
-    
-    # Create SVG content
-    svg_content = f'''<svg version="1.1" id="Layer_1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px"
+        image_file.seek(0)
+        tmp_path = svg_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f'''<svg version="1.1" id="Layer_1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px"
 \t viewBox="0 0 {width} {height}" style="enable-background:new 0 0 {width} {height};" xml:space="preserve">
-<image style="overflow:visible;" width="{width}" height="{height}" xlink:href="data:image/jpeg;base64,{encoded_string}" />
-</svg>'''
-
-    # Output path
-    svg_path = os.path.splitext(jpg_path)[0] + ".svg"
-    
-    with open(svg_path, "w", encoding="utf-8") as f:
-        f.write(svg_content)
-    
+<image style="overflow:visible;" width="{width}" height="{height}" xlink:href="data:{mime_type};base64,''')
+            for chunk in iter(lambda: image_file.read(CHUNK_SIZE), b''):
+                f.write(base64.b64encode(chunk).decode('ascii'))
+            f.write('" />\n</svg>')
+        os.replace(tmp_path, svg_path)
+
     print(f"Success! SVG saved to: {svg_path}")
+    return svg_path
+
+
+def collect_images(paths, recursive=False):
+    """Expands files and directories on the command line into image paths."""
+    images = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                images += [os.path.join(root, f) for f in sorted(files) if f.lower().endswith(IMAGE_EXTENSIONS)]
+                if not recursive:
+                    break
+        else:
+            images.append(path)
+    return images
+
 
 if __name__ == "__main__":
-    target_file = r"G:\薪火年度报告\xinhuo11\public\454121742827fc273ed95fcd149e0572.jpg"
-    convert_to_svg(target_file)
+    parser = argparse.ArgumentParser(description="Wrap JPEG/PNG/WebP images in SVG files.")
+    parser.add_argument("paths", nargs="+", help="image files or directories")
+    parser.add_argument("-r", "--recursive", action="store_true", help="descend into subdirectories")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    images = collect_images(args.paths, args.recursive)
+    if len(images) == 1:
+        results = [convert_to_svg(images[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(convert_to_svg, images))
+    failed = sum(1 for r in results if r is None)
+    print(f"Converted {len(results) - failed} of {len(results)} images")
+    sys.exit(1 if failed else 0)
@@ -1,85 +1,315 @@
+import argparse
+import json
 import os
+import re
 import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageOps
 
-def organize_images():
-    source_dir = 'public/image/test'
-    target_dir = 'public/image'
-    images_ts_path = 'images.ts'
-    
-    if not os.path.exists(source_dir):
-        print(f"Directory not found: {source_dir}")
-        return
-
-    # Get all files in source directory
-    files = [f for f in os.listdir(source_dir) if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
-    files.sort() # Sort by name (timestamp)
-
-    new_image_paths = []
-    
-    print(f"Found {len(files)} images in {source_dir}")
-    
-    for i, filename in enumerate(files):
-        # Create new filename: film_01.jpg, film_02.jpg, etc.
-        # Pad with leading zero if needed
-        extension = os.path.splitext(filename)[1]
-        new_filename = f"film_{i+1:02d}{extension}"
-        
-        old_path = os.path.join(source_dir, filename)
-        new_path = os.path.join(target_dir, new_filename)
-        
-        # Check if target file exists, if so, maybe skip or overwrite? 
-        # Since user said "rename and move", I'll assume overwriting is fine or just proceed.
-        # But to be safe against collisions with existing 'film_xx.jpg', I should check.
-        # However, for this task I will assume the target names are free or can be overwritten as per "rename" instruction.
-        
-        shutil.move(old_path, new_path)
-        print(f"Moved {filename} -> {new_filename}")
-        
-        new_image_paths.append(f'"image/{new_filename}"')
-
-    # Remove the test directory
-    try:
-        os.rmdir(source_dir)
-        print(f"Removed directory: {source_dir}")
-    except OSError as e:
-        print(f"Error removing directory {source_dir}: {e}")
-
-    # Update images.ts
-    update_images_ts(images_ts_path, new_image_paths)
-
-def update_images_ts(file_path, new_paths):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    new_lines = []
-    in_film_images = False
-    film_images_updated = False
-    
-    for line in lines:
-        if 'export const FILM_IMAGES: string[] = [' in line:
-            new_lines.append(line)
-            in_film_images = True
-            # Write new images
-            for path in new_paths:
-                new_lines.append(f'  {path},\n')
-            film_images_updated = True
+from compress_images import file_hash, load_manifest, save_manifest, public_url
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+# Perceptual hash: a 64-bit difference hash over a 9x8 grayscale thumbnail.
+DHASH_SIZE = 8
+# Two photos whose hashes differ in at most this many bits count as the same
+# shot (re-encodes, resizes, light edits). Must stay below DHASH_BANDS so the
+# band index below finds every candidate pair.
+NEAR_DUPLICATE_BITS = 5
+DHASH_BANDS = 8
+# Content-hash filenames: this many hex digits of the SHA-256.
+NAME_HASH_LENGTH = 16
+
+PAGE_ENTRY_RE = re.compile(r'^\s*(\d+):\s*"([^"]+)",?\s*(?://\s*(.*))?$')
+FILM_ENTRY_RE = re.compile(r'^\s*"([^"]+)",?\s*$')
+
+
+def _fingerprint(path):
+    """
+    SHA-256, difference hash and displayed size of one image. Runs in a
+    worker process.
+    """
+    with Image.open(path) as img:
+        width, height = img.size
+        if img.getexif().get(0x0112) in (5, 6, 7, 8):  # rotated by 90 degrees
+            width, height = height, width
+        # Let the JPEG decoder downscale; the hash only needs a thumbnail.
+        img.draft('L', (DHASH_SIZE * 8, DHASH_SIZE * 8))
+        gray = ImageOps.exif_transpose(img).convert('L')
+        pixels = gray.resize((DHASH_SIZE + 1, DHASH_SIZE), Image.LANCZOS).tobytes()
+    bits = 0
+    for row in range(DHASH_SIZE):
+        for col in range(DHASH_SIZE):
+            left = pixels[row * (DHASH_SIZE + 1) + col]
+            bits = (bits << 1) | (left > pixels[row * (DHASH_SIZE + 1) + col + 1])
+    return {
+        "sha256": file_hash(path),
+        "dhash": f"{bits:016x}",
+        "width": width,
+        "height": height,
+    }
+
+
+class NearDuplicateIndex:
+    """
+    Finds images whose dHash is within NEAR_DUPLICATE_BITS of a known one.
+
+    The 64-bit hash is split into DHASH_BANDS bands; two hashes that differ in
+    fewer bits than there are bands agree exactly on at least one band, so only
+    images sharing a band value need a full comparison.
+    """
+
+    def __init__(self):
+        self.bands = {}
+
+    def _keys(self, bits):
+        width = 64 // DHASH_BANDS
+        return [(i, (bits >> (i * width)) & ((1 << width) - 1)) for i in range(DHASH_BANDS)]
+
+    def add(self, url, dhash):
+        bits = int(dhash, 16)
+        for key in self._keys(bits):
+            self.bands.setdefault(key, []).append((bits, url))
+
+    def find(self, dhash):
+        """URL of a near-duplicate, or None."""
+        bits = int(dhash, 16)
+        for key in self._keys(bits):
+            for other, url in self.bands.get(key, ()):
+                if bin(bits ^ other).count('1') <= NEAR_DUPLICATE_BITS:
+                    return url
+        return None
+
+
+def content_name(digest, source_path):
+    """Stable file name derived from the content, e.g. 3fa2c1d09b7e4a55.jpg."""
+    ext = os.path.splitext(source_path)[1].lower()
+    return digest[:NAME_HASH_LENGTH] + ('.jpg' if ext == '.jpeg' else ext)
+
+
+def parse_images_ts(path):
+    """PAGE_IMAGES, their trailing comments and FILM_IMAGES from a hand-written images.ts."""
+    pages, notes, film = {}, {}, []
+    section = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if 'export const PAGE_IMAGES' in line:
+                section = 'pages'
+            elif 'export const FILM_IMAGES' in line:
+                section = 'film'
+            elif line.strip().startswith(('}', ']')):
+                section = None
+            elif section == 'pages' and PAGE_ENTRY_RE.match(line):
+                page, url, note = PAGE_ENTRY_RE.match(line).groups()
+                pages[page] = url
+                if note:
+                    notes[page] = note.strip()
+            elif section == 'film' and FILM_ENTRY_RE.match(line):
+                film.append(FILM_ENTRY_RE.match(line).group(1))
+    return {"pages": pages, "page_notes": notes, "film": film, "images": {}}
+
+
+def write_images_ts(path, manifest):
+    lines = [
+        "// Generated from image-manifest.json by organize_images.py; edit the manifest instead.",
+        "// 页面图片配置",
+        "// 格式: { pageId: \"图片地址\" }",
+        "export const PAGE_IMAGES: Record<number, string> = {",
+    ]
+    for page in sorted(manifest["pages"], key=int):
+        line = f"  {page}: {json.dumps(manifest['pages'][page], ensure_ascii=False)},"
+        note = manifest["page_notes"].get(page)
+        lines.append(f"{line} // {note}" if note else line)
+    lines += ["};", "", "", "// 胶片图片配置 (Page 24)", "export const FILM_IMAGES: string[] = ["]
+    lines += [f"  {json.dumps(url, ensure_ascii=False)}," for url in manifest["film"]]
+    lines.append("];")
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
+
+
+def _collect(directory, recursive=True):
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        found += [os.path.join(root, f) for f in sorted(files) if f.lower().endswith(IMAGE_EXTENSIONS)]
+        if not recursive:
+            break
+    return found
+
+
+def _fingerprint_all(paths, cache, workers):
+    """
+    Fingerprints for paths, reusing cache entries whose size and mtime still
+    match; only new or changed files are decoded.
+    """
+    results = {}
+    jobs = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path in paths:
+            stat = os.stat(path)
+            key = os.path.abspath(path)
+            entry = cache.get(key)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                results[path] = entry["fingerprint"]
+            else:
+                jobs[pool.submit(_fingerprint, path)] = (path, key, stat)
+        for future, (path, key, stat) in jobs.items():
+            try:
+                results[path] = future.result()
+            except Exception as e:
+                print(f"Error reading {path}: {e}")
+                continue
+            cache[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "fingerprint": results[path]}
+    return results, len(jobs)
+
+
+def organize_images(source_dir='public/image/test', target_dir='public/image', images_ts_path='images.ts',
+                    manifest_path='image-manifest.json', cache_path='.ingest-cache.json',
+                    add_to_film=True, move=True, workers=None):
+    """
+    Ingests new photos into the site's image library.
+
+    Every incoming image is fingerprinted in parallel. Byte-identical copies
+    and perceptual near-duplicates of images already in the library (or
+    earlier in the same batch) are dropped; the rest are copied into
+    target_dir under a content-hash name, so a URL always means the same
+    bytes and can be cached as immutable. images.ts is then regenerated from
+    the manifest.
+
+    On the first run the manifest is bootstrapped from the current images.ts
+    and the files already in target_dir, which keep their names.
+
+    Args:
+        source_dir (str): Directory (searched recursively) with the photo dump.
+        target_dir (str): Library directory under the web root.
+        images_ts_path (str): Generated TS module with PAGE_IMAGES / FILM_IMAGES.
+        manifest_path (str): Library manifest; the source of truth for images.ts.
+        cache_path (str): Fingerprint cache keyed on path, size and mtime, so a
+            re-run over the same dump only decodes new files.
+        add_to_film (bool): Append ingested images to FILM_IMAGES.
+        move (bool): Delete files from source_dir once their bytes are in the
+            library (ingested after a verified copy, or exact duplicates), and
+            then any directories this leaves empty. The default source_dir is
+            under the web root, so whatever stays there ships with the build.
+        workers (int): Worker processes; defaults to the CPU count.
+
+    Returns:
+        dict: JSON-serializable report of ingested and dropped files.
+    """
+    started = time.perf_counter()
+    public_dir = os.path.dirname(os.path.normpath(target_dir)) or '.'
+    if os.path.exists(manifest_path):
+        manifest = load_manifest(manifest_path)
+    else:
+        print(f"Bootstrapping {manifest_path} from {images_ts_path}")
+        manifest = parse_images_ts(images_ts_path)
+    cache = load_manifest(cache_path)
+
+    # Files in the library that the manifest does not know yet (first run,
+    # or copied in by hand) are fingerprinted so new photos dedupe against them.
+    unknown = [p for p in _collect(target_dir, recursive=False)
+               if public_url(p, public_dir) not in manifest["images"]]
+    library, _ = _fingerprint_all(unknown, cache, workers)
+    for path, fingerprint in library.items():
+        manifest["images"][public_url(path, public_dir)] = dict(fingerprint, source=os.path.basename(path))
+
+    by_sha = {entry["sha256"]: url for url, entry in manifest["images"].items()}
+    near = NearDuplicateIndex()
+    for url, entry in manifest["images"].items():
+        near.add(url, entry["dhash"])
+
+    report = {"source_dir": source_dir, "ingested": [], "duplicates": [], "near_duplicates": []}
+    sources = _collect(source_dir) if os.path.exists(source_dir) else []
+    print(f"Found {len(sources)} images in {source_dir}")
+    fingerprints, decoded = _fingerprint_all(sources, cache, workers)
+
+    os.makedirs(target_dir, exist_ok=True)
+    for path in sources:
+        fingerprint = fingerprints.get(path)
+        if fingerprint is None:
             continue
-        
-        if in_film_images:
-            if '];' in line:
-                in_film_images = False
-                new_lines.append(line)
-            # Skip existing lines inside the array
+        if fingerprint["sha256"] in by_sha:
+            report["duplicates"].append({"file": path, "of": by_sha[fingerprint["sha256"]]})
+            if move:
+                os.remove(path)
             continue
-            
-        new_lines.append(line)
-    
-    if film_images_updated:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.writelines(new_lines)
-        print(f"Updated {file_path}")
-    else:
-        print("Could not find FILM_IMAGES array in images.ts")
+        similar = near.find(fingerprint["dhash"])
+        if similar is not None:
+            report["near_duplicates"].append({"file": path, "of": similar})
+            continue
+        target_path = os.path.join(target_dir, content_name(fingerprint["sha256"], path))
+        url = public_url(target_path, public_dir)
+        if not os.path.exists(target_path):
+            tmp_path = target_path + '.tmp'
+            shutil.copyfile(path, tmp_path)
+            if move and file_hash(tmp_path) != fingerprint["sha256"]:
+                os.remove(tmp_path)
+                print(f"Error copying {path}: the copy does not match the original; kept it")
+                continue
+            os.replace(tmp_path, target_path)
+        if move:
+            os.remove(path)
+        manifest["images"][url] = dict(fingerprint, source=os.path.basename(path))
+        by_sha[fingerprint["sha256"]] = url
+        near.add(url, fingerprint["dhash"])
+        if add_to_film:
+            manifest["film"].append(url)
+        report["ingested"].append({"file": path, "url": url})
+        print(f"Ingested {path} -> {url}")
+
+    if move and os.path.exists(source_dir):
+        for root, _, _ in os.walk(source_dir, topdown=False):
+            try:
+                os.rmdir(root)
+            except OSError:
+                pass  # not empty
+    left = _collect(source_dir) if os.path.exists(source_dir) else []
+    if left:
+        print(f"{len(left)} images left in {source_dir} (near-duplicates, unreadable or kept); "
+              f"remove them if it is under the web root")
+
+    save_manifest(manifest_path, manifest)
+    # Drop cache entries for files that no longer exist (moved or deleted).
+    save_manifest(cache_path, {k: v for k, v in cache.items() if os.path.exists(k)})
+    write_images_ts(images_ts_path, manifest)
+    report["totals"] = {
+        "found": len(sources),
+        "decoded": decoded,
+        "ingested": len(report["ingested"]),
+        "duplicates": len(report["duplicates"]),
+        "near_duplicates": len(report["near_duplicates"]),
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+    print(f"Ingested {len(report['ingested'])} of {len(sources)} images "
+          f"({len(report['duplicates'])} duplicates, {len(report['near_duplicates'])} near-duplicates, "
+          f"{decoded} decoded); updated {images_ts_path}")
+    return report
+
 
 if __name__ == "__main__":
-    organize_images()
+    parser = argparse.ArgumentParser(description="Ingest new photos into public/image and regenerate images.ts.")
+    parser.add_argument("source_dir", nargs="?", default="public/image/test")
+    parser.add_argument("--target-dir", default="public/image")
+    parser.add_argument("--images-ts", default="images.ts")
+    parser.add_argument("--manifest", default="image-manifest.json")
+    parser.add_argument("--cache", default=".ingest-cache.json")
+    parser.add_argument("--no-film", action="store_true", help="do not append ingested images to FILM_IMAGES")
+    parser.add_argument("--keep", action="store_true",
+                        help="leave ingested files in the source directory (under the web root by default)")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--report", help="write the JSON report here ('-' for stdout)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.images_ts) and not os.path.exists(args.manifest):
+        print(f"File not found: {args.images_ts}")
+        sys.exit(1)
+    report = organize_images(args.source_dir, args.target_dir, args.images_ts, args.manifest, args.cache,
+                             not args.no_film, not args.keep, args.workers)
+    if args.report == '-':
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
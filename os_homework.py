@@ -1,11 +1,41 @@
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+import functools
+import json
+import mmap
+import os
+import re
+import struct
 import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+try:
+    import tkinter as tk
+    from tkinter import ttk, scrolledtext, messagebox
+except ImportError:  # 没有 tkinter 时仍可使用文件系统核心（如基准测试）
+    tk = None
 
 # -------------- 模拟文件系统核心--------------
 BLOCK_SIZE = 4096
 TOTAL_BLOCKS = 1024
 INODE_COUNT = 128
+# 单个目录哈希桶数上限（每桶一块）
+MAX_DIR_BUCKETS = 1024
+# 磁盘镜像布局：块0为超级块，随后是两个检查点槽、元数据日志区，再往后是数据块
+SUPERBLOCK_MAGIC = b"SIMFS002"
+SUPERBLOCK_FORMAT = "<8sIIIIII"  # magic, 块大小, 总块数, i节点数, 每槽块数, 日志起始块, 日志块数
+CHECKPOINT_MAGIC = b"SIMCKPT1"
+CHECKPOINT_FORMAT = "<8sQII"  # magic, 已包含的最后事务序号, 长度, crc32
+JOURNAL_RECORD_FORMAT = "<IIQ"  # 长度, crc32, 事务序号
+JOURNAL_MIN_BLOCKS = 16
+# 检查点槽按每个i节点预留的字节数分配（含目录项）
+META_BYTES_PER_INODE = 128
+# 图形界面使用的磁盘镜像文件
+DISK_IMAGE = "simfs.img"
+GUI_CACHE_BLOCKS = 256
+# 设置该环境变量后，图形界面把命令行执行的命令逐行追加到这个文件，供 fs_bench.py 回放
+TRACE_ENV = "SIMFS_TRACE"
+# 目录树每次展开/加载更多时插入的节点数
+TREE_PAGE_SIZE = 500
 
 class Inode:
     def __init__(self, inode_id):
@@ -15,107 +45,1063 @@ class Inode:
         self.blocks = []
         self.parent = None
 
+# 查找“未满”字节（至少有一个空闲块）
+_NOT_FULL_BYTE = re.compile(b"[^\xff]")
+
+class BlockAllocator:
+    """
+    位图空闲块分配器：每块占1位（1=已占用），打包在 bytearray 中。
+
+    维护空闲块计数和 next-fit 提示位置，分配从上次结束处继续向后找，
+    整字节（8块）全满时一次跳过，因此连续分配均摊 O(1)。
+    """
+
+    def __init__(self, total_blocks):
+        self.total_blocks = total_blocks
+        self.bitmap = bytearray((total_blocks + 7) // 8)
+        # 末尾不存在的块标记为已占用，避免被分配
+        for i in range(total_blocks, len(self.bitmap) * 8):
+            self.bitmap[i >> 3] |= 1 << (i & 7)
+        self.free_count = total_blocks
+        self.hint = 0
+
+    def is_free(self, block_id):
+        return not self.bitmap[block_id >> 3] & (1 << (block_id & 7))
+
+    def _find_free(self, start):
+        """从 start 开始（到末尾后回绕）找第一个空闲块，找不到返回 None"""
+        for lo, hi in ((start, self.total_blocks), (0, start)):
+            i = lo
+            while i < hi:
+                if i & 7 == 0:
+                    m = _NOT_FULL_BYTE.search(self.bitmap, i >> 3, (hi + 7) >> 3)
+                    if m is None:
+                        break
+                    i = max(i, m.start() << 3)
+                if i < hi and self.is_free(i):
+                    return i
+                i += 1
+        return None
+
+    def mark_used(self, block_id, length=1):
+        for b in range(block_id, block_id + length):
+            self.bitmap[b >> 3] |= 1 << (b & 7)
+        self.free_count -= length
+
+    def free(self, block_id, length=1):
+        for b in range(block_id, block_id + length):
+            self.bitmap[b >> 3] &= ~(1 << (b & 7)) & 0xFF
+        self.free_count += length
+
+    def alloc(self):
+        """分配单个块"""
+        if self.free_count == 0:
+            raise Exception("磁盘空间不足")
+        block_id = self._find_free(self.hint)
+        self.mark_used(block_id)
+        self.hint = (block_id + 1) % self.total_blocks
+        return block_id
+
+    def alloc_extent(self, count, goal=None):
+        """
+        分配 count 个块，尽量连续。
+
+        goal 为期望的起始块（通常是文件末块之后），那里够用就直接接上；
+        否则先看提示位置之后的第一段空闲区，不够长再按字节对齐找一段
+        足够长的全空区间；仍找不到时从提示位置起逐段收集空闲块。
+        返回 [(起始块, 长度), ...]。
+        """
+        if count <= 0:
+            return []
+        if count > self.free_count:
+            raise Exception("磁盘空间不足")
+        if (goal is not None and goal + count <= self.total_blocks
+                and all(self.is_free(b) for b in range(goal, goal + count))):
+            self.mark_used(goal, count)
+            self.hint = (goal + count) % self.total_blocks
+            return [(goal, count)]
+        # next-fit：提示位置之后的第一段空闲区够长就直接用，不留空隙
+        start = self._find_free(self.hint)
+        if start + count <= self.total_blocks and all(self.is_free(b) for b in range(start, start + count)):
+            self.mark_used(start, count)
+            self.hint = (start + count) % self.total_blocks
+            return [(start, count)]
+        need_bytes = (count + 7) >> 3
+        run = re.compile(b"\x00{%d}" % need_bytes)
+        m = run.search(self.bitmap, self.hint >> 3) or run.search(self.bitmap)
+        if m is not None:
+            start = m.start() << 3
+            self.mark_used(start, count)
+            self.hint = (start + count) % self.total_blocks
+            return [(start, count)]
+        extents = []
+        remaining = count
+        pos = self.hint
+        while remaining:
+            start = self._find_free(pos)
+            length = 1
+            while (length < remaining and start + length < self.total_blocks
+                   and self.is_free(start + length)):
+                length += 1
+            self.mark_used(start, length)
+            extents.append((start, length))
+            remaining -= length
+            pos = (start + length) % self.total_blocks
+        self.hint = pos
+        return extents
+
+class OpenFile:
+    """打开文件表项：每个句柄有独立的读写位置"""
+    def __init__(self, inode_id, mode):
+        self.inode_id = inode_id
+        self.mode = mode
+        self.offset = 0
+
+class SimulatedCrash(Exception):
+    """崩溃注入触发的模拟掉电"""
+
+class BlockDevice:
+    """
+    块设备：整个磁盘是一段连续缓冲区。
+
+    默认是内存中的 bytearray；给出 path 时改为 mmap 磁盘镜像文件，
+    文件系统内容在多次运行之间保留。块通过 memoryview 切片访问，不复制。
+    """
+
+    def __init__(self, total_blocks, path=None):
+        self.total_blocks = total_blocks
+        self.path = path
+        size = total_blocks * BLOCK_SIZE
+        if path is None:
+            self._file = None
+            self.buf = bytearray(size)
+        else:
+            self._file = open(path, "r+b" if os.path.exists(path) else "w+b")
+            if os.path.getsize(path) < size:
+                self._file.truncate(size)
+            self.buf = mmap.mmap(self._file.fileno(), size)
+        self.view = memoryview(self.buf)
+        # 设备访问次数，用于衡量缓存效果
+        self.reads = 0
+        self.writes = 0
+        # 崩溃注入：再写这么多次后模拟掉电（最后一次只写入一半），之后的写全部失败
+        self.crash_after = None
+
+    def block(self, block_id):
+        """整块的 memoryview（零拷贝）"""
+        return self.read(block_id)
+
+    def read(self, block_id, offset=0, length=BLOCK_SIZE):
+        self.reads += 1
+        start = block_id * BLOCK_SIZE + offset
+        return self.view[start:start + length]
+
+    def write(self, block_id, data, offset=0):
+        if self.crash_after is not None:
+            if self.crash_after <= 0:
+                raise SimulatedCrash("设备已掉电")
+            self.crash_after -= 1
+            if self.crash_after == 0:
+                data = data[:len(data) // 2]
+        self.writes += 1
+        start = block_id * BLOCK_SIZE + offset
+        self.view[start:start + len(data)] = data
+        if self.crash_after == 0:
+            raise SimulatedCrash("模拟掉电")
+
+    def find(self, block_id, sub, start=0):
+        """在块内查找字节串，返回块内偏移或 -1"""
+        base = block_id * BLOCK_SIZE
+        pos = self.buf.find(sub, base + start, base + BLOCK_SIZE)
+        return pos - base if pos != -1 else -1
+
+    def flush(self, block_id=0, count=None):
+        """把 [block_id, block_id + count) 写回镜像文件，count 为 None 时写回全部"""
+        if self._file is None:
+            return
+        if count is None:
+            self.buf.flush()
+            return
+        start = block_id * BLOCK_SIZE
+        start -= start % mmap.ALLOCATIONGRANULARITY
+        self.buf.flush(start, (block_id + count) * BLOCK_SIZE - start)
+
+    def close(self):
+        self.flush()
+        self.view.release()
+        if self._file is not None:
+            self.buf.close()
+            self._file.close()
+
+class BufferCache:
+    """
+    块设备之上的 LRU 缓冲区缓存，接口与 BlockDevice 相同。
+
+    读未命中时把整块读入缓存；写只改缓存并标记为脏，在被淘汰或
+    flush() 时才写回设备。检测到顺序访问时，未命中会顺带预读后续
+    readahead 个块。命中/未命中/淘汰/写回/预读次数记在 stats 中。
+    """
+
+    def __init__(self, dev, capacity, readahead=8):
+        self.dev = dev
+        self.total_blocks = dev.total_blocks
+        self.capacity = max(1, capacity)
+        # 预读不能把刚读入的块挤出去
+        self.readahead = min(readahead, self.capacity - 1)
+        self.blocks = OrderedDict()  # 块号 -> bytearray，末尾为最近使用
+        self.dirty = set()
+        self.last_block = None
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "writebacks": 0, "readaheads": 0}
+
+    def _insert(self, block_id, data):
+        self.blocks[block_id] = data
+        while len(self.blocks) > self.capacity:
+            victim, buf = self.blocks.popitem(last=False)
+            self.stats["evictions"] += 1
+            if victim in self.dirty:
+                self.dirty.discard(victim)
+                self.dev.write(victim, buf)
+                self.stats["writebacks"] += 1
+
+    def _get(self, block_id, load=True):
+        sequential = self.last_block is not None and block_id == self.last_block + 1
+        self.last_block = block_id
+        buf = self.blocks.get(block_id)
+        if buf is not None:
+            self.stats["hits"] += 1
+            self.blocks.move_to_end(block_id)
+            return buf
+        self.stats["misses"] += 1
+        buf = bytearray(self.dev.block(block_id)) if load else bytearray(BLOCK_SIZE)
+        self._insert(block_id, buf)
+        if sequential and load:
+            for ahead in range(block_id + 1, min(block_id + 1 + self.readahead, self.total_blocks)):
+                if ahead not in self.blocks:
+                    self.stats["readaheads"] += 1
+                    self._insert(ahead, bytearray(self.dev.block(ahead)))
+            self.blocks.move_to_end(block_id)
+        return buf
+
+    def block(self, block_id):
+        return memoryview(self._get(block_id))
+
+    def read(self, block_id, offset=0, length=BLOCK_SIZE):
+        return memoryview(self._get(block_id))[offset:offset + length]
+
+    def write(self, block_id, data, offset=0):
+        # 整块覆盖时无需先从设备读出旧内容
+        whole = offset == 0 and len(data) == BLOCK_SIZE
+        buf = self._get(block_id, load=not whole)
+        buf[offset:offset + len(data)] = data
+        self.dirty.add(block_id)
+
+    def find(self, block_id, sub, start=0):
+        return self._get(block_id).find(sub, start)
+
+    def flush(self):
+        """写回全部脏块"""
+        for block_id in sorted(self.dirty):
+            self.dev.write(block_id, self.blocks[block_id])
+            self.stats["writebacks"] += 1
+        self.dirty.clear()
+        self.dev.flush()
+
+    def close(self):
+        self.flush()
+        self.blocks.clear()
+        self.dev.close()
+
+def to_extents(blocks):
+    """块号列表压缩为 [[起始块, 长度], ...]"""
+    extents = []
+    for b in blocks:
+        if extents and extents[-1][0] + extents[-1][1] == b:
+            extents[-1][1] += 1
+        else:
+            extents.append([b, 1])
+    return extents
+
+def valid_name(name):
+    """目录项存为 "name:inode\n"、按 splitlines() 解析，桶以 0 字节结尾，名称不能含 ":" 和控制字符"""
+    return bool(name) and name not in (".", "..") and ":" not in name and name.isprintable()
+
+def journaled(method):
+    """把一次文件系统操作包成一个元数据事务"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.transaction():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class SimFileSystem:
-    def __init__(self):
-        self.inodes = [Inode(i) for i in range(INODE_COUNT)]
-        self.free_blocks = [True] * TOTAL_BLOCKS
-        self.data_blocks = [b"" for _ in range(TOTAL_BLOCKS)]
-        self.inodes[0].type = 'dir'
-        self.inodes[0].parent = 0
+    def __init__(self, total_blocks=TOTAL_BLOCKS, inode_count=INODE_COUNT, image_path=None,
+                 cache_blocks=0):
+        """
+        image_path 为 None 时在内存中模拟；否则挂载该磁盘镜像（不存在或
+        未格式化时先格式化），几何参数以镜像超级块中记录的为准。
+        cache_blocks > 0 时在块设备之上加一层该容量的 LRU 缓冲区缓存。
+        """
+        superblock = None
+        if image_path is not None and os.path.exists(image_path):
+            superblock = self._read_superblock(image_path)
+            if superblock is not None:
+                total_blocks, inode_count = superblock[2], superblock[3]
+        self.total_blocks = total_blocks
+        self.inode_count = inode_count
+        self.inodes = [Inode(i) for i in range(inode_count)]
+        self.allocator = BlockAllocator(total_blocks)
+        self.device = BlockDevice(total_blocks, image_path)
+        self.dev = BufferCache(self.device, cache_blocks) if cache_blocks > 0 else self.device
+        # 布局：超级块 | 检查点槽A | 检查点槽B | 日志区 | 数据块
+        self.meta_blocks = -(-inode_count * META_BYTES_PER_INODE // BLOCK_SIZE)
+        self.meta_slots = (1, 1 + self.meta_blocks)
+        self.journal_start = 1 + 2 * self.meta_blocks
+        self.journal_blocks = max(JOURNAL_MIN_BLOCKS, total_blocks // 64)
+        self.data_start = self.journal_start + self.journal_blocks
+        if self.data_start >= total_blocks:
+            raise Exception("磁盘太小")
+        if superblock is not None:
+            self.meta_blocks, self.journal_start, self.journal_blocks = superblock[4:7]
+            self.meta_slots = (1, 1 + self.meta_blocks)
+            self.data_start = self.journal_start + self.journal_blocks
+        self.allocator.mark_used(0, self.data_start)
+        # 目录项缓存 (目录i节点ID, 名称) -> i节点ID
+        self.dcache = {}
+        # 打开文件表 句柄号 -> OpenFile
+        self.open_files = {}
+        self.next_fd = 3
         self.cwd = 0  # 当前工作目录i节点ID
+        # 变更通知：listener(事件, i节点ID, 父目录i节点ID, 名称)，
+        # 事件为 'create'/'delete'/'write'（write 时名称为 None）
+        self.listeners = []
+        # 事务：嵌套深度，本事务改过的i节点，以及按顺序记录的目录项增删；
+        # 回滚用：i节点第一次被改之前的状态、每次目录项增删之前的值，
+        # 以及提交后才发出的变更通知
+        self._txn_depth = 0
+        self._dirty_inodes = set()
+        self._dir_changes = []
+        self._undo = {}
+        self._dir_undo = []
+        self._pending_events = []
+        self.seq = 0             # 最后提交的事务序号
+        self.journal_pos = 0     # 日志区写入位置（字节）
+        self.checkpoint_slot = 1
+        self.replayed = 0        # 挂载时重放的事务数
+        if superblock is not None:
+            self._recover()
+        else:
+            self.inodes[0].type = 'dir'
+            self.inodes[0].parent = 0
+        # 空闲i节点栈（后进先出）：初始按编号从小到大弹出，之后最近释放的
+        # i节点最先被重新分配，不保证是编号最小的
+        self.free_inodes = [i for i in range(inode_count - 1, 0, -1) if self.inodes[i].type is None]
+        if superblock is None:
+            self._format()
+
+    # ---- 磁盘镜像：超级块、检查点与元数据日志 ----
+    @staticmethod
+    def _read_superblock(path):
+        with open(path, "rb") as f:
+            raw = f.read(struct.calcsize(SUPERBLOCK_FORMAT))
+        if len(raw) < struct.calcsize(SUPERBLOCK_FORMAT) or not raw.strip(b"\x00"):
+            return None  # 新文件或全零，需要格式化
+        fields = struct.unpack(SUPERBLOCK_FORMAT, raw)
+        if fields[0] != SUPERBLOCK_MAGIC or fields[1] != BLOCK_SIZE:
+            raise Exception("无法识别的磁盘镜像")
+        return fields
+
+    def _format(self):
+        self.device.write(0, struct.pack(SUPERBLOCK_FORMAT, SUPERBLOCK_MAGIC, BLOCK_SIZE, self.total_blocks,
+                                         self.inode_count, self.meta_blocks, self.journal_start,
+                                         self.journal_blocks))
+        self.checkpoint()
+
+    def _read_bytes(self, offset, length):
+        """按字节偏移直接读设备（元数据与日志不经过缓存）"""
+        parts = []
+        while length > 0:
+            block_id, block_offset = divmod(offset, BLOCK_SIZE)
+            n = min(BLOCK_SIZE - block_offset, length)
+            parts.append(self.device.read(block_id, block_offset, n))
+            offset += n
+            length -= n
+        return b"".join(parts)
+
+    def _write_bytes(self, offset, data):
+        src = memoryview(data)
+        pos = 0
+        while pos < len(data):
+            block_id, block_offset = divmod(offset + pos, BLOCK_SIZE)
+            n = min(BLOCK_SIZE - block_offset, len(data) - pos)
+            self.device.write(block_id, src[pos:pos + n], block_offset)
+            pos += n
+
+    def cache_stats(self):
+        """缓存命中等计数以及设备实际读写次数"""
+        stats = dict(self.dev.stats) if isinstance(self.dev, BufferCache) else {}
+        stats["device_reads"] = self.device.reads
+        stats["device_writes"] = self.device.writes
+        return stats
+
+    def _inode_record(self, inode_id):
+        i = self.inodes[inode_id]
+        return None if i.type is None else [i.type, i.size, i.parent, to_extents(i.blocks)]
+
+    def checkpoint(self):
+        """
+        把完整元数据（i节点表和全部目录项）写入另一个检查点槽，然后
+        清空日志。两个槽轮流使用，写到一半崩溃时旧槽仍然有效。
+        """
+        self.dev.flush()
+        dirs = {i.inode_id: self.ls(i.inode_id) for i in self.inodes if i.type == 'dir'}
+        inodes = {i.inode_id: self._inode_record(i.inode_id) for i in self.inodes if i.type is not None}
+        payload = zlib.compress(json.dumps({"inodes": inodes, "dirs": dirs},
+                                           separators=(",", ":")).encode())
+        header = struct.pack(CHECKPOINT_FORMAT, CHECKPOINT_MAGIC, self.seq, len(payload), zlib.crc32(payload))
+        if len(header) + len(payload) > self.meta_blocks * BLOCK_SIZE:
+            raise Exception("元数据区空间不足")
+        self.checkpoint_slot = 1 - self.checkpoint_slot
+        slot_start = self.meta_slots[self.checkpoint_slot] * BLOCK_SIZE
+        self._write_bytes(slot_start, header + payload)
+        self.device.flush()
+        # 检查点落盘后日志才可以丢弃
+        self._write_bytes(self.journal_start * BLOCK_SIZE, bytes(struct.calcsize(JOURNAL_RECORD_FORMAT)))
+        self.device.flush()
+        self.journal_pos = 0
+
+    def _read_checkpoint(self, slot):
+        start = self.meta_slots[slot] * BLOCK_SIZE
+        header_size = struct.calcsize(CHECKPOINT_FORMAT)
+        magic, seq, length, crc = struct.unpack(CHECKPOINT_FORMAT, self._read_bytes(start, header_size))
+        if magic != CHECKPOINT_MAGIC or length > self.meta_blocks * BLOCK_SIZE - header_size:
+            return None
+        payload = self._read_bytes(start + header_size, length)
+        if zlib.crc32(payload) != crc:
+            return None
+        return seq, json.loads(zlib.decompress(payload))
+
+    def _journal_records(self):
+        """按顺序读出检查点之后已提交的日志记录，遇到无效记录即停止"""
+        header_size = struct.calcsize(JOURNAL_RECORD_FORMAT)
+        limit = self.journal_blocks * BLOCK_SIZE
+        pos = 0
+        expected = self.seq + 1
+        while pos + header_size <= limit:
+            length, crc, seq = struct.unpack(
+                JOURNAL_RECORD_FORMAT, self._read_bytes(self.journal_start * BLOCK_SIZE + pos, header_size))
+            if length == 0 or seq != expected or pos + header_size + length > limit:
+                break
+            payload = self._read_bytes(self.journal_start * BLOCK_SIZE + pos + header_size, length)
+            if zlib.crc32(payload) != crc:
+                break  # 提交时写了一半
+            yield json.loads(payload)
+            pos += header_size + length
+            expected += 1
+
+    def _recover(self):
+        """
+        挂载：取序号较新的有效检查点，重放其后的日志，再按恢复出的
+        元数据重写目录块（覆盖未提交事务留下的半截修改），最后做一次
+        新检查点。耗时与日志长度和元数据量成正比，不扫描数据块。
+        """
+        checkpoints = [(cp, slot) for slot in (0, 1) for cp in [self._read_checkpoint(slot)] if cp]
+        if not checkpoints:
+            raise Exception("检查点损坏，无法挂载")
+        (self.seq, state), self.checkpoint_slot = max(checkpoints, key=lambda c: c[0][0])
+        inodes = state["inodes"]
+        dirs = {int(dir_id): dict(entries) for dir_id, entries in state["dirs"].items()}
+        for record in self._journal_records():
+            inodes.update(record["inodes"])
+            for dir_id, name, inode_id in record["dirs"]:
+                if inode_id is None:
+                    dirs.setdefault(dir_id, {}).pop(name, None)
+                else:
+                    dirs.setdefault(dir_id, {})[name] = inode_id
+            self.seq = record["seq"]
+            self.replayed += 1
+        for inode_id, rec in inodes.items():
+            if rec is None:
+                continue
+            inode = self.inodes[int(inode_id)]
+            inode.type, inode.size, inode.parent = rec[0], rec[1], rec[2]
+            for start_block, length in rec[3]:
+                inode.blocks.extend(range(start_block, start_block + length))
+                self.allocator.mark_used(start_block, length)
+        for inode in self.inodes:
+            if inode.type == 'dir' and inode.blocks:
+                buckets = {block_id: [] for block_id in inode.blocks}
+                for name, inode_id in dirs.get(inode.inode_id, {}).items():
+                    buckets[self._bucket_of(inode, name)].append((name, inode_id))
+                for block_id, bucket in buckets.items():
+                    self._write_bucket(block_id, bucket)
+        self.checkpoint()
+
+    @contextmanager
+    def transaction(self):
+        """
+        元数据事务：块内对i节点和目录块的修改在退出时作为一条日志记录
+        提交（写前日志，含修改后的完整i节点与依次增删的目录项）。可以嵌套，
+        只有最外层提交。操作中途失败（空间不足、已存在等）时整个事务回滚，
+        i节点、位图、空闲i节点表和目录块都恢复到事务开始前；模拟掉电
+        不回滚，留给挂载时的恢复处理。变更通知在提交之后才发出。
+        """
+        self._txn_depth += 1
+        try:
+            yield
+        except SimulatedCrash:
+            self._txn_depth -= 1
+            raise
+        except Exception:
+            self._txn_depth -= 1
+            if self._txn_depth == 0:
+                self._rollback()
+            raise
+        self._txn_depth -= 1
+        if self._txn_depth == 0:
+            self._commit()
+            events, self._pending_events = self._pending_events, []
+            for event in events:
+                for listener in self.listeners:
+                    listener(*event)
+
+    def _touch(self, inode_id):
+        """在修改i节点之前调用：记入本事务，并保存第一次修改前的状态"""
+        if inode_id not in self._dirty_inodes:
+            self._dirty_inodes.add(inode_id)
+            inode = self.inodes[inode_id]
+            self._undo[inode_id] = (inode.type, inode.size, inode.parent, list(inode.blocks))
+
+    def _notify(self, event, inode_id, parent_id, name=None):
+        if self._txn_depth:
+            self._pending_events.append((event, inode_id, parent_id, name))
+            return
+        for listener in self.listeners:
+            listener(event, inode_id, parent_id, name)
+
+    def _rollback(self):
+        """撤销本事务对内存元数据和目录块的全部修改，丢弃未发出的通知"""
+        # 先按当前（改过的）桶读出目录项，再倒序撤销本事务的增删
+        # 本事务中删除的目录已经是空的，回滚后也只需空桶
+        dirs = {dir_id: dict(self.ls(dir_id)) if self.inodes[dir_id].type == 'dir' else {}
+                for dir_id, rec in self._undo.items() if rec[0] == 'dir'}
+        for dir_id, name, previous in reversed(self._dir_undo):
+            if dir_id in dirs:
+                if previous is None:
+                    dirs[dir_id].pop(name, None)
+                else:
+                    dirs[dir_id][name] = previous
+            self.dcache.pop((dir_id, name), None)
+        free = set(self.free_inodes)
+        for inode_id, (type_, size, parent, blocks) in self._undo.items():
+            inode = self.inodes[inode_id]
+            old = set(blocks)
+            for block_id in inode.blocks:
+                if block_id not in old:
+                    self.free_block(block_id)
+            current = set(inode.blocks)
+            for block_id in blocks:
+                if block_id not in current:
+                    self.allocator.mark_used(block_id)
+            inode.type, inode.size, inode.parent, inode.blocks = type_, size, parent, blocks
+            if type_ is None and inode_id not in free:
+                self.free_inodes.append(inode_id)
+            elif type_ is not None and inode_id in free:
+                self.free_inodes.remove(inode_id)
+        for dir_id, entries in dirs.items():
+            dir_inode = self.inodes[dir_id]
+            buckets = {block_id: [] for block_id in dir_inode.blocks}
+            for name, inode_id in entries.items():
+                buckets[self._bucket_of(dir_inode, name)].append((name, inode_id))
+            for block_id, bucket in buckets.items():
+                self._write_bucket(block_id, bucket)
+        self._dirty_inodes = set()
+        self._dir_changes = []
+        self._undo = {}
+        self._dir_undo = []
+        self._pending_events = []
+
+    def _commit(self):
+        if not self._dirty_inodes:
+            self._undo = {}
+            self._dir_undo = []
+            return
+        inodes = {i: self._inode_record(i) for i in self._dirty_inodes}
+        record = {"seq": self.seq + 1, "inodes": inodes, "dirs": self._dir_changes}
+        self._dirty_inodes = set()
+        self._dir_changes = []
+        self._undo = {}
+        self._dir_undo = []
+        payload = json.dumps(record, separators=(",", ":")).encode()
+        header = struct.pack(JOURNAL_RECORD_FORMAT, len(payload), zlib.crc32(payload), self.seq + 1)
+        # 在记录后面再写一个空头，避免读到检查点之前的旧记录
+        entry = header + payload + bytes(len(header))
+        if self.journal_pos + len(entry) > self.journal_blocks * BLOCK_SIZE:
+            # 日志写满：当前内存状态整体做检查点，本事务随之落盘
+            self.seq += 1
+            self.checkpoint()
+            return
+        offset = self.journal_start * BLOCK_SIZE + self.journal_pos
+        self._write_bytes(offset, entry)
+        self.device.flush(offset // BLOCK_SIZE, -(-(offset + len(entry)) // BLOCK_SIZE) - offset // BLOCK_SIZE)
+        self.seq += 1
+        self.journal_pos += len(header) + len(payload)
+
+    def sync(self):
+        """写回缓存并做检查点"""
+        self.checkpoint()
+
+    def close(self):
+        self.sync()
+        self.dev.close()
 
     def alloc_block(self):
-        for i in range(TOTAL_BLOCKS):
-            if self.free_blocks[i]:
-                self.free_blocks[i] = False
-                return i
-        raise Exception("磁盘空间不足")
+        return self.allocator.alloc()
+
+    def alloc_blocks(self, count, goal=None):
+        """分配 count 个块（尽量连续），按顺序返回块号列表"""
+        blocks = []
+        for start, length in self.allocator.alloc_extent(count, goal):
+            blocks.extend(range(start, start + length))
+        return blocks
 
     def free_block(self, block_id):
-        if 0 <= block_id < TOTAL_BLOCKS:
-            self.free_blocks[block_id] = True
-            self.data_blocks[block_id] = b""
+        if 0 <= block_id < self.total_blocks and not self.allocator.is_free(block_id):
+            self.allocator.free(block_id)
 
-    def create(self, name, type_):
-        inode_id = None
-        for i in range(INODE_COUNT):
-            if self.inodes[i].type is None:
-                inode_id = i
-                break
-        if inode_id is None:
+    def alloc_inode(self):
+        if not self.free_inodes:
             raise Exception("i节点耗尽")
+        inode_id = self.free_inodes.pop()
+        self._touch(inode_id)
+        return inode_id
+
+    def free_inode(self, inode_id):
+        self._touch(inode_id)
+        inode = self.inodes[inode_id]
+        inode.type = None
+        inode.size = 0
+        inode.blocks = []
+        inode.parent = None
+        self.free_inodes.append(inode_id)
+
+    # ---- 目录索引：目录的数据块即哈希桶，目录项 name:inode 按 crc32(name) 分桶 ----
+    def _bucket_len(self, block_id):
+        """桶内已用字节数（目录块以 0 填充）"""
+        end = self.dev.find(block_id, b"\x00")
+        return BLOCK_SIZE if end == -1 else end
+
+    def _bucket_entries(self, block_id):
+        entries = []
+        data = bytes(self.dev.read(block_id, 0, self._bucket_len(block_id)))
+        for line in data.decode().splitlines():
+            if line:
+                name, inode_id = line.split(":")
+                entries.append((name, int(inode_id)))
+        return entries
+
+    def _write_bucket(self, block_id, entries):
+        data = "".join(f"{n}:{i}\n" for n, i in entries).encode()
+        self.dev.write(block_id, data.ljust(BLOCK_SIZE, b"\x00"))
+
+    def _find_entry(self, block_id, name):
+        """在桶中直接按字节查找 "name:"，避免解码整个块"""
+        key = f"{name}:".encode()
+        pos = self.dev.find(block_id, key)
+        while pos != -1:
+            if pos == 0 or self.dev.read(block_id, pos - 1, 1)[0] == 0x0A:
+                end = self.dev.find(block_id, b"\n", pos)
+                return int(bytes(self.dev.read(block_id, pos + len(key), end - pos - len(key))))
+            pos = self.dev.find(block_id, key, pos + 1)
+        return None
+
+    def _bucket_of(self, dir_inode, name):
+        return dir_inode.blocks[zlib.crc32(name.encode()) & (len(dir_inode.blocks) - 1)]
+
+    def _grow_dir(self, dir_inode):
+        """桶数翻倍并重新分布所有目录项"""
+        entries = [e for block_id in dir_inode.blocks for e in self._bucket_entries(block_id)]
+        dir_inode.blocks += self.alloc_blocks(len(dir_inode.blocks))
+        buckets = {block_id: [] for block_id in dir_inode.blocks}
+        for name, inode_id in entries:
+            buckets[self._bucket_of(dir_inode, name)].append((name, inode_id))
+        for block_id, bucket in buckets.items():
+            self._write_bucket(block_id, bucket)
+
+    def _dir_add(self, dir_id, name, inode_id):
+        dir_inode = self.inodes[dir_id]
+        self._touch(dir_id)
+        if not dir_inode.blocks:
+            dir_inode.blocks.append(self.alloc_block())
+            self._write_bucket(dir_inode.blocks[0], [])
+        record = f"{name}:{inode_id}\n".encode()
+        while self._bucket_len(self._bucket_of(dir_inode, name)) + len(record) > BLOCK_SIZE:
+            if len(dir_inode.blocks) >= MAX_DIR_BUCKETS:
+                raise Exception("目录已满")
+            self._grow_dir(dir_inode)
+        block_id = self._bucket_of(dir_inode, name)
+        self.dev.write(block_id, record, self._bucket_len(block_id))
+        self._dir_changes.append((dir_id, name, inode_id))
+        self._dir_undo.append((dir_id, name, None))
+        dir_inode.size += 1
+        self.dcache[(dir_id, name)] = inode_id
+
+    def _dir_remove(self, dir_id, name):
+        dir_inode = self.inodes[dir_id]
+        if not dir_inode.blocks:
+            return None
+        block_id = self._bucket_of(dir_inode, name)
+        entries = self._bucket_entries(block_id)
+        for n, inode_id in entries:
+            if n == name:
+                self._touch(dir_id)
+                self._write_bucket(block_id, [e for e in entries if e[0] != name])
+                self._dir_changes.append((dir_id, name, None))
+                self._dir_undo.append((dir_id, name, inode_id))
+                dir_inode.size -= 1
+                self.dcache.pop((dir_id, name), None)
+                return inode_id
+        return None
+
+    def lookup(self, dir_id, name):
+        """在目录 dir_id 中查找 name，返回i节点ID，不存在返回 None"""
+        key = (dir_id, name)
+        if key in self.dcache:
+            return self.dcache[key]
+        dir_inode = self.inodes[dir_id]
+        if dir_inode.type != 'dir':
+            raise Exception("不是目录")
+        if name == ".":
+            return dir_id
+        if name == "..":
+            return dir_inode.parent
+        if not dir_inode.blocks:
+            return None
+        inode_id = self._find_entry(self._bucket_of(dir_inode, name), name)
+        if inode_id is not None:
+            self.dcache[key] = inode_id
+        return inode_id
+
+    def resolve(self, path):
+        """解析路径（/a/b/c 或相对当前目录），返回i节点ID"""
+        inode_id = 0 if path.startswith("/") else self.cwd
+        for part in path.split("/"):
+            if not part:
+                continue
+            inode_id = self.lookup(inode_id, part)
+            if inode_id is None:
+                raise Exception(f"路径不存在：{path}")
+        return inode_id
+
+    def _split_path(self, path):
+        """返回 (父目录i节点ID, 名称)"""
+        parent_path, _, name = path.rstrip("/").rpartition("/")
+        if not valid_name(name):
+            raise Exception(f"非法名称：{name!r}")
+        if parent_path or path.startswith("/"):
+            parent_id = self.resolve(parent_path or "/")
+        else:
+            parent_id = self.cwd
+        if self.inodes[parent_id].type != 'dir':
+            raise Exception("不是目录")
+        return parent_id, name
+
+    def cd(self, path):
+        inode_id = self.resolve(path)
+        if self.inodes[inode_id].type != 'dir':
+            raise Exception("不是目录")
+        self.cwd = inode_id
+
+    def path_of(self, inode_id):
+        """i节点的绝对路径（沿 parent 回溯并在父目录中反查名称）"""
+        parts = []
+        while inode_id != 0:
+            parent_id = self.inodes[inode_id].parent
+            parts.append(next(n for n, i in self.ls(parent_id) if i == inode_id))
+            inode_id = parent_id
+        return "/" + "/".join(reversed(parts))
+
+    @journaled
+    def create(self, name, type_):
+        parent_id, name = self._split_path(name)
+        if self.lookup(parent_id, name) is not None:
+            raise Exception("文件/目录已存在")
+        inode_id = self.alloc_inode()
         inode = self.inodes[inode_id]
         inode.type = type_
-        inode.parent = self.cwd
-        parent_inode = self.inodes[self.cwd]
-        if not parent_inode.blocks:
-            parent_block = self.alloc_block()
-            parent_inode.blocks.append(parent_block)
-        block_id = parent_inode.blocks[0]
-        self.data_blocks[block_id] += f"{name}:{inode_id}\n".encode()
+        inode.parent = parent_id
+        self._dir_add(parent_id, name, inode_id)
+        self._notify('create', inode_id, parent_id, name)
         return inode_id
 
-    def ls(self):
-        cwd_inode = self.inodes[self.cwd]
-        if cwd_inode.type != 'dir':
+    def ls(self, inode_id=None):
+        dir_inode = self.inodes[self.cwd if inode_id is None else inode_id]
+        if dir_inode.type != 'dir':
             raise Exception("当前路径不是目录")
         content = []
-        for block_id in cwd_inode.blocks:
-            data = self.data_blocks[block_id].decode()
-            for line in data.splitlines():
-                if line:
-                    name, inode_id = line.split(":")
-                    content.append((name, int(inode_id)))
+        for block_id in dir_inode.blocks:
+            content.extend(self._bucket_entries(block_id))
         return content
 
+    @journaled
     def write_file(self, inode_id, data):
+        """用 data 替换文件全部内容；已有的块原地覆盖，只增删尾部的块"""
+        data_bytes = data.encode() if isinstance(data, str) else data
+        self.truncate(inode_id, len(data_bytes))
+        self.pwrite(inode_id, 0, data_bytes)
+
+    # ---- 按偏移读写 ----
+    def _file_inode(self, inode_id):
         inode = self.inodes[inode_id]
         if inode.type != 'file':
             raise Exception("不是文件")
-        for block_id in inode.blocks:
-            self.free_block(block_id)
-        inode.blocks = []
-        data_bytes = data.encode()
-        inode.size = len(data_bytes)
-        for i in range(0, len(data_bytes), BLOCK_SIZE):
-            block_data = data_bytes[i:i+BLOCK_SIZE]
-            block_id = self.alloc_block()
-            self.data_blocks[block_id] = block_data
-            inode.blocks.append(block_id)
+        return inode
+
+    def _zero_range(self, inode, start, end):
+        """把文件 [start, end) 区间清零（新分配的块里可能有旧数据）"""
+        while start < end:
+            index, offset = divmod(start, BLOCK_SIZE)
+            length = min(BLOCK_SIZE - offset, end - start)
+            self.dev.write(inode.blocks[index], bytes(length), offset)
+            start += length
+
+    def _ensure_blocks(self, inode, count):
+        """让文件至少拥有 count 个块，新块尽量紧跟在末块之后"""
+        missing = count - len(inode.blocks)
+        if missing > 0:
+            goal = inode.blocks[-1] + 1 if inode.blocks else None
+            inode.blocks += self.alloc_blocks(missing, goal)
+
+    def pread(self, inode_id, offset, length):
+        """从 offset 起读最多 length 字节，只访问涉及的块"""
+        inode = self._file_inode(inode_id)
+        if offset < 0:
+            raise Exception("偏移量无效")
+        end = min(inode.size, offset + length)
+        parts = []
+        pos = offset
+        while pos < end:
+            index, block_offset = divmod(pos, BLOCK_SIZE)
+            n = min(BLOCK_SIZE - block_offset, end - pos)
+            parts.append(self.dev.read(inode.blocks[index], block_offset, n))
+            pos += n
+        return b"".join(parts)
+
+    @journaled
+    def pwrite(self, inode_id, offset, data):
+        """从 offset 起写入 data，只分配和改写涉及的块；写在末尾之后时中间补零"""
+        inode = self._file_inode(inode_id)
+        if offset < 0:
+            raise Exception("偏移量无效")
+        data = data.encode() if isinstance(data, str) else data
+        end = offset + len(data)
+        if end > inode.size:
+            self._touch(inode_id)
+            self._ensure_blocks(inode, -(-end // BLOCK_SIZE))
+            if offset > inode.size:
+                self._zero_range(inode, inode.size, offset)
+        src = memoryview(data)
+        pos = offset
+        while pos < end:
+            index, block_offset = divmod(pos, BLOCK_SIZE)
+            n = min(BLOCK_SIZE - block_offset, end - pos)
+            self.dev.write(inode.blocks[index], src[pos - offset:pos - offset + n], block_offset)
+            pos += n
+        if end > inode.size:
+            inode.size = end
+        self._notify('write', inode_id, inode.parent)
+        return len(data)
+
+    def append(self, inode_id, data):
+        return self.pwrite(inode_id, self.inodes[inode_id].size, data)
+
+    @journaled
+    def truncate(self, inode_id, length):
+        """把文件截短（释放多余的块）或延长（补零）到 length 字节"""
+        inode = self._file_inode(inode_id)
+        if length < 0:
+            raise Exception("长度无效")
+        if length == inode.size:
+            return
+        self._touch(inode_id)
+        need = -(-length // BLOCK_SIZE)
+        if length < inode.size:
+            for block_id in inode.blocks[need:]:
+                self.free_block(block_id)
+            del inode.blocks[need:]
+        else:
+            self._ensure_blocks(inode, need)
+            self._zero_range(inode, inode.size, length)
+        inode.size = length
+        self._notify('write', inode_id, inode.parent)
+
+    # ---- 打开文件表 ----
+    @journaled
+    def open(self, path, mode='r'):
+        """
+        打开文件并返回句柄号。mode: 'r' 读, 'r+' 读写, 'w' 截断写, 'a' 追加；
+        'w'/'a' 在文件不存在时自动创建。
+        """
+        if mode not in ('r', 'r+', 'w', 'a'):
+            raise Exception(f"不支持的打开模式：{mode}")
+        try:
+            inode_id = self.resolve(path)
+        except Exception:
+            if mode not in ('w', 'a'):
+                raise
+            inode_id = self.create(path, 'file')
+        self._file_inode(inode_id)
+        if mode == 'w':
+            self.truncate(inode_id, 0)
+        fd = self.next_fd
+        self.next_fd += 1
+        self.open_files[fd] = OpenFile(inode_id, mode)
+        return fd
+
+    def _handle(self, fd):
+        if fd not in self.open_files:
+            raise Exception("无效的文件句柄")
+        return self.open_files[fd]
+
+    def read(self, fd, length=-1):
+        handle = self._handle(fd)
+        if length < 0:
+            length = self.inodes[handle.inode_id].size - handle.offset
+        data = self.pread(handle.inode_id, handle.offset, length)
+        handle.offset += len(data)
+        return data
+
+    def write(self, fd, data):
+        handle = self._handle(fd)
+        if handle.mode == 'r':
+            raise Exception("文件以只读方式打开")
+        if handle.mode == 'a':
+            handle.offset = self.inodes[handle.inode_id].size
+        n = self.pwrite(handle.inode_id, handle.offset, data)
+        handle.offset += n
+        return n
+
+    def seek(self, fd, offset, whence=0):
+        """whence: 0 文件开头, 1 当前位置, 2 文件末尾"""
+        handle = self._handle(fd)
+        base = (0, handle.offset, self.inodes[handle.inode_id].size)[whence]
+        if base + offset < 0:
+            raise Exception("偏移量无效")
+        handle.offset = base + offset
+        return handle.offset
+
+    def close_file(self, fd):
+        self._handle(fd)
+        del self.open_files[fd]
 
     def read_file(self, inode_id):
+        return self.read_bytes(inode_id).decode()
+
+    def read_views(self, inode_id):
+        """文件内容按块返回 memoryview 切片（零拷贝，末块截到文件长度）"""
         inode = self.inodes[inode_id]
-        if inode.type != 'file':
-            raise Exception("不是文件")
-        data = b""
+        remaining = inode.size
+        views = []
         for block_id in inode.blocks:
-            data += self.data_blocks[block_id]
-        return data.decode()
+            views.append(self.dev.read(block_id, 0, min(remaining, BLOCK_SIZE)))
+            remaining -= BLOCK_SIZE
+        return views
 
+    def read_bytes(self, inode_id):
+        if self.inodes[inode_id].type != 'file':
+            raise Exception("不是文件")
+        return b"".join(self.read_views(inode_id))
+
+    @journaled
     def delete(self, name):
-        target_inode_id = None
-        cwd_inode = self.inodes[self.cwd]
-        for block_id in cwd_inode.blocks:
-            data = self.data_blocks[block_id].decode()
-            lines = data.splitlines()
-            new_lines = []
-            for line in lines:
-                if line:
-                    n, i = line.split(":")
-                    if n == name:
-                        target_inode_id = int(i)
-                    else:
-                        new_lines.append(line)
-            self.data_blocks[block_id] = "\n".join(new_lines).encode()
+        parent_id, name = self._split_path(name)
+        target_inode_id = self.lookup(parent_id, name)
         if target_inode_id is None:
             raise Exception("文件/目录不存在")
         target_inode = self.inodes[target_inode_id]
+        if any(h.inode_id == target_inode_id for h in self.open_files.values()):
+            raise Exception("文件正在使用")
+        if target_inode.type == 'dir':
+            if target_inode.size:
+                raise Exception("目录非空")
+            p = self.cwd
+            while p != 0:
+                if p == target_inode_id:
+                    raise Exception("不能删除当前目录或其上级目录")
+                p = self.inodes[p].parent
+        self._dir_remove(parent_id, name)
         for block_id in target_inode.blocks:
             self.free_block(block_id)
-        target_inode.type = None
-        target_inode.size = 0
-        target_inode.blocks = []
-        target_inode.parent = None
+        self.free_inode(target_inode_id)
+        self._notify('delete', target_inode_id, parent_id, name)
+
+    def fsck(self):
+        """一致性检查，返回发现的问题列表（空表示一致）"""
+        problems = []
+        owner = {}
+        refs = {0: 1}
+        for inode in self.inodes:
+            if inode.type is None:
+                continue
+            inode_id = inode.inode_id
+            for block_id in inode.blocks:
+                if block_id < self.data_start or block_id >= self.total_blocks:
+                    problems.append(f"i节点{inode_id} 引用了非数据块 {block_id}")
+                elif block_id in owner:
+                    problems.append(f"块 {block_id} 同时属于i节点{owner[block_id]}和{inode_id}")
+                elif self.allocator.is_free(block_id):
+                    problems.append(f"块 {block_id} 被i节点{inode_id}使用但在位图中空闲")
+                owner.setdefault(block_id, inode_id)
+            if inode.size < 0:
+                problems.append(f"i节点{inode_id} 大小为负数 {inode.size}")
+            elif inode.type == 'file' and len(inode.blocks) != -(-inode.size // BLOCK_SIZE):
+                problems.append(f"i节点{inode_id} 大小 {inode.size} 与块数 {len(inode.blocks)} 不符")
+            if inode.type == 'dir':
+                entries = self.ls(inode_id)
+                if len(entries) != inode.size:
+                    problems.append(f"目录i节点{inode_id} 记录 {inode.size} 项，实际 {len(entries)} 项")
+                for name, child in entries:
+                    if not valid_name(name):
+                        problems.append(f"目录i节点{inode_id} 中有非法名称 {name!r}")
+                    if self.inodes[child].type is None or self.inodes[child].parent != inode_id:
+                        problems.append(f"目录i节点{inode_id} 中的 {name} 指向无效i节点{child}")
+                    refs[child] = refs.get(child, 0) + 1
+        for inode in self.inodes:
+            if inode.type is not None and refs.get(inode.inode_id) != 1:
+                problems.append(f"i节点{inode.inode_id} 被引用 {refs.get(inode.inode_id, 0)} 次")
+        expected_free = self.total_blocks - self.data_start - len(owner)
+        if self.allocator.free_count != expected_free:
+            problems.append(f"位图空闲块数 {self.allocator.free_count}，应为 {expected_free}")
+        return problems
+
+def execute_command(fs, line):
+    """
+    执行一条命令行命令，返回要记到日志里的结果；命令失败时抛出异常。
+    支持 mkdir/touch/rm/cd/append/truncate。
+    """
+    cmd = line.split()
+    if cmd[0] == "mkdir" and len(cmd) == 2:
+        fs.create(cmd[1], 'dir')
+    elif cmd[0] == "touch" and len(cmd) == 2:
+        fs.create(cmd[1], 'file')
+    elif cmd[0] == "rm" and len(cmd) == 2:
+        fs.delete(cmd[1])
+    elif cmd[0] == "append" and len(cmd) >= 3:
+        fs.append(_file_id(fs, cmd[1]), " ".join(cmd[2:]))
+        return f"命令执行成功：append {cmd[1]}"
+    elif cmd[0] == "truncate" and len(cmd) == 3:
+        fs.truncate(_file_id(fs, cmd[1]), int(cmd[2]))
+    elif cmd[0] == "cd" and len(cmd) == 2:
+        fs.cd(cmd[1])
+        return f"当前目录：{fs.path_of(fs.cwd)}"
+    else:
+        raise Exception("不支持的命令，支持：mkdir/rm/touch/cd/append/truncate")
+    return f"命令执行成功：{' '.join(cmd)}"
+
+def _file_id(fs, path):
+    inode_id = fs.resolve(path)
+    if fs.inodes[inode_id].type != 'file':
+        raise Exception("文件不存在")
+    return inode_id
 
 # -------------- tkinter 交互式界面 --------------
 class FileSystemGUI:
@@ -123,7 +1109,10 @@ class FileSystemGUI:
         self.root = root
         self.root.title("模拟文件系统")
         self.root.geometry("800x600")
-        self.fs = SimFileSystem()
+        self.fs = SimFileSystem(image_path=DISK_IMAGE, cache_blocks=GUI_CACHE_BLOCKS)
+        trace_path = os.environ.get(TRACE_ENV)
+        self.trace = open(trace_path, "a", encoding="utf-8") if trace_path else None
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # 1. 布局划分
         self.left_frame = ttk.Frame(root, width=200)
@@ -134,9 +1123,18 @@ class FileSystemGUI:
         # 2. 左侧：目录树
         self.tree_label = ttk.Label(self.left_frame, text="文件目录")
         self.tree_label.pack()
-        self.dir_tree = ttk.Treeview(self.left_frame)
+        self.dir_tree = ttk.Treeview(self.left_frame, columns=("size",))
+        self.dir_tree.heading("size", text="大小")
+        self.dir_tree.column("#0", width=160)
+        self.dir_tree.column("size", width=60, anchor=tk.E)
         self.dir_tree.pack(fill=tk.BOTH, expand=True)
-        self.dir_tree.insert("", "0", "root", text="/")
+        self.dir_tree.bind("<<TreeviewOpen>>", self._on_tree_open)
+        self.dir_tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        # 已展开过的目录 -> 尚未插入的目录项（分页加载）
+        self.tree_remaining = {}
+        # 文件系统变更先攒起来，空闲时一次性更新目录树
+        self.pending_changes = []
+        self.fs.listeners.append(self._on_fs_change)
         self.refresh_tree()
 
         # 3. 右侧：操作区
@@ -185,30 +1183,124 @@ class FileSystemGUI:
         self.cmd_entry.pack(fill=tk.X, pady=5)
         self.cmd_entry.bind("<Return>", self.run_command)  # 回车执行命令
 
+    def on_close(self):
+        """关闭窗口前把元数据写回磁盘镜像"""
+        self.fs.close()
+        if self.trace is not None:
+            self.trace.close()
+        self.root.destroy()
+
     def log(self, msg):
         """添加日志"""
         self.log_text.insert(tk.END, f"[{time.strftime('%H:%M:%S')}] {msg}\n")
         self.log_text.see(tk.END)
 
     def refresh_tree(self):
-        """刷新目录树"""
-        for item in self.dir_tree.get_children():
-            self.dir_tree.delete(item)
-        self.dir_tree.insert("", "0", "root", text="/")
-        self._add_tree_node("root", self.fs.cwd)
-
-    def _add_tree_node(self, parent_item, inode_id):
-        """递归添加目录节点"""
+        """重建目录树：只显示根目录，子目录在展开时才读取"""
+        self.dir_tree.delete(*self.dir_tree.get_children())
+        self.tree_remaining.clear()
+        self.dir_tree.insert("", tk.END, "0", text="/", open=True)
+        self._load_children(0)
+
+    # 目录树节点的 iid 就是i节点号；未展开的非空目录下挂一个占位子节点，
+    # 分页剩余的目录项用一个“更多”节点表示
+    def _insert_node(self, parent_id, name, inode_id, index="end"):
+        inode = self.fs.inodes[inode_id]
+        item = str(inode_id)
+        if self.dir_tree.exists(item):
+            return
+        if inode.type == 'dir':
+            self.dir_tree.insert(str(parent_id), index, item, text=name, values=(f"{inode.size} 项",))
+            if inode.size:
+                self.dir_tree.insert(item, tk.END, f"{item}.stub", text="…")
+        else:
+            self.dir_tree.insert(str(parent_id), index, item, text=name, values=(inode.size,))
+
+    def _load_children(self, dir_id):
+        """首次展开目录：读出目录项，插入第一页"""
+        if self.pending_changes:
+            self._apply_changes()  # 先处理读目录之前的变更，避免重复插入
         try:
-            items = self.fs.ls()
-            for name, iid in items:
-                if self.fs.inodes[iid].type == 'dir':
-                    node = self.dir_tree.insert(parent_item, tk.END, text=name)
-                    self._add_tree_node(node, iid)
-                else:
-                    self.dir_tree.insert(parent_item, tk.END, text=name)
+            entries = self.fs.ls(dir_id)
         except Exception as e:
-            self.log(f"刷新目录树失败：{e}")
+            self.log(f"读取目录失败：{e}")
+            return
+        item = str(dir_id)
+        if self.dir_tree.exists(f"{item}.stub"):
+            self.dir_tree.delete(f"{item}.stub")
+        inodes = self.fs.inodes
+        # 目录在前，同类按名称排序；pop() 从末尾取，所以倒序存放
+        entries.sort(key=lambda e: (inodes[e[1]].type == 'dir', e[0]), reverse=True)
+        self.tree_remaining[dir_id] = entries
+        self._load_more(dir_id)
+
+    def _load_more(self, dir_id):
+        item = str(dir_id)
+        more = f"{item}.more"
+        if self.dir_tree.exists(more):
+            self.dir_tree.delete(more)
+        remaining = self.tree_remaining[dir_id]
+        for _ in range(min(TREE_PAGE_SIZE, len(remaining))):
+            name, inode_id = remaining.pop()
+            self._insert_node(dir_id, name, inode_id)
+        if remaining:
+            self.dir_tree.insert(item, tk.END, more, text=f"… 还有 {len(remaining)} 项，点击加载")
+
+    def _on_tree_open(self, event):
+        item = self.dir_tree.focus()
+        if item.isdigit() and int(item) not in self.tree_remaining:
+            self._load_children(int(item))
+
+    def _on_tree_select(self, event):
+        for item in self.dir_tree.selection():
+            if item.endswith(".more"):
+                self._load_more(int(item.split(".")[0]))
+
+    def _on_fs_change(self, event, inode_id, parent_id, name):
+        if not self.pending_changes:
+            self.root.after_idle(self._apply_changes)
+        self.pending_changes.append((event, inode_id, parent_id, name))
+
+    def _apply_changes(self):
+        """把攒下的变更通知一次性反映到目录树上，只改动涉及的节点"""
+        changes, self.pending_changes = self.pending_changes, []
+        touched_dirs = set()
+        for event, inode_id, parent_id, name in changes:
+            item = str(inode_id)
+            touched_dirs.add(parent_id)
+            if event == 'create':
+                if parent_id in self.tree_remaining:
+                    more = f"{parent_id}.more"
+                    index = self.dir_tree.index(more) if self.dir_tree.exists(more) else tk.END
+                    self._insert_node(parent_id, name, inode_id, index)
+            elif event == 'delete':
+                if self.dir_tree.exists(item):
+                    self.dir_tree.delete(item)
+                self.tree_remaining.pop(inode_id, None)
+                remaining = self.tree_remaining.get(parent_id)
+                if remaining and (name, inode_id) in remaining:
+                    remaining.remove((name, inode_id))
+            elif event == 'write' and self.dir_tree.exists(item):
+                if self.fs.inodes[inode_id].type == 'file':
+                    self.dir_tree.set(item, "size", self.fs.inodes[inode_id].size)
+        for dir_id in touched_dirs:
+            item = str(dir_id)
+            inode = self.fs.inodes[dir_id]
+            if not self.dir_tree.exists(item) or inode.type != 'dir':
+                continue
+            self.dir_tree.set(item, "size", f"{inode.size} 项")
+            stub = f"{item}.stub"
+            if dir_id not in self.tree_remaining:
+                # 未展开的目录只需维护占位节点，决定是否显示展开箭头
+                if inode.size and not self.dir_tree.exists(stub):
+                    self.dir_tree.insert(item, tk.END, stub, text="…")
+                elif not inode.size and self.dir_tree.exists(stub):
+                    self.dir_tree.delete(stub)
+            more = f"{item}.more"
+            if self.dir_tree.exists(more):
+                self.dir_tree.item(more, text=f"… 还有 {len(self.tree_remaining[dir_id])} 项，点击加载")
+                if not self.tree_remaining[dir_id]:
+                    self.dir_tree.delete(more)
 
     def mkdir(self):
         """创建目录"""
@@ -219,7 +1311,6 @@ class FileSystemGUI:
         try:
             self.fs.create(name, 'dir')
             self.log(f"成功创建目录：{name}")
-            self.refresh_tree()
             self.name_var.set("")
         except Exception as e:
             self.log(f"创建目录失败：{e}")
@@ -234,7 +1325,6 @@ class FileSystemGUI:
         try:
             self.fs.create(name, 'file')
             self.log(f"成功创建文件：{name}")
-            self.refresh_tree()
             self.name_var.set("")
         except Exception as e:
             self.log(f"创建文件失败：{e}")
@@ -249,7 +1339,6 @@ class FileSystemGUI:
         try:
             self.fs.delete(name)
             self.log(f"成功删除：{name}")
-            self.refresh_tree()
             self.name_var.set("")
         except Exception as e:
             self.log(f"删除失败：{e}")
@@ -263,14 +1352,8 @@ class FileSystemGUI:
             messagebox.showwarning("警告", "请输入文件名")
             return
         try:
-            # 查找文件i节点
-            target_inode_id = None
-            for n, iid in self.fs.ls():
-                if n == name and self.fs.inodes[iid].type == 'file':
-                    target_inode_id = iid
-                    break
-            if target_inode_id is None:
-                raise Exception("文件不存在")
+            # 按路径查找文件i节点
+            target_inode_id = _file_id(self.fs, name)
             self.fs.write_file(target_inode_id, content)
             self.log(f"成功写入文件：{name}")
             self.name_var.set("")
@@ -286,13 +1369,7 @@ class FileSystemGUI:
             messagebox.showwarning("警告", "请输入文件名")
             return
         try:
-            target_inode_id = None
-            for n, iid in self.fs.ls():
-                if n == name and self.fs.inodes[iid].type == 'file':
-                    target_inode_id = iid
-                    break
-            if target_inode_id is None:
-                raise Exception("文件不存在")
+            target_inode_id = _file_id(self.fs, name)
             content = self.fs.read_file(target_inode_id)
             self.log(f"读取文件 {name} 内容：{content}")
             self.content_var.set(content)
@@ -301,26 +1378,25 @@ class FileSystemGUI:
             messagebox.showerror("错误", str(e))
 
     def run_command(self, event):
-        """执行命令行命令"""
-        cmd = self.cmd_var.get().strip().split()
-        if not cmd:
+        """执行命令行命令；可用分号隔开一次输入多条，目录树在全部执行完后统一更新"""
+        line = self.cmd_var.get().strip()
+        if not line:
             return
-        try:
-            if cmd[0] == "mkdir" and len(cmd) == 2:
-                self.fs.create(cmd[1], 'dir')
-                self.log(f"命令执行成功：mkdir {cmd[1]}")
-            elif cmd[0] == "touch" and len(cmd) == 2:
-                self.fs.create(cmd[1], 'file')
-                self.log(f"命令执行成功：touch {cmd[1]}")
-            elif cmd[0] == "rm" and len(cmd) == 2:
-                self.fs.delete(cmd[1])
-                self.log(f"命令执行成功：rm {cmd[1]}")
-            else:
-                self.log("不支持的命令，支持：mkdir/rm/touch")
-            self.refresh_tree()
-            self.cmd_var.set("")
-        except Exception as e:
-            self.log(f"命令执行失败：{e}")
+        self.run_commands(line.split(";"))
+        self.cmd_var.set("")
+
+    def run_commands(self, lines):
+        """依次执行一批命令，某条失败时记录错误并继续执行后面的"""
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if self.trace is not None:
+                self.trace.write(line + "\n")
+            try:
+                self.log(execute_command(self.fs, line))
+            except Exception as e:
+                self.log(f"命令执行失败：{line}：{e}")
 
 if __name__ == "__main__":
     root = tk.Tk()
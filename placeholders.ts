@@ -0,0 +1,68 @@
+// Generated by generate_placeholders.py; do not edit by hand.
+// Placeholder shown while each image in images.ts loads.
+export interface ImagePlaceholder {
+  width: number;
+  height: number;
+  color: string;
+  lqip: string;
+}
+
+export const IMAGE_PLACEHOLDERS: Record<string, ImagePlaceholder> = {
+  "image/微信图片_20251230114642_1331_74.jpg": {"width": 1706, "height": 1279, "color": "#aea9a4", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAMEAf/EACMQAAIBAwMEAwAAAAAAAAAAAAECAwAEEQUSMRQhIkEyYXL/xAAVAQEBAAAAAAAAAAAAAAAAAAAAAf/EABURAQEAAAAAAAAAAAAAAAAAAAAh/9oADAMBAAIRAxEAPwBsN8sjGICRjGSD48U7rAnlhxj2UPagWECrcSqX3uCexxg1jabNMhxdbRwFIJwRz775qLEcmuW0bbS54z8TRVL6FbFiSFb9jJH1RQf/2Q=="},
+  "image/微信图片_20251230114650_1339_74.jpg": {"width": 1706, "height": 1279, "color": "#41475e", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAQFAv/EACQQAAIBBAECBwAAAAAAAAAAAAECAwAEESESBUETIjFRcZHR/8QAFQEBAQAAAAAAAAAAAAAAAAAAAAH/xAAaEQACAgMAAAAAAAAAAAAAAAAAAQIREhNR/9oADAMBAAIRAxEAPwB6KBnLKUQYJGS3tj9qfeXgtbh4fA5kAeZWBH3SguhJcvIzB1YEmPeAT3GqzNcxTRtFHCkbEjDqT8+lXCQbRcW2diccDjWmz2oqZH1MooURqQNZKgmimuXBaP/Z"},
+  "image/微信图片_20251230114637_1326_74.jpg": {"width": 1706, "height": 1279, "color": "#bdbbb8", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAgMAAAAAAAAAAAAAAAAAAAQBAwX/xAAjEAACAgEEAAcAAAAAAAAAAAABAgMEABESITEFExVCYZGS/8QAFgEBAQEAAAAAAAAAAAAAAAAAAQAC/8QAFhEBAQEAAAAAAAAAAAAAAAAAACEi/9oADAMBAAIRAxEAPwBzw/fdQyRqAu4jUsBrjNpJa0DSMpKqRwpGvPGY9RFvXLMchKxwkcL7h8/WXWqMUdN3gLbgeNx17PWBR6wh7jl/OGLSV45ysteXy43UEKV1I4wyjOn/2Q=="},
+  "image/微信图片_20251230114638_1327_74.jpg": {"width": 1706, "height": 1279, "color": "#bfb6ac", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAIFBAb/xAAiEAACAgICAgIDAAAAAAAAAAABAgMEABESIRNRFCQxcZH/xAAWAQEBAQAAAAAAAAAAAAAAAAABAAL/xAAYEQEAAwEAAAAAAAAAAAAAAAAAERIhAf/aAAwDAQACEQMRAD8AWYpPM1nwr4pW0nJRs6/WJXr/AGSvxewA22TrWY0sWaEbiNVJnlZNnsgr6/udI18zl2WN9BANEjDYVeSgutZmJ4oPfWGXY1q2AWSqp4niSUX8jDHGaP/Z"},
+  "image/微信图片_20251230114643_1332_74.jpg": {"width": 1706, "height": 1279, "color": "#b3ada4", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwABAQEBAAAAAAAAAAAAAAAABAABA//EACUQAAEEAgEBCQAAAAAAAAAAAAEAAgMRBRIEUQYTISIxYXGhsf/EABYBAQEBAAAAAAAAAAAAAAAAAAEAAv/EABQRAQAAAAAAAAAAAAAAAAAAAAD/2gAMAwEAAhEDEQA/AGM5oloNaSavykO/Fy5eUigA3bJt01pAx3E37RTRNdTIHF914n0T8wGQynkMf3kmpDo33R+OiyQDmXknWKh7lS2PHtnjbLFWjxYBcRX0VKL/2Q=="},
+  "image/微信图片_20251230114639_1328_74.jpg": {"width": 1706, "height": 1279, "color": "#b2b0aa", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGQAAAgMBAAAAAAAAAAAAAAAAAAUBAgQG/8QAJxAAAgEDAQYHAAAAAAAAAAAAAQIDAAQREgUTFCExQSJRcYGCkcH/xAAVAQEBAAAAAAAAAAAAAAAAAAAAAf/EABgRAQEAAwAAAAAAAAAAAAAAAAABERJR/9oADAMBAAIRAxEAPwC/FHZyYlWOeRjkBnKkj0qJL+W5iObRYF661kbI+6y7SgW+nEkVwgCAjmG9u1MVg4jQ/hYjGo+fLHQioFO9ftPKfkaK6GK3WNSGiA556D8opmJrev/Z"},
+  "image/微信图片_20251230114644_1333_74.jpg": {"width": 1706, "height": 1279, "color": "#d1cec9", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAgMAAAAAAAAAAAAAAAAAAAUBAwb/xAAjEAACAQMDBAMAAAAAAAAAAAABAgMABBEFEiETIjFBFLHR/8QAFQEBAQAAAAAAAAAAAAAAAAAAAgH/xAAYEQEAAwEAAAAAAAAAAAAAAAAAAQIREv/aAAwDAQACEQMRAD8AjSk3yzNbSxlnDK0bnBRTx+U3M0trCBGY3VAB38ZHj6xSm21TTvmmWSF0mc9rADzyMHFX6xdNbvbWtuwO/Lsz+APQoqF1XqZdwqk+hk0VnZopUkK527eMK3FFCaaXT//Z"},
+  "image/微信图片_20251230114846_1341_74.jpg": {"width": 1706, "height": 1280, "color": "#b6b7b2", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAIEAwX/xAAlEAACAQQABQUBAAAAAAAAAAABAgMABBESBRMhMUEiUWFxgdH/xAAVAQEBAAAAAAAAAAAAAAAAAAABAv/EABYRAQEBAAAAAAAAAAAAAAAAAAAhUf/aAAwDAQACEQMRAD8Ax4Zb3FhKZeUsmyYYBvOe1XXt4yy8qCFmcgHOpI+ulR2lxDcrKk3oBXY9MlR4wff8pZ5uG7BRcSxKDtuVyc+MY/tBNxC0unuiVaQLgYAHb4oroRyRXaCaFwUbtlTRUquP/9k="},
+  "image/cd4be3b96b797dff7148b3c6d91474b2.jpg": {"width": 2611, "height": 1279, "color": "#c4c5c7", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAKABQDASIAAhEBAxEB/8QAFgABAQEAAAAAAAAAAAAAAAAAAwAE/8QAIhAAAgIBAwQDAAAAAAAAAAAAAQIAAxEFITEEE0FCUXGx/8QAFQEBAQAAAAAAAAAAAAAAAAAAAAL/xAAWEQEBAQAAAAAAAAAAAAAAAAAAESH/2gAMAwEAAhEDEQA/ACGr3oRULa2IwuceYzapejujPQGUA4AJ5/ZEDPA5me0Dvvt7GDBP1Tht70Y/OZRGA2+pSqP/2Q=="},
+  "image/19cdeb7ca6bec9410b6466d53cbc1a46.jpg": {"width": 1706, "height": 1279, "color": "#bbb7b0", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAMFAgT/xAAiEAACAgEEAgMBAAAAAAAAAAABAgMRAAQSITETUSIjYUH/xAAVAQEBAAAAAAAAAAAAAAAAAAABAP/EABURAQEAAAAAAAAAAAAAAAAAAAAR/9oADAMBAAIRAxEAPwClp1XUQ+SNXKEkXX9xfl05qpEazQF9n1mpZZtPDJJZWIHcgVuWv3xxkiIxaho6Q6YU3Rsnd0b/ADnAuz6LJDu1m7BOGL0syrCEkc7k+JO3v9wwqf/Z"},
+  "image/5cf20d9928ae71fe8c4277eef14e6114.jpg": {"width": 1706, "height": 1279, "color": "#cbccc4", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAUGAwT/xAAlEAACAgIBAwMFAAAAAAAAAAABAgMEABESBSExE0GhIlFxgZH/xAAVAQEBAAAAAAAAAAAAAAAAAAABAv/EABQRAQAAAAAAAAAAAAAAAAAAAAD/2gAMAwEAAhEDEQA/AHC2Itc2kUAoG/WYVZVhNh7EqIqvpWBHjt2+cT16kMg5WHkc6MYXfYEbH8984E6nY6ctinPp3EgG/PH76+PxkqVEt2vz0tgnXn6sMmHtxOF9OuXUDsZJCSffDEP/2Q=="},
+  "image/39dfa5326493d33ca40564f0e685bc9e.jpg": {"width": 1706, "height": 1279, "color": "#a7a4a1", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAMEBf/EACQQAAIBAwMDBQAAAAAAAAAAAAECAwAEEQUSIRMxURUiQWGR/8QAFQEBAQAAAAAAAAAAAAAAAAAAAQD/xAAUEQEAAAAAAAAAAAAAAAAAAAAA/9oADAMBAAIRAxEAPwBkxiQsGkTKkA+QazdX3LcqsO9gwJIBOO3FLGpxRT72g6wkUM2Tggg8EfdV+rWCbpo4ZxcucMGIIx3PNBX2VzbrZQCSRUbprlfHFFSW19pkkQYxc/PsPf8AaKi//9k="},
+  "image/3f5280896f10a786152a94cafc842457.jpg": {"width": 1706, "height": 1279, "color": "#bfbab3", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGQAAAgMBAAAAAAAAAAAAAAAAAAUCAwQG/8QAIhAAAgEDBAIDAAAAAAAAAAAAAQIDABESBAUTMRQhQWFx/8QAFAEBAAAAAAAAAAAAAAAAAAAAAf/EABYRAQEBAAAAAAAAAAAAAAAAAAARMf/aAAwDAQACEQMRAD8Ath3KHUq8cRyZVNyzBVP5Udv3WBI5A+Ub5XK29/ArmtDNwK0yTmKSPoY3Bp7tUkutik85Vl42GTHtR2OvujCdpNDqi7xyI4DFb3tYiisSIvsxkYsbjLuiimP/2Q=="},
+  "image/8d46c2afd4510f4fa26248ad676f7ade.jpg": {"width": 1706, "height": 1279, "color": "#c7c8c4", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGQAAAgMBAAAAAAAAAAAAAAAAAAQBAgUG/8QAJBAAAgEDAwMFAAAAAAAAAAAAAQIDAAQRBRMxIVGhIiMygfD/xAAVAQEBAAAAAAAAAAAAAAAAAAAAAf/EABYRAQEBAAAAAAAAAAAAAAAAAAABEf/aAAwDAQACEQMRAD8A0r7U47WOKRFVgxIchvie3mnILlb22WZOiHuOtc3fMI5ot8boQErjhiDk81VdTtU9qOFhbkN6HJOWI8AVJVxOqSSLfSASHGaKQfUFjdlSONlzkZXj9z90UH//2Q=="},
+  "image/45678175ab8da2133d1c5c9698a83e3a.jpg": {"width": 1706, "height": 1279, "color": "#d9d6ce", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAQFAf/EACQQAAIBAwMEAwEAAAAAAAAAAAECAwAEEQUTIQYSQVEiMnGB/8QAFQEBAQAAAAAAAAAAAAAAAAAAAQL/xAAYEQEBAAMAAAAAAAAAAAAAAAAAEQEhQf/aAAwDAQACEQMRAD8Aam1Fr7SLsyPEMyKUVT8gM+aUg1aSx3IJEjWUjMas2MH0fXvmktJntYpNiZSXl7SzMPqfGMftVp+nIbgFyVjkLd3cuTnnzU3auMj6it9tRdB94D5bQyv85oqdd9PvHcMIpVVDyqgZwP0mimYD/9k="},
+  "image/571765992f8cb3f592942af792ff2f0b.jpg": {"width": 775, "height": 528, "color": "#907239", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAOABQDASIAAhEBAxEB/8QAGAAAAgMAAAAAAAAAAAAAAAAAAAUCAwb/xAAjEAACAQQBAwUAAAAAAAAAAAABAwIABBESIRNRcRQiMUGB/8QAFgEBAQEAAAAAAAAAAAAAAAAAAgME/8QAGBEAAwEBAAAAAAAAAAAAAAAAAAESAhP/2gAMAwEAAhEDEQA/AM9FjnAxXCXgVbKycFbr6vU+NTA8nsKbMtfTsgxa1LEjg6jn8zUY281zlqw4JMgCc4PfzWa8lZYsTC51INvPIPNFNEW1yInDFcyJPt+6KfTIYZ//2Q=="},
+  "image/dbb92b17b9239fcdc5cf9d11d35a3da4.jpg": {"width": 1080, "height": 1350, "color": "#132c64", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAUABADASIAAhEBAxEB/8QAFwABAQEBAAAAAAAAAAAAAAAAAAMCBf/EACMQAAICAQMEAwEAAAAAAAAAAAECAxEABAUhEhMxQRRRcYH/xAAWAQEBAQAAAAAAAAAAAAAAAAADAAH/xAAbEQACAQUAAAAAAAAAAAAAAAAAARESEyExQf/aAAwDAQACEQMRAD8Apu0CCB44Q56HDH2OOKGW2r48kZTUIpkYFggblgxvx93nBi13bnlkklZiyEAV1Dq9fzD63uyxESEFEpjVWx81lbxPDKlEmtTBECoCAUfWR2+NHeQOoYVfP6cYxnpBo//Z"},
+  "image/微信图片_20251230114634_1322_74.jpg": {"width": 1440, "height": 1080, "color": "#c1b4a6", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAgMAAAAAAAAAAAAAAAAAAAUBAgP/xAAkEAACAQMDAwUAAAAAAAAAAAABAgMABBESIUEFIjFhgZHB8P/EABUBAQEAAAAAAAAAAAAAAAAAAAEC/8QAFxEBAQEBAAAAAAAAAAAAAAAAAAExIf/aAAwDAQACEQMRAD8A3viIXDK5JBOe7yOPaph6m4hbMaZjUsx1/uaVdMnS7jhNwgkaNTHhgDqx4zn0NNIre3VhpGyjIOkdp++Pioyr2Ktew3AWTZSV3BFFKeptPbXrgOpV+9duDRT0P//Z"},
+  "image/微信图片_20251230114650_1340_74.jpg": {"width": 1706, "height": 1279, "color": "#9f3227", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAQGAgX/xAAjEAACAQMDBAMAAAAAAAAAAAABAgMABBESMUEFEyFRBhUy/8QAFgEBAQEAAAAAAAAAAAAAAAAAAwAC/8QAGREAAgMBAAAAAAAAAAAAAAAAAAECAxES/9oADAMBAAIRAxEAPwBRlujctbBH735KruKrOl2z2lmkcrAyZLH0M8VNfeTW9/NbjONTDWTqI8Z54B4piy+USTvhocooBYjHgZ3xWEsGnY5rDuXdj35i+dx6FFZh6jFJErupRjup84oq5TCP/9k="},
+  "image/a684b8c89c9f3793548bd52d8e2a2106.jpg": {"width": 1706, "height": 1279, "color": "#686650", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFgABAQEAAAAAAAAAAAAAAAAABAAF/8QAIxAAAgEDBAEFAAAAAAAAAAAAAQIDABESBAUTIkEhMUJRcf/EABYBAQEBAAAAAAAAAAAAAAAAAAEAA//EABYRAQEBAAAAAAAAAAAAAAAAAAAREv/aAAwDAQACEQMRAD8Acu26K0YMKHMnz9UGfbo+RuJYgcioDXv6VrqLwqwJ60eKCR2c59vjb9rM1hNou7hrKQbEWJ8VU+VUE8uQBOXvVVkV/9k="},
+  "image/f40639d330b77844386c36ae52325276.jpg": {"width": 1706, "height": 1279, "color": "#7a6458", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAQFAv/EACEQAAIBBAICAwAAAAAAAAAAAAECAwAEESEFEjGBIlGx/8QAFQEBAQAAAAAAAAAAAAAAAAAAAAH/xAAWEQEBAQAAAAAAAAAAAAAAAAABABH/2gAMAwEAAhEDEQA/AGjyNvFJ2EUuWOCpXBHistyJaOVlU4QbwckZOvVQLe7mimktgeza7O2yGyNj1qmpLxokZmBCwHHVT9Nv9qKwCr2d0LiHuUfydtjdFSYeSniQr8WXJKEjZU7GaKbEL//Z"},
+  "image/652c476ee7f2940226c35b5806f34779.jpg": {"width": 1920, "height": 1280, "color": "#a1b09a", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAANABQDASIAAhEBAxEB/8QAFgABAQEAAAAAAAAAAAAAAAAABAAF/8QAJBAAAgEDAwMFAAAAAAAAAAAAAQIDAAQRBSFBEhNhMTNRkfH/xAAXAQADAQAAAAAAAAAAAAAAAAAAAQID/8QAGBEBAQEBAQAAAAAAAAAAAAAAAQARAgP/2gAMAwEAAhEDEQA/AAsLoMkjzBXIyQ53+qfHdSMO2qpIV3JQnbnmh67K9uF6D7qFD4Gc1lS3rtJMUVUEyhWA4A/KQpTzia2wJrlRhYQRkkZqpenMZ7KKWXDMwz6bAfA8VVm+yORnN//Z"},
+  "image/ecb09af43df609482ba0ceb589da1759.jpg": {"width": 1706, "height": 1279, "color": "#d7d5d6", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAgMAAAAAAAAAAAAAAAAAAAUDBAb/xAAhEAACAgICAQUAAAAAAAAAAAABAgADETEEEiEFEzJB4f/EABYBAQEBAAAAAAAAAAAAAAAAAAEAAv/EABYRAQEBAAAAAAAAAAAAAAAAAAARAf/aAAwDAQACEQMRAD8AqLTQbUA2WEG4lT2H5KSxADDcde2lanidVcKy1ksvnQP7J7uFXeLO2AbNsB5BxjMzFMIV9MqYZBhNGnErVFUaUAfUIwR//9k="},
+  "image/e044fe541beb4d7be854b3e2ba3707df.jpg": {"width": 1706, "height": 1279, "color": "#b5ada0", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAQFBv/EACMQAAIBAwQCAwEAAAAAAAAAAAECBAADEQUSITETUSIyYaH/xAAWAQEBAQAAAAAAAAAAAAAAAAABAgP/xAAZEQACAwEAAAAAAAAAAAAAAAAAAQIRMUH/2gAMAwEAAhEDEQA/AG9RklLK3Y6uj4BBAxnvr2Kbsy18YaQ3jG1cs3AJI5/tZyDqigxrcl8Wlwg2jlQOjVLXZ62bixgzF2+zAY2L+ezRglVpVoHCqrD3nuioEiU0RlS4BkqG+PWKKzblwqkf/9k="},
+  "image/4341cbdcfe9dbe15517bbfe84abc64cc.jpg": {"width": 1706, "height": 1280, "color": "#787164", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwABAQEBAAAAAAAAAAAAAAAAAgADBP/EACMQAAIBBAIBBQEAAAAAAAAAAAECAwAEESESMRMiI0FRoZH/xAAVAQEBAAAAAAAAAAAAAAAAAAAAAv/EABkRAAIDAQAAAAAAAAAAAAAAAAABAxESQf/aAAwDAQACEQMRAD8ARtbONDzZhlCcEaP1isYLCDwxeV2WaQZ4cchtdd0jaXQu4HDK6w4G8dA/tELdyXpe4dQsLe2B1sHP4ajCB1rYW8ShRz3vZxVRaxa7IlaQgEekA/H8qqHG+Cz/2Q=="},
+  "image/5b4ba2faac298e09fd03aa00970bb83d.jpg": {"width": 1706, "height": 1279, "color": "#b9b5b1", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwABAQEBAAAAAAAAAAAAAAAABAADBf/EAB8QAAICAwACAwAAAAAAAAAAAAECABEDEiEiMQUTYf/EABUBAQEAAAAAAAAAAAAAAAAAAAEA/8QAFBEBAAAAAAAAAAAAAAAAAAAAAP/aAAwDAQACEQMRAD8Adja7C1w1Ndn9ahj+GHwqbKqPE2Sb7cTq60dhQ6YEdmOxBXo91KcnJ8ywyuv1t4sV5Xeygn//2Q=="},
+  "image/62cca717038b2271e2c7083f0cb9bde4.jpg": {"width": 1706, "height": 1279, "color": "#ccc9c7", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAQFAQP/xAAlEAACAQMCBQUAAAAAAAAAAAABAgMABBESMRMhQVFhBRQiMoH/xAAVAQEBAAAAAAAAAAAAAAAAAAABA//EABcRAAMBAAAAAAAAAAAAAAAAAAABEQL/2gAMAwEAAhEDEQA/AKHuRHcWscpPEmGftgDxjrWw3yzyx8GQshYoynBPcHltSM88ijjKEZXI0Btx0rk7LZuhPxt1caimQwz28bUUYPXvqDQTlFReQ55oqNeTiS4ZlLFTtq3/AGipPTpSI//Z"},
+  "image/film_20.jpg": {"width": 1279, "height": 1706, "color": "#bbaba0", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAUAA8DASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAQFA//EACcQAAEEAQIEBwEAAAAAAAAAAAIBAwQRAAUhEjFxgRQiIzJBYdHh/8QAFQEBAQAAAAAAAAAAAAAAAAAAAgH/xAAWEQEBAQAAAAAAAAAAAAAAAAAAESH/2gAMAwEAAhEDEQA/AG5D/BGJxkhqvK5zS/jrvm+mS25rFtkhON0LiVVF+ZK0mPJhRXmJSJ7hIN7ol/qdscjg3EMiiiSumXqIuydcN0piVps16WwLTpWIEiIqc15ruvbGvEuK/HHak4l2T6wwwq//2Q=="},
+  "image/film_21.jpg": {"width": 1279, "height": 1706, "color": "#d5d0cc", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAUAA8DASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAMFBAb/xAAlEAACAQQBAgcBAAAAAAAAAAABAgMABAURIVFxEhMUIkFCofD/xAAVAQEBAAAAAAAAAAAAAAAAAAABAP/EABQRAQAAAAAAAAAAAAAAAAAAAAD/2gAMAwEAAhEDEQA/AOgd1jjZ3OlUbJpVvcw3cXmwSB03rY61PzeRS1eOBQ7zD3nXAA5HP98VMxmagtZJUngMaufFtW2d9u1Bbsli4Waa5Z5DIxB1sa6dKTa4q29agYM4K/bXH5RRUH//2Q=="},
+  "image/film_22.jpg": {"width": 1279, "height": 1706, "color": "#b6aea9", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAUAA8DASIAAhEBAxEB/8QAFgABAQEAAAAAAAAAAAAAAAAABAAF/8QAJBAAAgICAgEDBQAAAAAAAAAAAQIDBAAREiEFIjFBUWFxkcH/xAAVAQEBAAAAAAAAAAAAAAAAAAABAv/EABcRAQEBAQAAAAAAAAAAAAAAAAARIQH/2gAMAwEAAhEDEQA/AF2J+FZpIWX2PF/dd/3vEeNtx3YSYmDPHoSDWtHMnxFexSrTV7QAJZWT1bAJ+D+sZXSOnI5rAtMx3IB0D98m6qYxfG3prKJXlIKKygfXXfzjhO3OJRoDmT1+Dllh0v/Z"},
+  "image/film_23.jpg": {"width": 1706, "height": 1279, "color": "#6a7369", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAUGBP/EACIQAAIBBAICAwEAAAAAAAAAAAECEQADBCEFEhNxMVGBkf/EABUBAQEAAAAAAAAAAAAAAAAAAAEC/8QAGBEBAAMBAAAAAAAAAAAAAAAAAAEREiH/2gAMAwEAAhEDEQA/AKwzGjUpyXI+e8LciLZZZB38xv8AlMgeTafNcsIhB0sk1nyMHGFgTaYt16khtncz9TQa4StllTCuw9RRTW1i2cVetyyyFj2AYhiR+eqKE5h//9k="},
+  "image/film_24.jpg": {"width": 1706, "height": 1279, "color": "#744b2d", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwABAQEBAAAAAAAAAAAAAAAAAAUBA//EACEQAAICAgEEAwAAAAAAAAAAAAECAxEABCESEzFRBSJB/8QAFQEBAQAAAAAAAAAAAAAAAAAAAwL/xAAWEQEBAQAAAAAAAAAAAAAAAAACAAH/2gAMAwEAAhEDEQA/AJ79PHBq6ussyTQy7KlZFIWZRzxXn3jc+Mj1tBliiMkjfZet/B95z1oO/qSJtOJGklIplHABqrHvDJ05IlirAArGYpboXshAlAANfH5jLjv/2Q=="},
+  "image/film_25.jpg": {"width": 1706, "height": 1279, "color": "#c5c2bc", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAQFAgP/xAAmEAACAQMBBwUAAAAAAAAAAAABAgMABBEFEhMhMVFxwRQyQYGh/8QAFQEBAQAAAAAAAAAAAAAAAAAAAQD/xAAYEQEBAAMAAAAAAAAAAAAAAAAAEQESMf/aAAwDAQACEQMRAD8Abki0+ABXgCsY9tQWxk9OfOl5o4ZYhuUkVImDMyH2jmfNU77TPWOGaVhj4wMDt+ViXTkNpJBnYD42igxkAYwetB2vUC60V5Jd5ZShonAbL8Tk9qK5JLcWK7qJlZDxBx9eKKJlV//Z"},
+  "image/film_26.jpg": {"width": 1706, "height": 1279, "color": "#aca9a0", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFgABAQEAAAAAAAAAAAAAAAAABAAD/8QAIxAAAgEDAwQDAAAAAAAAAAAAAQMCAAQRBRMhEhQxQTJh0f/EABYBAQEBAAAAAAAAAAAAAAAAAAEAAv/EABcRAQEBAQAAAAAAAAAAAAAAAAAhARH/2gAMAwEAAhEDEQA/ANdRe+1uXLVc5hCXSAzk/EHzR1Xt1MZkE8eiSKNqU2XV05yiStjCYnOOMDFat014kBuxEhCMSB7wBRBTld01UGCCwJjIxL9qo8dVsLBS7a9VuOXHBltiX35NVXMaf//Z"},
+  "image/film_27.jpg": {"width": 1706, "height": 1279, "color": "#c6c6be", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAMGBf/EACcQAAEDAwMBCQAAAAAAAAAAAAEAAgMEEiEFEUETFCIxMjNDUZHB/8QAFgEBAQEAAAAAAAAAAAAAAAAAAQAC/8QAFhEBAQEAAAAAAAAAAAAAAAAAABEh/9oADAMBAAIRAxEAPwB50xs3tujtGzQHYGeEk6Fc61xHSA7o3O93JWoJZpALA1gI8Tk/SBTvf60peNvKMBZp1L1dAYKh0YeHAc2u/AhU/ZYhhrAB8IVS/9k="},
+  "image/film_28.jpg": {"width": 1706, "height": 1279, "color": "#dedbd7", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAQFAQP/xAAeEAACAwEAAgMAAAAAAAAAAAABAgADEQQxYQYhcf/EABYBAQEBAAAAAAAAAAAAAAAAAAEAAv/EABYRAQEBAAAAAAAAAAAAAAAAAAARAf/aAAwDAQACEQMRAD8AYo77U6r+e6m57EfcQbiZ9Eep2YW9TAOHpVWBBHl/Uz4/Xetdh6CGZcRTunP2WYGkW6LkxaucMoHktkJQ2EmJj//Z"},
+  "image/film_29.jpg": {"width": 1706, "height": 1279, "color": "#cfd1cd", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAgMAAAAAAAAAAAAAAAAAAAUCAwT/xAAjEAACAQMDBAMAAAAAAAAAAAABAgMABBEFEiITITFBcbHB/8QAFQEBAQAAAAAAAAAAAAAAAAAAAQL/xAAWEQEBAQAAAAAAAAAAAAAAAAAAEUH/2gAMAwEAAhEDEQA/AGcVwqztHI67zyCq2Rj5qcNyr3kvM9MKAAR4PfP5SWext9OYgIeakISxO4YGTj158VuuYrldJRInCbE5biSxA9ZFTVTVx1zTwxUuVZTgh+xBopLNfrK4ZLWFVwMBkBP1RTRH/9k="},
+  "image/film_30.jpg": {"width": 1706, "height": 1279, "color": "#aeaa99", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFgABAQEAAAAAAAAAAAAAAAAABAAF/8QAJRAAAgEDAwMFAQAAAAAAAAAAAQIDAAQRBSExEhNBIjJhkbHh/8QAFgEBAQEAAAAAAAAAAAAAAAAAAAEC/8QAFxEBAAMAAAAAAAAAAAAAAAAAAAERMf/aAAwDAQACEQMRAD8AVplzcXGmNcXSozqSMqcE8Vlao0d9qcYXPSIwCF3I3P8AKzbPVXtcgY7bbsjIG+jzT42SUiaAPA3Qwl7RwxHnc8+KziwBd2jxTlTGV+Cc/lVLTT725RZIZFkjPtLH1c+cjmqlj//Z"},
+  "image/film_01.jpg": {"width": 1706, "height": 1279, "color": "#b0aca7", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGQAAAQUAAAAAAAAAAAAAAAAAAAECAwQF/8QAJBAAAQMCBQUBAAAAAAAAAAAAAQACEQNBBBIhMVEFFCJCYXH/xAAUAQEAAAAAAAAAAAAAAAAAAAAB/8QAFBEBAAAAAAAAAAAAAAAAAAAAAP/aAAwDAQACEQMRAD8AvMcLAn8Slzfs8RsosODlyD1uboxlftMM+rUbLBGgvqgmODSZCFlu6p5HNIPEbIQX/9k="},
+  "image/film_02.jpg": {"width": 1706, "height": 1279, "color": "#c3c2bf", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFgABAQEAAAAAAAAAAAAAAAAABQAD/8QAHxABAAEEAwADAAAAAAAAAAAAAQIAAwQREiFBFTFh/8QAFgEBAQEAAAAAAAAAAAAAAAAAAQAC/8QAFxEBAQEBAAAAAAAAAAAAAAAAAAERIf/aAAwDAQACEQMRAD8AYgrAWsL9zhOGk96rKF+Tc0G46JLLsfzXlDSyzEzrkL5y3JVFdjWbsM6eF12VUJ8jZl95CHg210VVHH//2Q=="},
+  "image/film_03.jpg": {"width": 1706, "height": 1279, "color": "#453733", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAgMAAAAAAAAAAAAAAAAAAAUDBAb/xAAlEAACAQMCBQUAAAAAAAAAAAABAgMABBESIQUTIjFBBoGhsfH/xAAWAQEBAQAAAAAAAAAAAAAAAAACAAH/xAAWEQEBAQAAAAAAAAAAAAAAAAAAARH/2gAMAwEAAhEDEQA/AJfUjA3EZ1hdELHt3ORtSmCKe4jk6G5isFVT5PkfVM7myu5p43cCSNZNROQCDjBq5ZwSRzLC9u2BuNTA+5+KNKXGYZ2RijqVZTggjBFFNuLcImubzmKMMVAfqG5/MUVNf//Z"},
+  "image/film_04.jpg": {"width": 1706, "height": 1279, "color": "#ae9a88", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwABAQEBAAAAAAAAAAAAAAAAAAQDBv/EACIQAAIBAwQDAQEAAAAAAAAAAAECAwAEEQUSITEiQaETYf/EABQBAQAAAAAAAAAAAAAAAAAAAAH/xAAXEQEAAwAAAAAAAAAAAAAAAAAAASFh/9oADAMBAAIRAxEAPwCNoxrE0i+ays25COsgYJPz5VrX97pttB+q+QjKSqzewThh/a3tZG0qzQSICHwc8Hv1xTVY1ulEMaqZigkfPW05+5FBnXPSazeFyXdwTzwcUq42gnwyiMYGMbOjSg0//9k="},
+  "image/film_05.jpg": {"width": 1279, "height": 1706, "color": "#c8c7c9", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAUAA8DASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAMEBf/EACIQAAIBAwMFAQAAAAAAAAAAAAECAwAEERITMQUVIUFRcf/EABUBAQEAAAAAAAAAAAAAAAAAAAEC/8QAGBEBAAMBAAAAAAAAAAAAAAAAAAECMRH/2gAMAwEAAhEDEQA/AJGun7dBbQNpuFOnP3BrUsrtVjEV1Ed+NBusBkas8ftTjpKWrPcTkGNWLADJKD1T+q2y3Ai2XxK/ldC4LD7ijFcauwigkFvPonIpVmFnYTOq7keQrAcZ5ooptsJh/9k="},
+  "image/film_06.jpg": {"width": 1706, "height": 1279, "color": "#c6b2a6", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGQAAAgMBAAAAAAAAAAAAAAAAAAQBAgMF/8QAJhAAAgEDAgQHAAAAAAAAAAAAAQIEAAMREiEFEzEyFSNBUWGx8P/EABUBAQEAAAAAAAAAAAAAAAAAAAEC/8QAFxEAAwEAAAAAAAAAAAAAAAAAAAERIf/aAAwDAQACEQMRAD8AhYsF4toWbt0oo22G5+RVLUYtxGOWIPlOuoZx7D7pbhEtI8jmXWwxt6VYZ7j1zXReQ12fGsobb6g40kEAA+mf3Sp2wrGqNWZkkqVePbBQ6dmZRgdNqK18NlZJtlNJ37jRRAqP/9k="},
+  "image/film_07.jpg": {"width": 1706, "height": 1279, "color": "#b7a59d", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAQGA//EACQQAAMAAgEDAwUAAAAAAAAAAAECAwAEBRESkSExQSIyM2Fx/8QAFgEBAQEAAAAAAAAAAAAAAAAAAgAB/8QAGhEAAgIDAAAAAAAAAAAAAAAAAAERUQISIf/aAAwDAQACEQMRAD8ATjoU2GW9HkiUUhFLfaB8Zs+u2jrMlkRh2/lTr8+3Xzhx8ljMR3p9lCSykEMD6YhyHLikaQ1wREkdhPuP35wy5G1jqrKzV1rR1YyNJ/QgXwOmGR0uXuUBZiT/AHDM6UKz/9k="},
+  "image/film_08.jpg": {"width": 1706, "height": 1279, "color": "#7d695a", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFgABAQEAAAAAAAAAAAAAAAAABQAE/8QAIxAAAgEDAwQDAAAAAAAAAAAAAQIDAAQREiFBBRNRcRUiYf/EABUBAQEAAAAAAAAAAAAAAAAAAAIB/8QAFhEBAQEAAAAAAAAAAAAAAAAAABEh/9oADAMBAAIRAxEAPwDdfLPDEsiXOrB3Drnb8oC86dKb954AZBIzvjGABvzTF7L22jW5zqAxoXk++KNPUTqeBVUKgOkDYDHmjdLJo/4qcgFTgeGByPeBVSkN+7RjtsVVfqASeKqtF//Z"},
+  "image/film_09.jpg": {"width": 1706, "height": 1279, "color": "#e2e2e3", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGQAAAgMBAAAAAAAAAAAAAAAAAAQBAgUG/8QAJhAAAQMEAAUFAQAAAAAAAAAAAQIDBAAREiEFEzFBURQiYZGxwf/EABYBAQEBAAAAAAAAAAAAAAAAAAIAAf/EABgRAQEAAwAAAAAAAAAAAAAAAAEAESFh/9oADAMBAAIRAxEAPwB7iPFiy7yIrrZdQbrFugt0/KmNI9XDCnc23gCVFYsNeR2pSKWTNQXMSp4WbAT3ts3q8pIzWy5krNBA3bz90HcjlqRprIjoVzUe7ejfvb+UVz0SFNjtFtstFORIKkg3+d0VohWG/9k="},
+  "image/film_10.jpg": {"width": 1706, "height": 1279, "color": "#dfe0d9", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAQFBv/EACMQAAEDBAIBBQAAAAAAAAAAAAECAwQAERIhEzGBBRRBUWH/xAAVAQEBAAAAAAAAAAAAAAAAAAACAf/EABgRAAMBAQAAAAAAAAAAAAAAAAABEhEh/9oADAMBAAIRAxEAPwBtLiW83UFSDgpOOFgVb3+VE9OZKlB2S0nMKASSbAgd6FaVtiLJhhTeQbT9kki3xul5Fo7fIcgnQui279d0esSwoR5auIXUPNFIyFSMk+3khtvEaLd/NFGkWWf/2Q=="},
+  "image/film_11.jpg": {"width": 1279, "height": 1706, "color": "#73695e", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAUAA8DASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAQFAQL/xAAjEAACAgIBAgcAAAAAAAAAAAABAgMRAAQhBRITMUFRYYGx/8QAFQEBAQAAAAAAAAAAAAAAAAAAAQL/xAAWEQEBAQAAAAAAAAAAAAAAAAAAAUH/2gAMAwEAAhEDEQA/ALqtorJHEYUDyX23H55sAglZlaCFWBJUCja++Qpupa8rs0bsV5CMFPAIo4rr7A0dzSlebsXwmBJJb4r8P1kqx1rW6QljZIazQxLZnbXQGMLZeuVv0wwwhr//2Q=="},
+  "image/film_12.jpg": {"width": 1706, "height": 1279, "color": "#f7f9f3", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAMGBf/EACIQAAICAgEEAwEAAAAAAAAAAAECAwQAESEFEiIxEzJBUf/EABUBAQEAAAAAAAAAAAAAAAAAAAEC/8QAFxEBAQEBAAAAAAAAAAAAAAAAAAEREv/aAAwDAQACEQMRAD8AobXU1rKjFQUJ8iG+ozLsdWpXun2IknDsWHDLrx2PQ/cXJbWaZpJVWNlXuVNb7eP6PeTUktaK9K7Q/NEGIABI2TzgTZEhkdmCpyd8HDGQ0Zr/AH2KqrFCzeKk+tYYbE81/9k="},
+  "image/film_13.jpg": {"width": 1279, "height": 1706, "color": "#a28a75", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAUAA8DASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAIEBQb/xAAlEAACAQMDAgcAAAAAAAAAAAABAgMABBEFEiExcRMyQVFhgcH/xAAUAQEAAAAAAAAAAAAAAAAAAAAC/8QAFREBAQAAAAAAAAAAAAAAAAAAAAH/2gAMAwEAAhEDEQA/AHutUkksfCjy00bYJkHJx+1NbX5sZladQ7KmCd2SCeoprDT3aMLcKY5IWwxByHGOB3qhxHa3bxXYjigcA7/MW9uB80DjdigjWFVA4HP2etc7rFqg0iG5yxlzjJPoSeO1FFIH/9k="},
+  "image/film_14.jpg": {"width": 1706, "height": 1279, "color": "#dcd8d3", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAMEBf/EACYQAAIBAwMBCQAAAAAAAAAAAAECAwAEERIhMQUGFSNBQlFhYnH/xAAVAQEBAAAAAAAAAAAAAAAAAAACAf/EABYRAQEBAAAAAAAAAAAAAAAAAAARAf/aAAwDAQACEQMRAD8AdcdZlmxDZ25J9LE53/KT3feqixhkKMQWVvI4xjI+KbD2adX8a5yv1BBq+2kihYws7K8fI51Dgb++1EsTDodqyqbi0cSaQCFlyNhjaitN7gLjXsSM8Zoqwa//2Q=="},
+  "image/film_15.jpg": {"width": 1706, "height": 1279, "color": "#d7d6ce", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAQFBv/EACMQAAIBAwMEAwAAAAAAAAAAAAECAwAEEQUSIRNBUZEUMWH/xAAUAQEAAAAAAAAAAAAAAAAAAAAC/8QAGBEAAwEBAAAAAAAAAAAAAAAAAAERIQL/2gAMAwEAAhEDEQA/AKMkyQakSEVi0hXGccd/VMXGp2MarslErM20LGcnj79UvaK5ut10VBVSNgO7JI78DxST6PbxXRuI3JQP1OiFwM58/meKHKmCbumgjVJo1kicOjDKsDwRRUmbWYNOf45QpgbtqqMDPNFMJ//Z"},
+  "image/film_16.jpg": {"width": 1279, "height": 1706, "color": "#98938e", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAUAA8DASIAAhEBAxEB/8QAGAAAAwEBAAAAAAAAAAAAAAAAAAMEAQX/xAAjEAACAgIBAwUBAAAAAAAAAAABAgMEABEhEhQxBRMVImFx/8QAFQEBAQAAAAAAAAAAAAAAAAAAAQD/xAAWEQEBAQAAAAAAAAAAAAAAAAAAAUH/2gAMAwEAAhEDEQA/ANhmuFpI3QyMvkgHY/uIN8mf2RCxbZHI1lPe/HW7Ms4L9xIAqo44GvJxd8WLtmMpCjIjFtE6J2NecDFKVorHpdDrQDhW+vHOs7FeJG6iyKfwjDDDU//Z"},
+  "image/film_17.jpg": {"width": 1279, "height": 1706, "color": "#794c27", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAUAA8DASIAAhEBAxEB/8QAFwAAAwEAAAAAAAAAAAAAAAAAAAMEBf/EACEQAAEDBAIDAQAAAAAAAAAAAAECAxEABBIhBTEGEyJB/8QAFQEBAQAAAAAAAAAAAAAAAAAAAgP/xAAYEQEBAAMAAAAAAAAAAAAAAAAAAREhQf/aAAwDAQACEQMRAD8AOQXesvNte/YaBWpIG1b3um8Oi7ccdNwtS4AjI9d1J5E8FKwBnFIhUzM7q/x9Wds77V4xgmZj8NT6pjRHL2dujjW7hLYDoUj6k7nut2y49izQS0CSvZKjNFFKDa//2Q=="},
+  "image/film_18.jpg": {"width": 1706, "height": 1279, "color": "#e2dbd5", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAFwABAQEBAAAAAAAAAAAAAAAAAAYEBf/EACQQAAIBBAEDBQEAAAAAAAAAAAECAwAEESEFEkFhEyIjMbHh/8QAFQEBAQAAAAAAAAAAAAAAAAAAAQL/xAAXEQEBAQEAAAAAAAAAAAAAAAAAEQEh/9oADAMBAAIRAxEAPwDsXnIC0ZQYy+QWbBx0rnGfP8pPPPHfogMYgIGSRtjne+2KkLzkHu7u4lklIDL0KBn2rka/a0R8nJNygkb5YmHphZBoA67eamarizzSoSDl7qzQwq7AKx0T9eKUzRX/2Q=="},
+  "image/film_19.jpg": {"width": 1706, "height": 1279, "color": "#ccc7bd", "lqip": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABQODxIPDRQSEBIXFRQYHjIhHhwcHj0sLiQySUBMS0dARkVQWnNiUFVtVkVGZIhlbXd7gYKBTmCNl4x9lnN+gXz/2wBDARUXFx4aHjshITt8U0ZTfHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHx8fHz/wAARCAAPABQDASIAAhEBAxEB/8QAGAAAAgMAAAAAAAAAAAAAAAAAAAMBBAX/xAAiEAACAQQBBAMAAAAAAAAAAAABAgMABBESMQUhYYETQbH/xAAVAQEBAAAAAAAAAAAAAAAAAAACAf/EABURAQEAAAAAAAAAAAAAAAAAAAAh/9oADAMBAAIRAxEAPwC5DcRjqLIASxiDL2wGHg/fNON8I7UTvBlsEsqHgg45qWs2jO8CGRlURZLYwvj1TTCgtVDoD34/KBQpOu2PxoZJVRyMledfGRRWZNHZi4lBjkVtztprgn2O1FJH/9k="},
+};